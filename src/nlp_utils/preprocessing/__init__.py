@@ -21,6 +21,7 @@ from nlp_utils.preprocessing.text_preprocessing import remove_twitter_username
 from nlp_utils.preprocessing.text_preprocessing import remove_username
 from nlp_utils.preprocessing.text_preprocessing import remove_hashtag
 from nlp_utils.preprocessing.text_preprocessing import remove_email_address
+from nlp_utils.preprocessing.text_preprocessing import remove_entities
 from nlp_utils.preprocessing.text_preprocessing import blank_checker
 from nlp_utils.preprocessing.text_preprocessing import remove_special_char
 from nlp_utils.preprocessing.text_preprocessing import remove_punctuation
@@ -29,12 +30,77 @@ from nlp_utils.preprocessing.text_preprocessing import abbreviation_converter
 from nlp_utils.preprocessing.text_preprocessing import convert_to_unicode
 from nlp_utils.preprocessing.text_preprocessing import expand_contractions
 from nlp_utils.preprocessing.text_preprocessing import spell_correction_v1
+from nlp_utils.preprocessing.text_preprocessing import spell_correction_v2
+from nlp_utils.preprocessing.text_preprocessing import spell_correction_cache_info
+from nlp_utils.preprocessing.text_preprocessing import clear_spell_correction_cache
 from nlp_utils.preprocessing.text_preprocessing import add_word_to_stopwords_set
 from nlp_utils.preprocessing.text_preprocessing import stopwords_nltk
+from nlp_utils.preprocessing.text_preprocessing import stopwords_cache_info
+from nlp_utils.preprocessing.text_preprocessing import clear_stopwords_cache
 from nlp_utils.preprocessing.text_preprocessing import convert_emoji_to_words
 from nlp_utils.preprocessing.text_preprocessing import convert_emoticon_to_words
 from nlp_utils.preprocessing.text_preprocessing import remove_regex_match
 from nlp_utils.preprocessing.text_preprocessing import substitue_regex_match
+from nlp_utils.preprocessing.text_preprocessing import user_regex_cache_info
+from nlp_utils.preprocessing.text_preprocessing import clear_user_regex_cache
 from nlp_utils.preprocessing.text_preprocessing import to_lemmatize
+from nlp_utils.preprocessing.text_preprocessing import lemma_cache_info
+from nlp_utils.preprocessing.text_preprocessing import clear_lemma_cache
 from nlp_utils.preprocessing.text_preprocessing import to_tokenize
+from nlp_utils.preprocessing.text_preprocessing import pipeline_selector_spacy
+from nlp_utils.preprocessing.text_preprocessing import pipe_spacy
+from nlp_utils.preprocessing.text_preprocessing import language_detection
+from nlp_utils.preprocessing.text_preprocessing import language_prob_detection
+from nlp_utils.preprocessing.text_preprocessing import script_language_detection
+from nlp_utils.preprocessing.text_preprocessing import language_detection_cache_info
+from nlp_utils.preprocessing.text_preprocessing import clear_language_detection_cache
+from nlp_utils.preprocessing.pipeline import Pipeline
+from nlp_utils.preprocessing.routing import LanguageRouter
+from nlp_utils.preprocessing.frequency import FrequencyTable
+from nlp_utils.preprocessing.token_corpus import Vocabulary
+from nlp_utils.preprocessing.token_corpus import TokenCorpus
+from nlp_utils.preprocessing.near_duplicates import minhash_signatures
+from nlp_utils.preprocessing.near_duplicates import lsh_clusters
+from nlp_utils.preprocessing.near_duplicates import near_duplicate_clusters
+from nlp_utils.preprocessing.result_cache import ResultCache
+from nlp_utils.preprocessing.result_cache import ResultCacheInfo
+from nlp_utils.preprocessing.parallel import parallel_apply
+from nlp_utils.preprocessing.streaming import read_text_chunks
+from nlp_utils.preprocessing.streaming import iter_preprocessed_chunks
+from nlp_utils.preprocessing.streaming import stream_preprocess
+from nlp_utils.preprocessing.batch_preprocessing import remove_xml_batch
+from nlp_utils.preprocessing.batch_preprocessing import to_lower_batch
+from nlp_utils.preprocessing.batch_preprocessing import remove_number_batch
+from nlp_utils.preprocessing.batch_preprocessing import to_strip_batch
+from nlp_utils.preprocessing.batch_preprocessing import remove_any_char_batch
+from nlp_utils.preprocessing.batch_preprocessing import remove_all_duplication_batch
+from nlp_utils.preprocessing.batch_preprocessing import remove_consecutive_duplication_batch
+from nlp_utils.preprocessing.batch_preprocessing import remove_many_spaces_batch
+from nlp_utils.preprocessing.batch_preprocessing import remove_emoji_batch
+from nlp_utils.preprocessing.batch_preprocessing import remove_url_batch
+from nlp_utils.preprocessing.batch_preprocessing import remove_twitter_username_batch
+from nlp_utils.preprocessing.batch_preprocessing import remove_username_batch
+from nlp_utils.preprocessing.batch_preprocessing import remove_hashtag_batch
+from nlp_utils.preprocessing.batch_preprocessing import remove_email_address_batch
+from nlp_utils.preprocessing.batch_preprocessing import remove_entities_batch
+from nlp_utils.preprocessing.batch_preprocessing import remove_special_char_batch
+from nlp_utils.preprocessing.batch_preprocessing import expand_contractions_batch
+from nlp_utils.preprocessing.batch_preprocessing import remove_stopwords_batch
+from nlp_utils.preprocessing.batch_preprocessing import remove_emoticon_batch
+from nlp_utils.preprocessing.batch_preprocessing import abbreviation_converter_batch
+from nlp_utils.preprocessing.batch_preprocessing import remove_punctuation_batch
+from nlp_utils.preprocessing.batch_preprocessing import to_lemmatize_batch
+from nlp_utils.preprocessing.batch_preprocessing import convert_emoticon_to_words_batch
+from nlp_utils.preprocessing.batch_preprocessing import convert_emoji_to_words_batch
+from nlp_utils.preprocessing.batch_preprocessing import spell_correction_v1_batch
+from nlp_utils.preprocessing.batch_preprocessing import spell_correction_v2_batch
+from nlp_utils.preprocessing.batch_preprocessing import language_detection_batch
+from nlp_utils.preprocessing.batch_preprocessing import language_prob_detection_batch
+from nlp_utils.preprocessing.batch_preprocessing import ngram_language_detection_batch
+from nlp_utils.preprocessing.batch_preprocessing import ngram_language_prob_detection_batch
+from nlp_utils.preprocessing.batch_preprocessing import script_routed_language_detection_batch
+from nlp_utils.preprocessing.batch_preprocessing import remove_regex_match_batch
+from nlp_utils.preprocessing.batch_preprocessing import substitue_regex_match_batch
+from nlp_utils.preprocessing.batch_preprocessing import near_duplicate_clusters_batch
+from nlp_utils.preprocessing.batch_preprocessing import representative_apply_batch
 from nlp_utils.preprocessing.cleaner_helper import custom_extended_stopwords, custom_shortforms, custom_direct_replacement_dict
\ No newline at end of file
@@ -0,0 +1,1012 @@
+"""Module providing batch counterparts of the text cleaning functions that work on a whole pandas Series."""
+# ───────────────────────────────── Imports ────────────────────────────────── #
+# Standard Library
+from typing import AbstractSet, Any, Callable, Dict, List, Optional, Pattern, Sequence, Tuple
+import functools
+import numpy as np
+import pandas as pd
+
+# 3rd Party
+
+# Private
+from nlp_utils.preprocessing import near_duplicates
+from nlp_utils.preprocessing import resources
+from nlp_utils.preprocessing import text_preprocessing as tp
+from nlp_utils.preprocessing.parallel import parallel_apply
+
+# ───────────────────────────────── Code ────────────────────────────────── #
+# Every <name>_batch function returns, row for row, what Series.apply(<name>) would return, but the
+# input check runs once for the whole Series: the rows that are not strings are found with a single
+# mask and become None, and only the valid rows go through the unchecked kernel of text_preprocessing.
+# The number of matches comes back as an int64 NumPy array (0 for the invalid rows, as the scalar
+# functions report) instead of a column of tuples. The regex batch functions reject an invalid pattern
+# with a ValueError before looking at any row.
+
+
+def _valid_text_mask(text_series: pd.Series) -> np.ndarray:
+    """
+    [Private function] Finds the rows that the scalar functions accept.
+
+    Args:
+        text_series (pd.Series): a text series that may contain missing values or other objects
+
+    Returns:
+        np.ndarray: a boolean mask that is True for the string rows
+    """
+    # pd.isnull is False for every string, so the isinstance check alone decides the row
+    return np.fromiter((isinstance(text, str) for text in text_series.values), dtype=bool, count=len(text_series))
+
+
+def _to_series(texts: np.ndarray, text_series: pd.Series) -> pd.Series:
+    return pd.Series(texts, index=text_series.index, name=text_series.name, dtype=object)
+
+
+def _map_texts(text_series: pd.Series, kernel: Callable[[str], str]) -> pd.Series:
+    """
+    [Private function] Applies a kernel to the valid rows and puts None in the others.
+
+    Args:
+        text_series (pd.Series): a text series
+        kernel (Callable[[str], str]): an unchecked cleaning function
+
+    Returns:
+        pd.Series: the cleaned texts with the index and the name of the given series
+    """
+    mask = _valid_text_mask(text_series)
+    texts = np.full(len(text_series), None, dtype=object)
+    texts[mask] = [kernel(text) for text in text_series.values[mask]]
+
+    return _to_series(texts, text_series)
+
+
+def _map_texts_with_counts(text_series: pd.Series, kernel: Callable[[str], Tuple[str, int]]) -> Tuple[pd.Series, np.ndarray]:
+    """
+    [Private function] Applies a counting kernel to the valid rows and splits its tuples into two columns.
+
+    Args:
+        text_series (pd.Series): a text series
+        kernel (Callable[[str], Tuple[str, int]]): an unchecked cleaning function that also returns the number of matches
+
+    Returns:
+        Tuple[pd.Series, np.ndarray]: (the cleaned texts, the number of matches per row)
+    """
+    mask = _valid_text_mask(text_series)
+    texts = np.full(len(text_series), None, dtype=object)
+    counts = np.zeros(len(text_series), dtype=np.int64)
+
+    results = [kernel(text) for text in text_series.values[mask]]
+    if results:
+        valid_texts, valid_counts = zip(*results)
+        texts[mask] = valid_texts
+        counts[mask] = valid_counts
+
+    return _to_series(texts, text_series), counts
+
+
+def _map_texts_vectorized(text_series: pd.Series, str_method: Callable[[pd.Series], pd.Series]) -> pd.Series:
+    """
+    [Private function] Applies a pandas .str method to the valid rows and puts None in the others.
+
+    Args:
+        text_series (pd.Series): a text series
+        str_method (Callable[[pd.Series], pd.Series]): a function of a series of strings, e.g. lambda s: s.str.lower()
+
+    Returns:
+        pd.Series: the cleaned texts with the index and the name of the given series
+    """
+    mask = _valid_text_mask(text_series)
+    texts = np.full(len(text_series), None, dtype=object)
+    valid_series = pd.Series(text_series.values[mask], dtype=object)
+    if len(valid_series):
+        texts[mask] = str_method(valid_series).to_numpy(dtype=object)
+
+    return _to_series(texts, text_series)
+
+
+def remove_xml_batch(text_series: Optional[pd.Series]) -> Tuple[Optional[pd.Series], Optional[np.ndarray]]:
+    """
+    Batch version of remove_xml.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series that may contain HTML tags
+
+    Returns:
+        Tuple[Optional[pd.Series], Optional[np.ndarray]]: (the purified texts, the number of matches per row)
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None, None
+
+    return _map_texts_with_counts(text_series, tp._remove_xml)
+
+
+def to_lower_batch(text_series: Optional[pd.Series]) -> Optional[pd.Series]:
+    """
+    Batch version of to_lower.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series to be converted
+
+    Returns:
+        Optional[pd.Series]: the lowercase texts
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None
+
+    return _map_texts_vectorized(text_series, lambda valid_series: valid_series.str.lower())
+
+
+def remove_number_batch(text_series: Optional[pd.Series]) -> Optional[pd.Series]:
+    """
+    Batch version of remove_number.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series that may contain digits
+
+    Returns:
+        Optional[pd.Series]: the texts without any digits
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None
+
+    return _map_texts(text_series, tp._remove_number)
+
+
+def to_strip_batch(text_series: Optional[pd.Series]) -> Optional[pd.Series]:
+    """
+    Batch version of to_strip.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series that may contain multiple spaces
+
+    Returns:
+        Optional[pd.Series]: the texts without useless whitespaces
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None
+
+    return _map_texts(text_series, tp._to_strip)
+
+
+def remove_any_char_batch(text_series: Optional[pd.Series]) -> Tuple[Optional[pd.Series], Optional[np.ndarray]]:
+    """
+    Batch version of remove_any_char.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series that may contain non-letter characters
+
+    Returns:
+        Tuple[Optional[pd.Series], Optional[np.ndarray]]: (the purified texts, the number of matches per row)
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None, None
+
+    return _map_texts_with_counts(text_series, tp._remove_any_char)
+
+
+def remove_all_duplication_batch(text_series: Optional[pd.Series]) -> Optional[pd.Series]:
+    """
+    Batch version of remove_all_duplication.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series that may contain duplicated words
+
+    Returns:
+        Optional[pd.Series]: the texts without duplicated words
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None
+
+    return _map_texts(text_series, tp._remove_all_duplication)
+
+
+def remove_consecutive_duplication_batch(text_series: Optional[pd.Series]) -> Optional[pd.Series]:
+    """
+    Batch version of remove_consecutive_duplication.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series that may contain consecutive duplicated words
+
+    Returns:
+        Optional[pd.Series]: the texts without consecutive duplicated words
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None
+
+    return _map_texts(text_series, tp._remove_consecutive_duplication)
+
+
+def remove_many_spaces_batch(text_series: Optional[pd.Series]) -> Optional[pd.Series]:
+    """
+    Batch version of remove_many_spaces.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series that may contain multiple spaces
+
+    Returns:
+        Optional[pd.Series]: the texts in which every run of whitespaces is a single space
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None
+
+    return _map_texts_vectorized(text_series, lambda valid_series: valid_series.str.replace(tp.SPACE_PATTERN, " ", regex=True))
+
+
+def remove_emoji_batch(text_series: Optional[pd.Series]) -> Tuple[Optional[pd.Series], Optional[np.ndarray]]:
+    """
+    Batch version of remove_emoji.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series that may contain emojis
+
+    Returns:
+        Tuple[Optional[pd.Series], Optional[np.ndarray]]: (the purified texts, the number of matches per row)
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None, None
+
+    return _map_texts_with_counts(text_series, tp._remove_emoji)
+
+
+def remove_url_batch(text_series: Optional[pd.Series]) -> Tuple[Optional[pd.Series], Optional[np.ndarray]]:
+    """
+    Batch version of remove_url.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series that may contain URLs
+
+    Returns:
+        Tuple[Optional[pd.Series], Optional[np.ndarray]]: (the purified texts, the number of matches per row)
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None, None
+
+    return _map_texts_with_counts(text_series, tp._remove_url)
+
+
+def remove_twitter_username_batch(text_series: Optional[pd.Series]) -> Tuple[Optional[pd.Series], Optional[np.ndarray]]:
+    """
+    Batch version of remove_twitter_username.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series that may contain Twitter usernames
+
+    Returns:
+        Tuple[Optional[pd.Series], Optional[np.ndarray]]: (the purified texts, the number of matches per row)
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None, None
+
+    return _map_texts_with_counts(text_series, tp._remove_twitter_username)
+
+
+def remove_username_batch(text_series: Optional[pd.Series]) -> Tuple[Optional[pd.Series], Optional[np.ndarray]]:
+    """
+    Batch version of remove_username.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series that may contain usernames
+
+    Returns:
+        Tuple[Optional[pd.Series], Optional[np.ndarray]]: (the purified texts, the number of matches per row)
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None, None
+
+    return _map_texts_with_counts(text_series, tp._remove_username)
+
+
+def remove_hashtag_batch(text_series: Optional[pd.Series]) -> Tuple[Optional[pd.Series], Optional[np.ndarray]]:
+    """
+    Batch version of remove_hashtag.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series that may contain hashtags
+
+    Returns:
+        Tuple[Optional[pd.Series], Optional[np.ndarray]]: (the purified texts, the number of matches per row)
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None, None
+
+    return _map_texts_with_counts(text_series, tp._remove_hashtag)
+
+
+def remove_email_address_batch(text_series: Optional[pd.Series]) -> Tuple[Optional[pd.Series], Optional[np.ndarray]]:
+    """
+    Batch version of remove_email_address.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series that may contain email addresses
+
+    Returns:
+        Tuple[Optional[pd.Series], Optional[np.ndarray]]: (the purified texts, the number of matches per row)
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None, None
+
+    return _map_texts_with_counts(text_series, tp._remove_email_address)
+
+
+def remove_entities_batch(text_series: Optional[pd.Series],
+                          entities: Sequence[str] = tuple(tp.ENTITY_PATTERNS)) -> Tuple[Optional[pd.Series], Dict[str, np.ndarray]]:
+    """
+    Batch version of remove_entities.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series that may contain multiple entities
+        entities (Sequence[str], optional): the entities to remove, in priority order. Defaults to all of them.
+
+    Raises:
+        ValueError: if an entity is not supported
+
+    Returns:
+        Tuple[Optional[pd.Series], Dict[str, np.ndarray]]: (the purified texts, the number of matches per row for every entity)
+    """
+    entities = tuple(entities)
+    unknown_entities = set(entities) - set(tp.ENTITY_PATTERNS)
+    if unknown_entities:
+        raise ValueError(f"Unsupported entities: {unknown_entities}. Choose from {list(tp.ENTITY_PATTERNS)}")
+
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None, {entity: np.zeros(0, dtype=np.int64) for entity in entities}
+
+    mask = _valid_text_mask(text_series)
+    texts = np.full(len(text_series), None, dtype=object)
+    counts = np.zeros((len(entities), len(text_series)), dtype=np.int64)
+
+    results = [tp._remove_entities(text, entities) for text in text_series.values[mask]]
+    if results:
+        valid_texts, valid_counts = zip(*results)
+        texts[mask] = valid_texts
+        counts[:, mask] = [[entity_counts[entity] for entity_counts in valid_counts] for entity in entities]
+
+    return _to_series(texts, text_series), dict(zip(entities, counts))
+
+
+def remove_special_char_batch(text_series: Optional[pd.Series],
+                              special_char: Optional[List[str]]) -> Tuple[Optional[pd.Series], Optional[np.ndarray]]:
+    """
+    Batch version of remove_special_char.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series
+        special_char (Optional[List[str]]): a list contains special characters
+
+    Returns:
+        Tuple[Optional[pd.Series], Optional[np.ndarray]]: (the purified texts, the number of matches per row)
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None, None
+
+    # Like remove_special_char, the texts are kept as they are if there is nothing to remove
+    if not isinstance(special_char, List) or len(special_char) == 0:
+        return _map_texts_with_counts(text_series, lambda text: (text, 0))
+
+    return _map_texts_with_counts(text_series, lambda text: tp._remove_special_char(text, special_char))
+
+
+def expand_contractions_batch(text_series: Optional[pd.Series]) -> Optional[pd.Series]:
+    """
+    Batch version of expand_contractions.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series that may contain shortened forms of words
+
+    Returns:
+        Optional[pd.Series]: the texts in which shortened words are transferred to a standard shape
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None
+
+    return _map_texts(text_series, tp._expand_contractions)
+
+
+def remove_stopwords_batch(text_series: Optional[pd.Series], stopwords: AbstractSet[str]) -> Optional[pd.Series]:
+    """
+    Batch version of remove_stopwords.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series that may contain stopwords
+        stopwords (AbstractSet[str]): the desired stopwords set or frozenset based on a specific language/s
+
+    Returns:
+        Optional[pd.Series]: the texts w/o any stopwords
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None
+
+    # Like remove_stopwords, every row becomes None if the stopwords are not a set
+    if not isinstance(stopwords, (set, frozenset)):
+        return _to_series(np.full(len(text_series), None, dtype=object), text_series)
+
+    return _map_texts(text_series, lambda text: tp._remove_stopwords(text, stopwords))
+
+
+def remove_emoticon_batch(text_series: Optional[pd.Series]) -> Tuple[Optional[pd.Series], Optional[np.ndarray]]:
+    """
+    Batch version of remove_emoticon.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series that may contain emoticons
+
+    Returns:
+        Tuple[Optional[pd.Series], Optional[np.ndarray]]: (the purified texts, the number of matches per row)
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None, None
+
+    return _map_texts_with_counts(text_series, tp._remove_emoticon)
+
+
+def abbreviation_converter_batch(text_series: Optional[pd.Series]) -> Optional[pd.Series]:
+    """
+    Batch version of abbreviation_converter.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series that may contain abbreviations
+
+    Returns:
+        Optional[pd.Series]: the texts with the abbreviations written out
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None
+
+    return _map_texts(text_series, tp._abbreviation_converter)
+
+
+def remove_punctuation_batch(text_series: Optional[pd.Series]) -> Optional[pd.Series]:
+    """
+    Batch version of remove_punctuation.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series that may contain punctuation
+
+    Returns:
+        Optional[pd.Series]: the texts without any punctuation
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None
+
+    return _map_texts_vectorized(text_series, lambda valid_series: valid_series.str.replace(tp.PUNCTUATION_PATTERN, " ", regex=True))
+
+
+def to_lemmatize_batch(text_series: Optional[pd.Series]) -> Optional[pd.Series]:
+    """
+    Batch version of to_lemmatize. All the texts are POS tagged by a single call of the tagger, and the
+    lemmas come from the same (word, WordNet POS) cache as to_lemmatize (see lemma_cache_info).
+
+    Args:
+        text_series (Optional[pd.Series]): a text series to be lemmatized
+
+    Returns:
+        Optional[pd.Series]: the lemmatized texts
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None
+
+    mask = _valid_text_mask(text_series)
+    texts = np.full(len(text_series), None, dtype=object)
+    texts[mask] = tp._to_lemmatize_many(text_series.values[mask])
+
+    return _to_series(texts, text_series)
+
+
+def convert_emoticon_to_words_batch(text_series: Optional[pd.Series]) -> Optional[pd.Series]:
+    """
+    Batch version of convert_emoticon_to_words.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series that may contain emoticons
+
+    Returns:
+        Optional[pd.Series]: the texts in which the emoticons are converted to words
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None
+
+    return _map_texts(text_series, tp._convert_emoticon_to_words)
+
+
+def convert_emoji_to_words_batch(text_series: Optional[pd.Series]) -> Optional[pd.Series]:
+    """
+    Batch version of convert_emoji_to_words.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series that may contain emojis
+
+    Returns:
+        Optional[pd.Series]: the texts in which the emojis are converted to words
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None
+
+    return _map_texts(text_series, tp._convert_emoji_to_words)
+
+
+def spell_correction_v1_batch(text_series: Optional[pd.Series]) -> Optional[pd.Series]:
+    """
+    Batch version of spell_correction_v1. The unique misspelled words of the whole series are gathered
+    first and each of them is corrected once, then the corrections are mapped back to the texts.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series that may contain misspelled words
+
+    Returns:
+        Optional[pd.Series]: the corrected texts
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None
+
+    mask = _valid_text_mask(text_series)
+    split_texts = [text.split() for text in text_series.values[mask]]
+
+    # unknown() returns the misspelled words in lowercase, so like spell_correction_v1 a word with capitals is kept
+    misspelled_words = resources.get_spell_checker().unknown({word for words in split_texts for word in words})
+    corrections = {word: tp._correct_word(word) for word in misspelled_words}
+
+    texts = np.full(len(text_series), None, dtype=object)
+    texts[mask] = [" ".join([corrections.get(word, word) for word in words]) for words in split_texts]
+
+    return _to_series(texts, text_series)
+
+
+def spell_correction_v2_batch(text_series: Optional[pd.Series]) -> Optional[pd.Series]:
+    """
+    Batch version of spell_correction_v2. Each unique word of the whole series is corrected once, then the
+    corrections are mapped back to the texts.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series that may contain misspelled words
+
+    Returns:
+        Optional[pd.Series]: the corrected texts
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None
+
+    mask = _valid_text_mask(text_series)
+    split_texts = [text.split() for text in text_series.values[mask]]
+    corrections = {word: tp._correct_word_v2(word) for word in {word for words in split_texts for word in words}}
+
+    texts = np.full(len(text_series), None, dtype=object)
+    texts[mask] = [" ".join([corrections[word] for word in words]) for words in split_texts]
+
+    return _to_series(texts, text_series)
+
+
+def _detect_languages(text_series: pd.Series, seed: int, n_workers: int) -> np.ndarray:
+    """
+    [Private function] Detects the languages of each unique valid text of a series once.
+
+    Args:
+        text_series (pd.Series): a text series
+        seed (int): the seed of the detector
+        n_workers (int): the number of processes that share the unique texts
+
+    Returns:
+        np.ndarray: the langdetect Language tuple of every row, None for the invalid and the undetectable rows
+    """
+    mask = _valid_text_mask(text_series)
+    unique_texts = list(dict.fromkeys(text_series.values[mask]))
+
+    # The texts are looked up in the cache of the calling process, so only the unknown ones are detected, in the
+    # workers if any, and their detections are kept there for the next batches
+    detections = {}
+    for text in unique_texts:
+        probabilities = tp._language_detection_cache.get((text, seed), tp._NOT_CACHED)
+        if probabilities is not tp._NOT_CACHED:
+            detections[text] = probabilities
+
+    missing_texts = [text for text in unique_texts if text not in detections]
+    kernel = functools.partial(tp._try_compute_language_probabilities, seed=seed)
+    for text, probabilities in zip(missing_texts, parallel_apply(kernel, missing_texts, n_workers=n_workers)):
+        tp._language_detection_cache.put((text, seed), probabilities)
+        detections[text] = probabilities
+
+    # Filled one by one, so NumPy does not unpack the tuples into a second dimension
+    probabilities = np.full(len(text_series), None, dtype=object)
+    for position in np.flatnonzero(mask):
+        probabilities[position] = detections[text_series.values[position]]
+
+    return probabilities
+
+
+def language_detection_batch(text_series: Optional[pd.Series], seed: int = tp.LANGUAGE_DETECTION_SEED,
+                             n_workers: int = 1) -> Optional[pd.Series]:
+    """
+    Batch version of language_detection. Each unique text of the series is detected once with the same seed as
+    language_detection, and the repeated texts, such as retweets, get its language.
+
+    Note:
+        A text without any feature to detect a language from, e.g. only digits, becomes None instead of raising a
+        LangDetectException. The texts that the cache of language_detection does not have are detected, and with
+        n_workers > 1 they are detected in a pool of processes (see
+        parallel_apply), which pays off from a few thousand unique texts.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series in any languages
+        seed (int, optional): the seed of the random sampling. Defaults to LANGUAGE_DETECTION_SEED.
+        n_workers (int, optional): the number of processes. Defaults to 1, the calling process.
+
+    Raises:
+        ValueError: if n_workers is not a positive integer
+
+    Returns:
+        Optional[pd.Series]: the language abbreviation with the highest probability of every text
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None
+
+    probabilities = _detect_languages(text_series, seed, n_workers)
+    languages = np.full(len(text_series), None, dtype=object)
+    languages[:] = [None if detection is None else tp._most_probable_language(detection) for detection in probabilities]
+
+    return _to_series(languages, text_series)
+
+
+def language_prob_detection_batch(text_series: Optional[pd.Series], seed: int = tp.LANGUAGE_DETECTION_SEED,
+                                  n_workers: int = 1) -> Optional[pd.Series]:
+    """
+    Batch version of language_prob_detection. Each unique text of the series is detected once with the same seed
+    as language_prob_detection, and the repeated texts, such as retweets, get its probabilities.
+
+    Note:
+        A text without any feature to detect a language from, e.g. only digits, becomes None instead of raising a
+        LangDetectException. The texts that the cache of language_detection does not have are detected, and with
+        n_workers > 1 they are detected in a pool of processes (see
+        parallel_apply), which pays off from a few thousand unique texts.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series in any languages
+        seed (int, optional): the seed of the random sampling. Defaults to LANGUAGE_DETECTION_SEED.
+        n_workers (int, optional): the number of processes. Defaults to 1, the calling process.
+
+    Raises:
+        ValueError: if n_workers is not a positive integer
+
+    Returns:
+        Optional[pd.Series]: the list of the languages and their probabilities of every text
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None
+
+    probabilities = _detect_languages(text_series, seed, n_workers)
+    for position, detection in enumerate(probabilities):
+        if detection is not None:
+            probabilities[position] = list(detection)
+
+    return _to_series(probabilities, text_series)
+
+
+def ngram_language_detection_batch(text_series: Optional[pd.Series]) -> Optional[pd.Series]:
+    """
+    Detects the language of every text of the series with the vectorized n-gram identifier (see
+    NgramLanguageIdentifier). It reports the same languages as language_detection_batch for most texts, a few tens
+    of times faster.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series in any languages
+
+    Returns:
+        Optional[pd.Series]: the most probable language abbreviation of every text, None for the invalid rows and
+            the texts without any known n-gram
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None
+
+    mask = _valid_text_mask(text_series)
+    languages = np.full(len(text_series), None, dtype=object)
+    languages[mask] = resources.get_ngram_language_identifier().predict(text_series.values[mask])
+
+    return _to_series(languages, text_series)
+
+
+def ngram_language_prob_detection_batch(text_series: Optional[pd.Series], top_k: int = 3) -> Optional[pd.Series]:
+    """
+    Finds the most probable languages of every text of the series with the vectorized n-gram identifier (see
+    NgramLanguageIdentifier), like language_prob_detection_batch.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series in any languages
+        top_k (int, optional): the largest number of languages reported per text. Defaults to 3.
+
+    Raises:
+        ValueError: if top_k is not a positive integer
+
+    Returns:
+        Optional[pd.Series]: the list of the (language, probability) pairs of every text, None for the invalid rows
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None
+
+    mask = _valid_text_mask(text_series)
+    detections = resources.get_ngram_language_identifier().predict_proba(text_series.values[mask], top_k=top_k)
+
+    # Filled one by one, so NumPy does not unpack the lists into a second dimension
+    probabilities = np.full(len(text_series), None, dtype=object)
+    for position, detection in zip(np.flatnonzero(mask), detections):
+        probabilities[position] = detection
+
+    return _to_series(probabilities, text_series)
+
+
+def script_routed_language_detection_batch(text_series: Optional[pd.Series], detector: str = "langdetect",
+                                           seed: int = tp.LANGUAGE_DETECTION_SEED,
+                                           n_workers: int = 1) -> Tuple[Optional[pd.Series], Optional[np.ndarray]]:
+    """
+    Detects the language of every text of the series, deciding the texts written in the script of a single language
+    (see script_language_detection) without the detector. Only the other texts, e.g. the Latin ones, go through
+    language_detection_batch or ngram_language_detection_batch.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series in any languages
+        detector (str, optional): the detector of the texts the script does not decide, "langdetect" or "ngram".
+            Defaults to "langdetect".
+        seed (int, optional): the seed of langdetect. Defaults to LANGUAGE_DETECTION_SEED.
+        n_workers (int, optional): the number of processes of langdetect. Defaults to 1, the calling process.
+
+    Raises:
+        ValueError: if the detector is unknown or n_workers is not a positive integer
+
+    Returns:
+        Tuple[Optional[pd.Series], Optional[np.ndarray]]: (the language abbreviation of every text, the path that
+            decided every row: "script", "langdetect" or "ngram", None for the invalid rows)
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None, None
+
+    if detector not in ("langdetect", "ngram"):
+        raise ValueError(f"detector must be 'langdetect' or 'ngram'. Got {detector!r}")
+
+    positions = np.flatnonzero(_valid_text_mask(text_series))
+    script_languages = np.array([tp._script_language(text) for text in text_series.values[positions]], dtype=object)
+    decided = np.array([language is not None for language in script_languages], dtype=bool)
+
+    languages = np.full(len(text_series), None, dtype=object)
+    paths = np.full(len(text_series), None, dtype=object)
+    languages[positions[decided]] = script_languages[decided]
+    paths[positions[decided]] = "script"
+
+    undecided_series = text_series.iloc[positions[~decided]]
+    if detector == "langdetect":
+        detected_series = language_detection_batch(undecided_series, seed=seed, n_workers=n_workers)
+    else:
+        detected_series = ngram_language_detection_batch(undecided_series)
+    languages[positions[~decided]] = detected_series.values
+    paths[positions[~decided]] = detector
+
+    return _to_series(languages, text_series), paths
+
+
+def _compile_batch_regex(regex: Optional[str]) -> Pattern:
+    """
+    [Private function] Compiles the pattern of a regex batch function once, for the whole series.
+
+    Args:
+        regex (Optional[str]): a regular expression
+
+    Raises:
+        ValueError: if the regular expression is invalid
+
+    Returns:
+        Pattern: the compiled pattern
+    """
+    pattern = tp._compile_user_regex(regex) if isinstance(regex, str) else None
+    if pattern is None:
+        raise ValueError(f"A valid regular expression is needed. Got {regex!r}")
+
+    return pattern
+
+
+def remove_regex_match_batch(text_series: Optional[pd.Series], regex: Optional[str]) -> Optional[pd.Series]:
+    """
+    Batch version of remove_regex_match. The pattern is checked and compiled once for the whole series.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series that may contain the given regular expression
+        regex (Optional[str]): a regular expression
+
+    Raises:
+        ValueError: if the regular expression is invalid
+
+    Returns:
+        Optional[pd.Series]: the texts that do not contain the given regular expression
+    """
+    pattern = _compile_batch_regex(regex)
+
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None
+
+    return _map_texts(text_series, lambda text: tp._remove_regex_match(text, pattern))
+
+
+def substitue_regex_match_batch(text_series: Optional[pd.Series], regex: Optional[str], sub_text: Optional[str]) -> Optional[pd.Series]:
+    """
+    Batch version of substitue_regex_match. The pattern is checked and compiled once for the whole series.
+
+    Args:
+        text_series (Optional[pd.Series]): a text series that may contain the given regular expression
+        regex (Optional[str]): a regular expression
+        sub_text (Optional[str]): a string that will be substituted
+
+    Raises:
+        ValueError: if the regular expression is invalid or sub_text is not a string
+
+    Returns:
+        Optional[pd.Series]: the texts in which the matches are substituted with the given string
+    """
+    pattern = _compile_batch_regex(regex)
+    if not isinstance(sub_text, str):
+        raise ValueError(f"A string to substitute is needed. Got {type(sub_text)}")
+
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None
+
+    return _map_texts(text_series, lambda text: tp._substitue_regex_match(text, pattern, sub_text))
+
+
+def near_duplicate_clusters_batch(text_series: Optional[pd.Series], threshold: float = near_duplicates.THRESHOLD,
+                                  num_perm: int = near_duplicates.NUM_PERM, bands: int = near_duplicates.BANDS,
+                                  shingle_size: int = near_duplicates.SHINGLE_SIZE, seed: int = 0) -> Optional[pd.Series]:
+    """
+    Groups the near-duplicate texts of the series, e.g. the retweets and the copies of a tweet, with MinHash
+    signatures and LSH banding (see near_duplicate_clusters).
+
+    Args:
+        text_series (Optional[pd.Series]): a text series
+        threshold (float, optional): the smallest estimated Jaccard similarity of the shingles of two texts of the
+            same cluster. Defaults to THRESHOLD.
+        num_perm (int, optional): the number of hash functions. Defaults to NUM_PERM.
+        bands (int, optional): the number of LSH bands, which divides num_perm. Defaults to BANDS.
+        shingle_size (int, optional): the number of characters of a shingle. Defaults to SHINGLE_SIZE.
+        seed (int, optional): the seed of the hash functions. Defaults to 0.
+
+    Raises:
+        ValueError: if an argument of near_duplicate_clusters is invalid
+
+    Returns:
+        Optional[pd.Series]: the cluster of every text, which is the position in the series of its first text,
+            None for the invalid rows
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None
+
+    positions = np.flatnonzero(_valid_text_mask(text_series))
+    valid_clusters = near_duplicates.near_duplicate_clusters(text_series.values[positions].tolist(), threshold=threshold,
+                                                             num_perm=num_perm, bands=bands, shingle_size=shingle_size, seed=seed)
+
+    clusters = np.full(len(text_series), None, dtype=object)
+    clusters[positions] = positions[valid_clusters].tolist()
+
+    return _to_series(clusters, text_series)
+
+
+def _broadcast_result(result: Any, representative_of_rows: np.ndarray, valid_rows: np.ndarray, text_series: pd.Series) -> Any:
+    """
+    [Private function] Gives every row the result of its representative.
+
+    Args:
+        result (Any): a series or an array of the representatives
+        representative_of_rows (np.ndarray): the position of the representative of every valid row in the result
+        valid_rows (np.ndarray): the positions of the valid rows in the series
+        text_series (pd.Series): the series of all the rows
+
+    Returns:
+        Any: the series of all the rows (None for the invalid rows) or the array of all the rows (0 for the invalid
+            rows, like the number of matches); any other result as it is
+    """
+    if isinstance(result, pd.Series):
+        values = np.full(len(text_series), None, dtype=object)
+        # Assigned one by one, so NumPy does not unpack the list values into a second dimension
+        for position, value in zip(valid_rows, result.values[representative_of_rows]):
+            values[position] = value
+        return _to_series(values, text_series)
+
+    if isinstance(result, np.ndarray):
+        if result.dtype == object:
+            values = np.full(len(text_series), None, dtype=object)
+        else:
+            values = np.zeros(len(text_series), dtype=result.dtype)
+        values[valid_rows] = result[representative_of_rows]
+        return values
+
+    return result
+
+
+def representative_apply_batch(text_series: Optional[pd.Series], batch_function: Callable[..., Any],
+                               clusters: Optional[pd.Series] = None, near_duplicates: bool = False, **kwargs: Any) -> Any:
+    """
+    Runs a batch function only once per distinct text and gives its result to every copy of the text, so the
+    expensive steps, e.g. spell_correction_v2_batch, run once per tweet instead of once per copy. With
+    near_duplicates, it runs once per cluster of near duplicates, e.g. a tweet and its retweets, instead.
+
+    Note:
+        The texts of a near-duplicate cluster are similar, not equal, so with near_duplicates a text gets the result
+        of its representative: only use it for the labels of a text, e.g. its language, never for a function that
+        returns texts, which would replace the text of every member with the one of its representative. The results
+        that are not a series or an array, e.g. the total counts of remove_entities_batch, are only the ones of the
+        representatives.
+
+    Example:
+        df["clean_text"] = representative_apply_batch(df["text"], spell_correction_v2_batch)
+        clusters = near_duplicate_clusters_batch(df["text"])
+        df["language"] = representative_apply_batch(df["text"], language_detection_batch, clusters=clusters,
+                                                    near_duplicates=True)
+
+    Args:
+        text_series (Optional[pd.Series]): a text series
+        batch_function (Callable[..., Any]): a function of a text series, e.g. a batch function, that returns a
+            series or a tuple of series and arrays row for row
+        clusters (Optional[pd.Series], optional): the clusters of the series from near_duplicate_clusters_batch,
+            to share them between several functions with near_duplicates. Defaults to the clusters of the series.
+        near_duplicates (bool, optional): whether the near duplicates share the result of their representative,
+            for label-like results only. Defaults to False, only the exact copies of a text share its result.
+        **kwargs (Any): the other arguments of the batch function
+
+    Raises:
+        ValueError: if the clusters do not have the length of the series, or are given without near_duplicates
+
+    Returns:
+        Any: the result of the batch function for every row of the series, None if text_series is not a series
+    """
+    # Input checking
+    if not isinstance(text_series, pd.Series):
+        return None
+
+    if not near_duplicates:
+        if clusters is not None:
+            raise ValueError("clusters must be None unless near_duplicates is True. Got a clusters series")
+        valid_rows = np.flatnonzero(_valid_text_mask(text_series))
+        # The codes follow the order of the first copies, so the first copy of a text is its representative
+        representative_of_rows, _ = pd.factorize(text_series.values[valid_rows])
+        _, first_copies = np.unique(representative_of_rows, return_index=True)
+        representatives = valid_rows[first_copies]
+    else:
+        if clusters is None:
+            clusters = near_duplicate_clusters_batch(text_series)
+        if not isinstance(clusters, pd.Series) or len(clusters) != len(text_series):
+            raise ValueError(f"clusters must be a series of the length of the text series {len(text_series)}. Got {type(clusters)}")
+
+        valid_rows = np.flatnonzero(clusters.notna().to_numpy())
+        cluster_of_rows = clusters.values[valid_rows].astype(np.int64)
+        representatives, representative_of_rows = np.unique(cluster_of_rows, return_inverse=True)
+
+    result = batch_function(text_series.iloc[representatives], **kwargs)
+
+    if isinstance(result, tuple):
+        return tuple(_broadcast_result(part, representative_of_rows, valid_rows, text_series) for part in result)
+    return _broadcast_result(result, representative_of_rows, valid_rows, text_series)
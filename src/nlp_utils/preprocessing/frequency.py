@@ -0,0 +1,221 @@
+"""Module providing a mergeable word frequency table of a corpus and the selection of its most and least common words."""
+# ───────────────────────────────── Imports ────────────────────────────────── #
+# Standard Library
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import Any, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+import numpy as np
+
+# 3rd Party
+
+# Private
+
+# ───────────────────────────────── Code ────────────────────────────────── #
+# The frequencies are built in two phases. The words of the corpus are first counted chunk by chunk, in this
+# process or in a pool of processes, and the counts of the chunks are merged; a chunk of a file that does not fit
+# in memory (see streaming.read_text_chunks) can be counted and dropped before the next one is read. The most or
+# least common words are then selected from an array of the counts with np.partition, in linear time, instead of
+# sorting the whole vocabulary.
+#
+# The words are kept in the order they were first seen, and the ties are broken like collections.Counter: the
+# most common words come in the order they were first seen and the least common ones from the last seen, like
+# Counter.most_common()[:-k - 1:-1].
+
+# The number of texts counted at once
+CHUNK_SIZE = 10000
+
+
+def _count_words(texts: Iterable[Any]) -> Counter:
+    """
+    [Private function] Counts the whitespace-separated words of the texts that are strings.
+
+    Args:
+        texts (Iterable[Any]): texts, the ones that are not strings are skipped
+
+    Returns:
+        Counter: word -> number of occurrences, in the order the words were first seen
+    """
+    # Counter.update counts an iterable in C
+    return Counter(chain.from_iterable(text.split() for text in texts if isinstance(text, str)))
+
+
+def _select_positions(counts: np.ndarray, k: int, most_common: bool) -> np.ndarray:
+    """
+    [Private function] Selects the k largest or smallest counts with a partition, like Counter.
+
+    Args:
+        counts (np.ndarray): the counts of the words, in the order the words were first seen
+        k (int): the number of words
+        most_common (bool): the largest counts, otherwise the smallest ones
+
+    Returns:
+        np.ndarray: the positions of the selected counts, from the largest one or from the smallest one
+    """
+    n_words = len(counts)
+    k = max(0, min(k, n_words))
+    if k == 0:
+        return np.empty(0, dtype=np.int64)
+
+    positions = np.arange(n_words)
+
+    if most_common:
+        # The k-th largest count; all the larger counts are in, then the first ties
+        threshold = np.partition(counts, n_words - k)[n_words - k]
+        selected = positions[counts > threshold]
+        ties = positions[counts == threshold][:k - len(selected)]
+        selected = np.concatenate([selected, ties])
+        order = np.lexsort((selected, -counts[selected]))
+    else:
+        # The k-th smallest count; all the smaller counts are in, then the last ties
+        threshold = np.partition(counts, k - 1)[k - 1]
+        selected = positions[counts < threshold]
+        ties = positions[counts == threshold]
+        selected = np.concatenate([selected, ties[len(ties) - (k - len(selected)):]])
+        order = np.lexsort((-selected, counts[selected]))
+
+    return selected[order]
+
+
+class FrequencyTable():
+    """
+    The number of occurrences of every word of a corpus. Tables of parts of a corpus merge into the table of the
+    whole corpus, in the order of the parts.
+
+    Example:
+        frequencies = FrequencyTable.from_texts(df["text"], n_workers=4)
+        for chunk in read_text_chunks("tweets.csv"):
+            frequencies.update(chunk["text"])
+        common_words = frequencies.most_common_words(100)
+    """
+
+    def __init__(self, counts: Optional[Mapping[str, int]] = None) -> None:
+        """
+        Constructs a table.
+
+        Args:
+            counts (Optional[Mapping[str, int]], optional): word -> number of occurrences. Defaults to an empty table.
+        """
+        self._counts = Counter(counts or {})
+
+    @classmethod
+    def from_texts(cls, texts: Iterable[Any], chunk_size: int = CHUNK_SIZE, n_workers: int = 1) -> "FrequencyTable":
+        """
+        Counts the whitespace-separated words of the texts.
+
+        Args:
+            texts (Iterable[Any]): texts, e.g. a Series; the ones that are not strings are skipped
+            chunk_size (int, optional): the number of texts counted at once. Defaults to CHUNK_SIZE.
+            n_workers (int, optional): the number of processes that count the chunks. Defaults to 1, counting in
+                the calling process without a pool.
+
+        Raises:
+            ValueError: if chunk_size or n_workers is not a positive integer
+
+        Returns:
+            FrequencyTable: the table of the texts
+        """
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError(f"chunk_size must be a positive integer. Got {chunk_size!r}")
+        if not isinstance(n_workers, int) or n_workers < 1:
+            raise ValueError(f"n_workers must be a positive integer. Got {n_workers!r}")
+
+        table = cls()
+        if n_workers == 1:
+            return table.update(texts)
+
+        text_list = list(texts)
+        chunks = [text_list[start:start + chunk_size] for start in range(0, len(text_list), chunk_size)]
+        if len(chunks) <= 1:
+            return table.update(text_list)
+
+        # map returns the counts in the order of the chunks, so the words keep the order they were first seen
+        with ProcessPoolExecutor(max_workers=min(n_workers, len(chunks))) as executor:
+            for chunk_counts in executor.map(_count_words, chunks):
+                table._counts.update(chunk_counts)
+        return table
+
+    def update(self, texts: Iterable[Any]) -> "FrequencyTable":
+        """
+        Adds the words of more texts to the table.
+
+        Args:
+            texts (Iterable[Any]): texts; the ones that are not strings are skipped
+
+        Returns:
+            FrequencyTable: the table itself
+        """
+        self._counts.update(_count_words(texts))
+        return self
+
+    def merge(self, other: "FrequencyTable") -> "FrequencyTable":
+        """
+        Adds the counts of another table, e.g. of the next chunk of the corpus or of another process.
+
+        Args:
+            other (FrequencyTable): a table
+
+        Returns:
+            FrequencyTable: the table itself
+        """
+        self._counts.update(other._counts)
+        return self
+
+    def __add__(self, other: "FrequencyTable") -> "FrequencyTable":
+        return FrequencyTable(self._counts).merge(other)
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._counts
+
+    def __getitem__(self, word: str) -> int:
+        return self._counts.get(word, 0)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, FrequencyTable) and self._counts == other._counts
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(words={len(self._counts)}, occurrences={self.total()})"
+
+    def total(self) -> int:
+        return sum(self._counts.values())
+
+    def to_dict(self) -> dict:
+        return dict(self._counts)
+
+    def _select(self, k: int, most_common: bool) -> List[Tuple[str, int]]:
+        words = list(self._counts)
+        counts = np.fromiter(self._counts.values(), dtype=np.int64, count=len(words))
+        return [(words[position], int(counts[position])) for position in _select_positions(counts, k, most_common)]
+
+    def most_common(self, k: int) -> List[Tuple[str, int]]:
+        """
+        Finds the k most common words, like Counter.most_common(k).
+
+        Args:
+            k (int): the number of words
+
+        Returns:
+            List[Tuple[str, int]]: the (word, count) pairs, from the most common one
+        """
+        return self._select(k, most_common=True)
+
+    def least_common(self, k: int) -> List[Tuple[str, int]]:
+        """
+        Finds the k least common words, like Counter.most_common()[:-k - 1:-1].
+
+        Args:
+            k (int): the number of words
+
+        Returns:
+            List[Tuple[str, int]]: the (word, count) pairs, from the least common one
+        """
+        return self._select(k, most_common=False)
+
+    def most_common_words(self, k: int) -> FrozenSet[str]:
+        return frozenset(word for word, _ in self._select(k, most_common=True))
+
+    def least_common_words(self, k: int) -> FrozenSet[str]:
+        return frozenset(word for word, _ in self._select(k, most_common=False))
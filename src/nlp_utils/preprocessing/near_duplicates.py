@@ -0,0 +1,193 @@
+"""Module providing a corpus-level near-duplicate detector with MinHash signatures and LSH banding."""
+# ───────────────────────────────── Imports ────────────────────────────────── #
+# Standard Library
+from typing import Sequence
+import numpy as np
+
+# 3rd Party
+
+# Private
+
+# ───────────────────────────────── Code ────────────────────────────────── #
+# Two texts are near duplicates when their sets of character shingles (the substrings of SHINGLE_SIZE characters
+# of the lower case text) have a high Jaccard similarity, e.g. a tweet and its retweet with an "RT @user:" prefix.
+#
+# 1. The shingles of all the texts are hashed into a sparse matrix by scikit-learn in a single call.
+# 2. A MinHash signature of every text keeps, for each of NUM_PERM random permutations h(x) = (a * x + b) mod 2^32
+#    (a odd) of the shingle hashes, the smallest one of its shingles. Two signatures agree at a position with about
+#    the probability of the Jaccard similarity of their texts; the shingle hashes are already uniform, so this
+#    family estimates it as well as a modular prime one, with native uint32 arithmetic. The hashes of all the
+#    shingles are permuted at once with NumPy, block by block, and np.minimum.reduceat takes the minimum of every
+#    text.
+# 3. LSH banding cuts the signatures into BANDS bands: the texts with an identical band are candidates, which finds
+#    the pairs above ~(1 / BANDS) ** (1 / rows per band) without comparing all the pairs. The candidates whose
+#    signatures agree on less than the threshold are dropped, and the connected components of the remaining pairs
+#    are the clusters.
+
+# The number of characters of a shingle
+SHINGLE_SIZE = 5
+
+# The number of hash functions of a signature
+NUM_PERM = 128
+
+# The number of bands of the signatures: 16 bands of 8 rows find the pairs above a similarity of ~0.7
+BANDS = 16
+
+# The estimated Jaccard similarity of two texts of the same cluster
+THRESHOLD = 0.7
+
+# The number of shingle hashes, the largest number of features of the HashingVectorizer
+N_FEATURES = 2 ** 31 - 1
+
+# The number of shingle hashes that are permuted by every function at once, which bounds the memory of a block to
+# NUM_PERM x BLOCK_SIZE 32-bit integers (32 MB)
+BLOCK_SIZE = 2 ** 16
+
+
+def _shingle_matrix(texts: Sequence[str], shingle_size: int):
+    """
+    [Private function] Hashes the shingles of the texts.
+
+    Args:
+        texts (Sequence[str]): texts that are strings
+        shingle_size (int): the number of characters of a shingle
+
+    Returns:
+        csr_matrix: texts x 31-bit shingle hashes, where every row has at least one shingle
+    """
+    from sklearn.feature_extraction.text import HashingVectorizer
+
+    vectorizer = HashingVectorizer(analyzer="char", ngram_range=(shingle_size, shingle_size), n_features=N_FEATURES,
+                                   lowercase=True, alternate_sign=False, norm=None, dtype=np.float32)
+
+    # The spaces are normalized, and a text shorter than a shingle is padded into a single shingle with a character
+    # that the analyzer does not collapse like whitespace
+    return vectorizer.transform([" ".join(text.split()).ljust(shingle_size, "\0") for text in texts])
+
+
+def minhash_signatures(texts: Sequence[str], num_perm: int = NUM_PERM, shingle_size: int = SHINGLE_SIZE, seed: int = 0) -> np.ndarray:
+    """
+    Computes the MinHash signatures of the character shingles of the texts.
+
+    Args:
+        texts (Sequence[str]): texts that are strings
+        num_perm (int, optional): the number of hash functions. Defaults to NUM_PERM.
+        shingle_size (int, optional): the number of characters of a shingle. Defaults to SHINGLE_SIZE.
+        seed (int, optional): the seed of the hash functions; only the signatures of the same seed can be
+            compared. Defaults to 0.
+
+    Raises:
+        ValueError: if num_perm or shingle_size is not a positive integer
+
+    Returns:
+        np.ndarray: texts x num_perm uint32 signatures
+    """
+    if not isinstance(num_perm, int) or num_perm < 1:
+        raise ValueError(f"num_perm must be a positive integer. Got {num_perm!r}")
+    if not isinstance(shingle_size, int) or shingle_size < 1:
+        raise ValueError(f"shingle_size must be a positive integer. Got {shingle_size!r}")
+
+    signatures = np.empty((len(texts), num_perm), dtype=np.uint32)
+    if len(texts) == 0:
+        return signatures
+
+    rng = np.random.RandomState(seed)
+    a = rng.randint(0, 2 ** 32, size=(num_perm, 1), dtype=np.uint64).astype(np.uint32) | np.uint32(1)
+    b = rng.randint(0, 2 ** 32, size=(num_perm, 1), dtype=np.uint64).astype(np.uint32)
+
+    shingles = _shingle_matrix(texts, shingle_size)
+    hashes = shingles.indices.astype(np.uint32)
+    indptr = shingles.indptr
+
+    # Blocks of whole texts with about BLOCK_SIZE shingles
+    start_text = 0
+    while start_text < len(texts):
+        end_text = max(int(np.searchsorted(indptr, indptr[start_text] + BLOCK_SIZE, side="right")) - 1, start_text + 1)
+        block_hashes = hashes[indptr[start_text]:indptr[end_text]]
+
+        # uint32 arithmetic wraps around, which is the mod 2^32
+        permuted_hashes = a * block_hashes + b
+        signatures[start_text:end_text] = np.minimum.reduceat(permuted_hashes, indptr[start_text:end_text] - indptr[start_text], axis=1).T
+
+        start_text = end_text
+
+    return signatures
+
+
+def lsh_clusters(signatures: np.ndarray, bands: int = BANDS, threshold: float = THRESHOLD) -> np.ndarray:
+    """
+    Groups the texts of near-duplicate signatures with LSH banding.
+
+    Args:
+        signatures (np.ndarray): texts x num_perm MinHash signatures (see minhash_signatures)
+        bands (int, optional): the number of bands, which divides num_perm. Defaults to BANDS.
+        threshold (float, optional): the smallest share of equal signature values of two texts of the same
+            cluster. Defaults to THRESHOLD.
+
+    Raises:
+        ValueError: if bands does not divide the length of the signatures or threshold is not between 0 and 1
+
+    Returns:
+        np.ndarray: the cluster of every text, which is the position of its first text
+    """
+    from scipy import sparse
+    from scipy.sparse.csgraph import connected_components
+
+    n_texts, num_perm = signatures.shape
+    if not isinstance(bands, int) or bands < 1 or num_perm % bands != 0:
+        raise ValueError(f"bands must be a positive divisor of the signature length {num_perm}. Got {bands!r}")
+    if not isinstance(threshold, (int, float)) or not 0 <= threshold <= 1:
+        raise ValueError(f"threshold must be between 0 and 1. Got {threshold!r}")
+
+    rows = num_perm // bands
+    sources, targets = [], []
+    for band in range(bands):
+        band_values = np.ascontiguousarray(signatures[:, band * rows:(band + 1) * rows])
+        # The texts of a bucket are linked to its first text
+        _, first_texts, buckets = np.unique(band_values, axis=0, return_index=True, return_inverse=True)
+        bucket_firsts = first_texts[buckets.reshape(-1)]
+        is_candidate = bucket_firsts != np.arange(n_texts)
+        sources.append(np.flatnonzero(is_candidate))
+        targets.append(bucket_firsts[is_candidate])
+
+    sources = np.concatenate(sources)
+    targets = np.concatenate(targets)
+
+    # The candidates of a shared band that are not similar enough on the whole signature are not linked
+    if len(sources):
+        is_similar = (signatures[sources] == signatures[targets]).mean(axis=1) >= threshold
+        sources, targets = sources[is_similar], targets[is_similar]
+
+    graph = sparse.coo_matrix((np.ones(len(sources), dtype=np.int8), (sources, targets)), shape=(n_texts, n_texts))
+    _, components = connected_components(graph, directed=False)
+
+    # The first text of every component names its cluster
+    first_of_component = np.full(components.max() + 1 if n_texts else 0, n_texts, dtype=np.int64)
+    np.minimum.at(first_of_component, components, np.arange(n_texts))
+    return first_of_component[components]
+
+
+def near_duplicate_clusters(texts: Sequence[str], threshold: float = THRESHOLD, num_perm: int = NUM_PERM, bands: int = BANDS,
+                            shingle_size: int = SHINGLE_SIZE, seed: int = 0) -> np.ndarray:
+    """
+    Groups the near-duplicate texts of a corpus, e.g. the retweets and the copies of a tweet.
+
+    Example:
+        clusters = near_duplicate_clusters(texts)
+        representatives = np.flatnonzero(clusters == np.arange(len(texts)))
+
+    Args:
+        texts (Sequence[str]): texts that are strings
+        threshold (float, optional): the smallest estimated Jaccard similarity of the shingles of two texts of the
+            same cluster. Defaults to THRESHOLD.
+        num_perm (int, optional): the number of hash functions. Defaults to NUM_PERM.
+        bands (int, optional): the number of LSH bands, which divides num_perm. Defaults to BANDS.
+        shingle_size (int, optional): the number of characters of a shingle. Defaults to SHINGLE_SIZE.
+        seed (int, optional): the seed of the hash functions. Defaults to 0.
+
+    Returns:
+        np.ndarray: the cluster of every text, which is the position of its first text, so a text is the
+            representative of its cluster if its cluster is its own position
+    """
+    return lsh_clusters(minhash_signatures(texts, num_perm=num_perm, shingle_size=shingle_size, seed=seed), bands=bands,
+                        threshold=threshold)
@@ -0,0 +1,234 @@
+"""Module providing a process-pool executor that runs a preprocessing pipeline over a large corpus."""
+# ───────────────────────────────── Imports ────────────────────────────────── #
+# Standard Library
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+import functools
+import math
+import os
+import pandas as pd
+
+# 3rd Party
+
+# Private
+from nlp_utils.preprocessing import resources
+from nlp_utils.preprocessing import text_preprocessing as tp
+from nlp_utils.preprocessing.pipeline import _STEP_KERNELS, Pipeline
+from nlp_utils.preprocessing.result_cache import ResultCache
+
+# ───────────────────────────────── Code ────────────────────────────────── #
+
+# The callable every worker process runs, set once by _init_worker instead of being pickled with every chunk
+_worker_pipeline: Optional[Callable[[Any], Any]] = None
+
+
+def _load_wordnet() -> None:
+    try:
+        # The WordNet corpus is loaded on the first lemmatization
+        resources.get_lemmatizer().lemmatize("warming")
+    except LookupError:
+        # The corpus is not installed; a pipeline that lemmatizes will raise the error itself
+        pass
+
+
+# Kernel of a step -> the lazy resources it loads on its first call, which a worker loads before its first chunk
+_KERNEL_RESOURCES: Dict[Callable, Tuple[Callable[[], Any], ...]] = {
+    tp._remove_emoticon: (tp._emoticon_pattern,),
+    tp._abbreviation_converter: (tp._abbreviation_pattern,),
+    tp._to_lemmatize: (_load_wordnet,),
+    tp._convert_emoticon_to_words: (tp._emoticon_words_pattern,),
+    tp._convert_emoji_to_words: (tp._emoji_words_pattern,),
+    tp._spell_correction_v1: (resources.get_spell_checker,),
+    tp._spell_correction_v2: (resources.get_symspell,),
+    tp._try_compute_language_probabilities: (resources.get_language_detector_factory,),
+}
+
+# Resource loader -> what the parent prepares once before starting the workers, e.g. an index file that every
+# worker would otherwise build at the same time
+_PARENT_PREPARATIONS: Dict[Callable[[], Any], Callable[[], Any]] = {
+    resources.get_symspell: resources.build_symspell_index,
+}
+
+
+def _pipeline_resources(pipeline: Callable[[Any], Any]) -> Tuple[Callable[[], Any], ...]:
+    """
+    [Private function] Finds the lazy resources the steps of a pipeline load.
+
+    Args:
+        pipeline (Callable[[Any], Any]): a Pipeline or a cleaning function of the text_preprocessing module.
+            Any other callable loads its resources on its first call.
+
+    Returns:
+        Tuple[Callable[[], Any], ...]: the loaders of the resources, without duplicates
+    """
+    if isinstance(pipeline, Pipeline):
+        kernels = [kernel for kernel, _ in pipeline._kernels]
+    else:
+        kernels = [_STEP_KERNELS.get(pipeline, (pipeline, None))[0]]
+
+    loaders: Dict[Callable[[], Any], None] = {}
+    for kernel in kernels:
+        kernel = kernel.func if isinstance(kernel, functools.partial) else kernel
+        loaders.update(dict.fromkeys(_KERNEL_RESOURCES.get(kernel, ())))
+
+    return tuple(loaders)
+
+
+def _init_worker(pipeline: Callable[[Any], Any], loaders: Tuple[Callable[[], Any], ...]) -> None:
+    """
+    [Private function] Initializes a worker process of the pool and loads the resources of the pipeline, so the
+    first chunk of the worker does not pay for them.
+
+    Args:
+        pipeline (Callable[[Any], Any]): the callable to run on every text
+        loaders (Tuple[Callable[[], Any], ...]): the loaders of the resources the pipeline uses
+    """
+    global _worker_pipeline
+    _worker_pipeline = pipeline
+    for loader in loaders:
+        loader()
+
+
+def _run_chunk(chunk: List[Any]) -> List[Any]:
+    return [_worker_pipeline(text) for text in chunk]
+
+
+def _parallel_run(worker_callable: Callable[[Any], Any], pipeline: Callable[[Any], Any], text_list: List[Any],
+                  n_workers: int, chunk_size: Optional[int]) -> List[Any]:
+    """
+    [Private function] Runs a callable on every text in a pool of processes.
+
+    Args:
+        worker_callable (Callable[[Any], Any]): the picklable callable every worker runs on its texts
+        pipeline (Callable[[Any], Any]): the pipeline of the callable, whose resources the workers load
+        text_list (List[Any]): the texts
+        n_workers (int): the number of processes
+        chunk_size (Optional[int]): the number of texts sent to a worker at once, or None for four chunks per worker
+
+    Returns:
+        List[Any]: the results in the order of the texts
+    """
+    if chunk_size is None:
+        chunk_size = max(1, math.ceil(len(text_list) / (n_workers * 4)))
+    chunks = [text_list[start:start + chunk_size] for start in range(0, len(text_list), chunk_size)]
+
+    loaders = _pipeline_resources(pipeline)
+    for loader in loaders:
+        if loader in _PARENT_PREPARATIONS:
+            _PARENT_PREPARATIONS[loader]()
+
+    # No more processes than chunks are started, and map returns the chunks in the order they were submitted
+    with ProcessPoolExecutor(max_workers=min(n_workers, len(chunks)), initializer=_init_worker,
+                             initargs=(worker_callable, loaders)) as executor:
+        return [result for chunk_results in executor.map(_run_chunk, chunks) for result in chunk_results]
+
+
+def _cached_parallel_run(pipeline: Pipeline, text_list: List[Any], n_workers: int, chunk_size: Optional[int]) -> List[Any]:
+    """
+    [Private function] Runs a pipeline with a cache in a pool of processes. The parent looks every text up in the
+    cache, only the distinct texts that miss go to the workers, and their entries are stored back in the cache of
+    the parent, so the results and the statistics are the ones of running the texts one by one.
+
+    Args:
+        pipeline (Pipeline): a pipeline with a cache
+        text_list (List[Any]): the texts
+        n_workers (int): the number of processes
+        chunk_size (Optional[int]): the number of texts sent to a worker at once, or None for four chunks per worker
+
+    Returns:
+        List[Any]: the cleaned texts in the order of the texts, None for the texts that are not strings
+    """
+    cache = pipeline.cache
+    keys = [ResultCache.key(pipeline.fingerprint, text) if isinstance(text, str) else None for text in text_list]
+
+    # The first copy of a text looks it up; the later copies are looked up once it is computed, like hits
+    entries: Dict[Any, Any] = {}
+    missing_texts: Dict[Any, str] = {}
+    for text, key in zip(text_list, keys):
+        if key is not None and key not in entries and key not in missing_texts:
+            entry = cache.get(key)
+            if entry is None:
+                missing_texts[key] = text
+            else:
+                entries[key] = entry
+
+    # The workers run the steps without a cache and send back the entries of the texts
+    if missing_texts:
+        computed_entries = _parallel_run(pipeline.run_uncached, pipeline, list(missing_texts.values()), n_workers, chunk_size)
+        for key, entry in zip(missing_texts, computed_entries):
+            cache.put(key, entry)
+            entries[key] = entry
+
+    results: List[Any] = []
+    first_copies = set(entries)
+    for key in keys:
+        if key is None:
+            results.append(None)
+        elif key in first_copies:
+            first_copies.discard(key)
+            results.append(entries[key][0])
+        else:
+            # A later copy; the entry of the batch stays valid if the cache evicted it in the meantime
+            cache.get(key)
+            results.append(entries[key][0])
+
+    return results
+
+
+def parallel_apply(pipeline: Callable[[Any], Any], texts: Union[Sequence[Any], pd.Series], n_workers: Optional[int] = None,
+                   chunk_size: Optional[int] = None) -> Union[List[Any], pd.Series]:
+    """
+    Runs a pipeline on every text in a pool of processes and returns the results in the order of the texts.
+
+    Example:
+        pipeline = Pipeline([to_lower, remove_url, remove_punctuation, to_strip])
+        clean_texts = parallel_apply(pipeline, texts, n_workers=4)
+
+    Note:
+        The pipeline is sent to every worker once, so it must be picklable: a Pipeline of the text_preprocessing
+        functions or any module-level function works, a lambda does not. With n_workers=1 the texts are processed
+        in the calling process without a pool. Every worker loads the resources of the steps of the pipeline (e.g.
+        the dictionary of a spelling step) before its first chunk, and nothing else. With the ResultCache of a
+        Pipeline, the cache stays in the calling process and only the distinct texts that miss it are sent to the
+        workers.
+
+    Args:
+        pipeline (Callable[[Any], Any]): a Pipeline or any picklable callable that takes a single text
+        texts (Union[Sequence[Any], pd.Series]): the texts to be processed
+        n_workers (Optional[int], optional): the number of processes. Defaults to the number of CPUs.
+        chunk_size (Optional[int], optional): the number of texts sent to a worker at once. Defaults to splitting
+            the texts into four chunks per worker.
+
+    Raises:
+        TypeError: if the pipeline is not callable
+        ValueError: if n_workers or chunk_size is not a positive integer
+
+    Returns:
+        Union[List[Any], pd.Series]: the results in the order of the texts, as a Series with the same index if the
+            texts are a Series
+    """
+    # Input checking
+    if not callable(pipeline):
+        raise TypeError(f"pipeline must be callable. Got {type(pipeline)}")
+
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    if not isinstance(n_workers, int) or n_workers < 1:
+        raise ValueError(f"n_workers must be a positive integer. Got {n_workers!r}")
+
+    if chunk_size is not None and (not isinstance(chunk_size, int) or chunk_size < 1):
+        raise ValueError(f"chunk_size must be a positive integer. Got {chunk_size!r}")
+
+    text_list = texts.tolist() if isinstance(texts, pd.Series) else list(texts)
+
+    if n_workers == 1 or len(text_list) == 0:
+        results = [pipeline(text) for text in text_list]
+    elif isinstance(pipeline, Pipeline) and pipeline.cache is not None:
+        results = _cached_parallel_run(pipeline, text_list, n_workers, chunk_size)
+    else:
+        results = _parallel_run(pipeline, pipeline, text_list, n_workers, chunk_size)
+
+    if isinstance(texts, pd.Series):
+        return pd.Series(results, index=texts.index, name=texts.name, dtype=object)
+
+    return results
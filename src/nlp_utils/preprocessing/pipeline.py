@@ -0,0 +1,406 @@
+"""Module providing a compiled, composable chain of the text cleaning functions."""
+# ───────────────────────────────── Imports ────────────────────────────────── #
+# Standard Library
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import functools
+import hashlib
+import re
+import numpy as np
+import pandas as pd
+
+# 3rd Party
+
+# Private
+from nlp_utils.preprocessing import text_preprocessing as tp
+from nlp_utils.preprocessing.result_cache import ResultCache
+
+# ───────────────────────────────── Code ────────────────────────────────── #
+
+# A step is either a cleaning function or a (cleaning function, keyword arguments) tuple,
+# e.g. (remove_stopwords, {"stopwords": stopwords_nltk(["english"])})
+Step = Union[Callable, Tuple[Callable, Dict[str, Any]]]
+
+
+def _remove_entities_step(text: str, entities: Tuple[str, ...]) -> Tuple[str, int]:
+    text, counts = tp._remove_entities(text, entities)
+    return text, sum(counts.values())
+
+
+# Public cleaning function -> (unchecked kernel, whether the kernel also returns the number of matches)
+_STEP_KERNELS: Dict[Callable, Tuple[Callable, bool]] = {
+    tp.remove_xml: (tp._remove_xml, True),
+    tp.to_lower: (tp._to_lower, False),
+    tp.remove_number: (tp._remove_number, False),
+    tp.to_strip: (tp._to_strip, False),
+    tp.remove_any_char: (tp._remove_any_char, True),
+    tp.remove_all_duplication: (tp._remove_all_duplication, False),
+    tp.remove_consecutive_duplication: (tp._remove_consecutive_duplication, False),
+    tp.remove_many_spaces: (tp._remove_many_spaces, False),
+    tp.remove_emoji: (tp._remove_emoji, True),
+    tp.remove_url: (tp._remove_url, True),
+    tp.remove_twitter_username: (tp._remove_twitter_username, True),
+    tp.remove_username: (tp._remove_username, True),
+    tp.remove_hashtag: (tp._remove_hashtag, True),
+    tp.remove_email_address: (tp._remove_email_address, True),
+    tp.remove_entities: (_remove_entities_step, True),
+    tp.remove_special_char: (tp._remove_special_char, True),
+    tp.expand_contractions: (tp._expand_contractions, False),
+    tp.remove_stopwords: (tp._remove_stopwords, False),
+    tp.remove_emoticon: (tp._remove_emoticon, True),
+    tp.abbreviation_converter: (tp._abbreviation_converter, False),
+    tp.remove_punctuation: (tp._remove_punctuation, False),
+    tp.to_lemmatize: (tp._to_lemmatize, False),
+    tp.remove_regex_match: (tp._remove_regex_match, False),
+    tp.substitue_regex_match: (tp._substitue_regex_match, False),
+    tp.convert_emoticon_to_words: (tp._convert_emoticon_to_words, False),
+    tp.convert_emoji_to_words: (tp._convert_emoji_to_words, False),
+    tp.spell_correction_v1: (tp._spell_correction_v1, False),
+    tp.spell_correction_v2: (tp._spell_correction_v2, False),
+}
+
+
+# The word-level steps that can run on a list of tokens: the text of consecutive ones is split once, the steps run
+# on the tokens and the tokens are joined once. Public cleaning function -> (token kernel, kind), where the kind
+# tells when the fused steps give the same text as the string kernels:
+#   "split": the string kernel is " ".join(token kernel(text.split()))
+#   "spaced": the same, but only on a text whose words are separated by single spaces
+#   "whitespace": the step only changes the whitespace, which the join of the tokens normalizes anyway
+_TOKEN_KERNELS: Dict[Callable, Tuple[Callable, str]] = {
+    tp.to_strip: (list, "split"),
+    tp.remove_all_duplication: (tp._remove_duplicate_tokens, "split"),
+    tp.remove_stopwords: (tp._remove_stopword_tokens, "split"),
+    tp.to_lemmatize: (tp._lemmatize_tokens, "split"),
+    tp.remove_consecutive_duplication: (tp._remove_consecutive_duplicate_tokens, "spaced"),
+    tp.remove_many_spaces: (list, "whitespace"),
+}
+
+
+def _run_token_steps(text: str, token_kernels: Tuple[Callable, ...]) -> str:
+    tokens = text.split()
+    for token_kernel in token_kernels:
+        tokens = token_kernel(tokens)
+    return " ".join(tokens)
+
+
+def _fuse_token_steps(kinds: List[Optional[str]]) -> List[Tuple[int, int]]:
+    """
+    [Private function] Finds the runs of consecutive steps that run on the tokens of the text.
+
+    Args:
+        kinds (List[Optional[str]]): the kind of the token kernel of every step, None if it has none
+
+    Returns:
+        List[Tuple[int, int]]: the (start, end) of every run that gives the same text as its string steps
+    """
+    runs = []
+    start = 0
+    while start < len(kinds):
+        if kinds[start] is None:
+            start += 1
+            continue
+
+        end = start
+        while end < len(kinds) and kinds[end] is not None:
+            end += 1
+
+        # A spaced step needs a text of single spaces, so the steps before the first split or whitespace step
+        # run on the string
+        fused_start = start
+        while fused_start < end and kinds[fused_start] == "spaced":
+            fused_start += 1
+
+        # The joined tokens are only the text of the string steps if one of them splits and joins it too
+        if end - fused_start > 1 and "split" in kinds[fused_start:end]:
+            runs.append((fused_start, end))
+        start = end
+
+    return runs
+
+
+def _check_step_arguments(func: Callable, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    [Private function] Validates the extra arguments of a step once, instead of on every text.
+
+    Args:
+        func (Callable): a public cleaning function
+        kwargs (Dict[str, Any]): the keyword arguments given for the step
+
+    Raises:
+        ValueError: if an argument would make the public function reject every text
+
+    Returns:
+        Dict[str, Any]: the keyword arguments that will be bound to the kernel
+    """
+    if func is tp.remove_stopwords:
+        stopwords = kwargs.get("stopwords")
+        if not isinstance(stopwords, (set, frozenset)):
+            raise ValueError(f"remove_stopwords needs a set of stopwords. Got {type(stopwords)}")
+
+    elif func is tp.remove_entities:
+        entities = tuple(kwargs.get("entities", tp.ENTITY_PATTERNS))
+        unknown_entities = set(entities) - set(tp.ENTITY_PATTERNS)
+        if unknown_entities:
+            raise ValueError(f"Unsupported entities: {unknown_entities}. Choose from {list(tp.ENTITY_PATTERNS)}")
+        kwargs = dict(kwargs, entities=entities)
+
+    elif func is tp.remove_special_char:
+        special_char = kwargs.get("special_char")
+        if not isinstance(special_char, list):
+            raise ValueError(f"remove_special_char needs a list of characters. Got {type(special_char)}")
+
+    elif func in (tp.remove_regex_match, tp.substitue_regex_match):
+        regex = kwargs.get("regex")
+        if not tp.regex_validation_checker(regex):
+            raise ValueError(f"{func.__name__} needs a valid regular expression. Got {regex!r}")
+        if func is tp.substitue_regex_match and not isinstance(kwargs.get("sub_text"), str):
+            raise ValueError(f"substitue_regex_match needs a string to substitute. Got {type(kwargs.get('sub_text'))}")
+
+        # The pattern is compiled here once rather than looked up in the re cache for every text
+        kwargs = dict(kwargs, regex=tp._compile_user_regex(regex))
+
+    return kwargs
+
+
+def _canonical(value: Any) -> str:
+    """
+    [Private function] Describes the argument of a step with the same string for the same configuration, whatever
+    the order of the elements of a set or the process.
+
+    Args:
+        value (Any): a cleaning function or one of its arguments
+
+    Returns:
+        str: the description of the value
+    """
+    if isinstance(value, (set, frozenset)):
+        return "{" + ",".join(sorted(map(_canonical, value))) + "}"
+    if isinstance(value, (list, tuple)):
+        return f"{type(value).__name__}(" + ",".join(map(_canonical, value)) + ")"
+    if isinstance(value, dict):
+        return "{" + ",".join(sorted(f"{_canonical(key)}:{_canonical(item)}" for key, item in value.items())) + "}"
+    if isinstance(value, re.Pattern):
+        return f"re({value.pattern!r},{value.flags})"
+    if isinstance(value, functools.partial):
+        return f"partial({_canonical(value.func)},{_canonical(value.args)},{_canonical(value.keywords)})"
+    if callable(value):
+        name = f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', type(value).__qualname__)}"
+        # Two lambdas or local functions share a name, so the object itself tells them apart
+        return name if "<" not in name else f"{name}@{id(value):x}"
+    return repr(value)
+
+
+def _fingerprint(steps: List[Step]) -> str:
+    """
+    [Private function] Hashes the configuration of a chain of steps, which keys the cached results of its texts.
+
+    Args:
+        steps (List[Step]): the ordered cleaning steps
+
+    Returns:
+        str: the hexadecimal BLAKE2 digest of the steps and their arguments
+    """
+    description = _canonical([step if isinstance(step, tuple) else (step, {}) for step in steps])
+    return hashlib.blake2b(description.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+
+
+class Pipeline():
+    """
+    An ordered chain of text cleaning steps. The input text is checked once for the whole chain and the
+    steps run on their unchecked kernels, so no step repeats the pd.isnull/isinstance guard and the
+    (text, count) tuples of the counting steps never reach the caller.
+
+    Consecutive word-level steps (to_strip, remove_many_spaces, remove_all_duplication,
+    remove_consecutive_duplication, remove_stopwords and to_lemmatize) share one tokenization: the text is split
+    once, the steps run on its tokens and the tokens are joined once, with the same result as the steps one by one.
+
+    With a ResultCache, the cleaned text and the counts of every text are kept under the fingerprint of the steps
+    and the digest of the text, so the copies of a text, e.g. the retweets, only run the steps once.
+
+    Example:
+        pipeline = Pipeline([to_lower, remove_url, (remove_special_char, {"special_char": ["#"]}), to_strip])
+        text = pipeline("Visit https://www.google.com #NOW")
+        text, counts = pipeline.run("Visit https://www.google.com #NOW", return_counts=True)
+    """
+
+    def __init__(self, steps: List[Step], cache: Optional[ResultCache] = None) -> None:
+        """
+        Constructs the pipeline and binds every step to its kernel.
+
+        Args:
+            steps (List[Step]): the ordered cleaning steps. Functions of the text_preprocessing module are bound
+                to their kernels; any other callable must take a string and return a string or a (string, int) tuple.
+            cache (Optional[ResultCache], optional): the cache of the results, which several pipelines can share.
+                Defaults to None, running the steps on every text. A step whose result does not only depend on the
+                text, e.g. a random one, must not be cached.
+
+        Raises:
+            TypeError: if steps is not a list, one of the steps is not callable or the cache is not a ResultCache
+            ValueError: if the arguments of a step are invalid
+        """
+        if not isinstance(steps, (list, tuple)):
+            raise TypeError(f"steps must be a list. Got {type(steps)}")
+        if cache is not None and not isinstance(cache, ResultCache):
+            raise TypeError(f"cache must be a ResultCache. Got {type(cache)}")
+
+        self.steps = list(steps)
+        self.cache = cache
+        self._kernels = [self._compile_step(step) for step in self.steps]
+        self._stages = self._compile_stages()
+        self.fingerprint = _fingerprint(self.steps)
+
+    @staticmethod
+    def _compile_step(step: Step) -> Tuple[Callable, Optional[bool]]:
+        """
+        [Private method] Resolves a step into a callable that only takes the text.
+
+        Args:
+            step (Step): a cleaning function or a (cleaning function, keyword arguments) tuple
+
+        Raises:
+            TypeError: if the step is not callable
+
+        Returns:
+            Tuple[Callable, Optional[bool]]: (the kernel, whether it returns the number of matches or None if unknown)
+        """
+        if isinstance(step, tuple):
+            func, kwargs = step
+        else:
+            func, kwargs = step, {}
+
+        if not callable(func):
+            raise TypeError(f"Every step must be callable. Got {type(func)}")
+
+        if func not in _STEP_KERNELS:
+            return (functools.partial(func, **kwargs) if kwargs else func), None
+
+        kernel, has_count = _STEP_KERNELS[func]
+        kwargs = _check_step_arguments(func, kwargs)
+
+        return (functools.partial(kernel, **kwargs) if kwargs else kernel), has_count
+
+    def _compile_stages(self) -> List[Tuple[Callable, Optional[bool], int]]:
+        """
+        [Private method] Fuses the runs of word-level steps into a single kernel that runs on the tokens.
+
+        Returns:
+            List[Tuple[Callable, Optional[bool], int]]: (the kernel, whether it returns the number of matches or None
+                if unknown, the index of its first step)
+        """
+        token_kernels: List[Optional[Callable]] = []
+        kinds: List[Optional[str]] = []
+        for step in self.steps:
+            func, kwargs = step if isinstance(step, tuple) else (step, {})
+            if func in _TOKEN_KERNELS:
+                token_kernel, kind = _TOKEN_KERNELS[func]
+                kwargs = _check_step_arguments(func, kwargs)
+                token_kernels.append(functools.partial(token_kernel, **kwargs) if kwargs else token_kernel)
+                kinds.append(kind)
+            else:
+                token_kernels.append(None)
+                kinds.append(None)
+
+        runs = dict(_fuse_token_steps(kinds))
+
+        stages = []
+        index = 0
+        while index < len(self._kernels):
+            if index in runs:
+                end = runs[index]
+                fused_kernel = functools.partial(_run_token_steps, token_kernels=tuple(token_kernels[index:end]))
+                stages.append((fused_kernel, False, index))
+                index = end
+            else:
+                kernel, has_count = self._kernels[index]
+                stages.append((kernel, has_count, index))
+                index += 1
+
+        return stages
+
+    @property
+    def step_names(self) -> List[str]:
+        names = []
+        for step in self.steps:
+            func = step[0] if isinstance(step, tuple) else step
+            names.append(getattr(func, "__name__", repr(func)))
+        return names
+
+    def __len__(self) -> int:
+        return len(self._kernels)
+
+    def __repr__(self) -> str:
+        return f"Pipeline(steps=[{', '.join(self.step_names)}])"
+
+    def _run_stages(self, text: str, counts: Optional[np.ndarray]) -> str:
+        """
+        [Private method] Runs all the stages on a valid text.
+
+        Args:
+            text (str): a text
+            counts (Optional[np.ndarray]): the array that gets the number of matches of every step, if any
+
+        Returns:
+            str: the cleaned text
+        """
+        for kernel, has_count, index in self._stages:
+            if has_count is False:
+                text = kernel(text)
+                continue
+
+            result = kernel(text)
+            if has_count or isinstance(result, tuple):
+                text, count = result
+                if counts is not None:
+                    counts[index] = count
+            else:
+                text = result
+
+        return text
+
+    def run_uncached(self, text: str) -> Tuple[str, np.ndarray]:
+        """
+        Runs all the steps on a valid text without the cache, e.g. in a worker of parallel_apply.
+
+        Args:
+            text (str): a text
+
+        Returns:
+            Tuple[str, np.ndarray]: (the cleaned text, the read-only number of matches per step), the entry of the
+                text in the cache
+        """
+        counts = np.zeros(len(self._kernels), dtype=np.int64)
+        text = self._run_stages(text, counts)
+        counts.flags.writeable = False
+        return text, counts
+
+    def run(self, text: Optional[str], return_counts: bool = False) -> Union[Optional[str], Tuple[Optional[str], np.ndarray]]:
+        """
+        Runs all the steps on the given text.
+
+        Args:
+            text (Optional[str]): a text to be cleaned
+            return_counts (bool, optional): also returns the number of matches of every step. Defaults to False.
+
+        Returns:
+            Union[Optional[str], Tuple[Optional[str], np.ndarray]]: the cleaned text, or (the cleaned text, the number
+                of matches per step) if return_counts is set. Steps that do not count matches report 0.
+        """
+        counts = np.zeros(len(self._kernels), dtype=np.int64) if return_counts else None
+
+        # Input checking
+        if pd.isnull(text) or not isinstance(text, str):
+            return (None, counts) if return_counts else None
+
+        if self.cache is None:
+            text = self._run_stages(text, counts)
+            return (text, counts) if return_counts else text
+
+        key = ResultCache.key(self.fingerprint, text)
+        entry = self.cache.get(key)
+        if entry is None:
+            entry = self.run_uncached(text)
+            self.cache.put(key, entry)
+
+        # The counts of the cache are shared by the copies of the text
+        return (entry[0], entry[1].copy()) if return_counts else entry[0]
+
+    __call__ = run
@@ -0,0 +1,304 @@
+"""Module providing lazy loaders of the assets and the heavy resources used by the preprocessing functions."""
+# ───────────────────────────────── Imports ────────────────────────────────── #
+# Standard Library
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, Optional, Tuple, Union
+import functools
+import importlib
+import importlib.resources
+import os
+import pickle
+import sys
+
+# 3rd Party
+
+# Private
+
+if TYPE_CHECKING:
+    from importlib.abc import Traversable
+    from spacy.language import Language
+
+# ───────────────────────────────── Code ────────────────────────────────── #
+# Every resource is loaded on its first use and then kept for the lifetime of the process, so importing the
+# preprocessing package stays cheap and a function only pays for what it needs. The assets are package data of
+# nlp_utils.preprocessing, so they are found from any working directory and in an installed package.
+
+# The directory of the files built from the resources on their first use, e.g. the SymSpell index
+CACHE_DIR = Path(os.environ.get("NLP_UTILS_CACHE_DIR", Path.home() / ".cache" / "nlp_utils"))
+
+
+def asset_path(file_name: str) -> Union["Traversable", Path]:
+    """
+    Returns a file of the assets directory of the package.
+
+    Args:
+        file_name (str): the name of the asset, e.g. "slang_words.txt"
+
+    Returns:
+        Union[Traversable, Path]: the asset, which can be opened with its open() method
+    """
+    # importlib.resources.files is only available from Python 3.9; on 3.8 the package is a directory of files
+    if sys.version_info < (3, 9):
+        return Path(__file__).resolve().parent / "assets" / file_name
+    return importlib.resources.files(__package__) / "assets" / file_name
+
+
+@functools.lru_cache(maxsize=None)
+def load_emoticon_dict() -> Dict[str, str]:
+    """
+    Loads the emoticons and their meanings, e.g. ":-)" -> "Happy face smiley".
+
+    See more:
+        https://medium.com/geekculture/text-preprocessing-how-to-handle-emoji-emoticon-641bbfa6e9e7
+
+    Returns:
+        Dict[str, str]: emoticon regex snippet -> meaning
+    """
+    with asset_path("Emoticon_Dict.p").open("rb") as emoticon_file:
+        return pickle.load(emoticon_file)
+
+
+@functools.lru_cache(maxsize=None)
+def load_slang_words() -> Dict[str, str]:
+    """
+    Loads the typos, slang and other short forms, e.g. "2moro" -> "tomorrow".
+
+    Returns:
+        Dict[str, str]: short form -> normal form
+    """
+    with asset_path("slang_words.txt").open("r", encoding="utf-8") as slang_file:
+        return dict(map(str.strip, line.partition('\t')[::2]) for line in slang_file if line.strip())
+
+
+@functools.lru_cache(maxsize=None)
+def load_unicode_emoji() -> Dict[str, str]:
+    """
+    Loads the emojis and their names from the emot library, e.g. "😂" -> ":face_with_tears_of_joy:".
+
+    Returns:
+        Dict[str, str]: emoji -> name
+    """
+    from emot.emo_unicode import UNICODE_EMOJI
+
+    return UNICODE_EMOJI
+
+
+@functools.lru_cache(maxsize=None)
+def get_spell_checker():
+    """
+    Returns the shared spell checker version 1 (https://github.com/barrust/pyspellchecker).
+    Building it loads the English word frequency list.
+
+    Returns:
+        SpellChecker: an English spell checker
+    """
+    from spellchecker import SpellChecker
+
+    return SpellChecker()
+
+
+def build_symspell_index(language: str = "en") -> Path:
+    """
+    Builds the SymSpell index of a language into CACHE_DIR unless it is already there. It takes a few seconds,
+    so a process pool builds it once in the parent before its workers load it. The file name has the version of
+    pyspellchecker, whose word frequency list the index is built from, so an upgrade builds a new index.
+
+    Args:
+        language (str, optional): a language of pyspellchecker. Defaults to "en".
+
+    Returns:
+        Path: the path of the index file
+    """
+    import spellchecker
+    from nlp_utils.preprocessing.symspell import FORMAT_VERSION, SymSpell
+
+    index_path = CACHE_DIR / f"symspell_{language}_v{FORMAT_VERSION}_pyspellchecker{spellchecker.__version__}.bin"
+    if not index_path.exists():
+        SymSpell.from_pyspellchecker(language).save(index_path)
+
+    return index_path
+
+
+@functools.lru_cache(maxsize=None)
+def get_symspell(language: str = "en"):
+    """
+    Returns the shared spell checker version 2, a SymSpell index built from the word frequency list of
+    pyspellchecker. The index is built on the first use (see build_symspell_index) and memory-mapped from then
+    on, so the worker processes of a pool share it instead of each building a dictionary.
+
+    Args:
+        language (str, optional): a language of pyspellchecker. Defaults to "en".
+
+    Returns:
+        SymSpell: a spell checker of the language
+    """
+    from nlp_utils.preprocessing.symspell import SymSpell
+
+    return SymSpell.load(build_symspell_index(language))
+
+
+@functools.lru_cache(maxsize=None)
+def load_autocorrect_words(lang: str) -> Dict[str, int]:
+    """
+    Loads the word frequency list of a language of the autocorrect library (https://github.com/filyp/autocorrect).
+    autocorrect downloads the list the first time a language is used.
+
+    Args:
+        lang (str): a language code of autocorrect, e.g. "en", "fr"
+
+    Raises:
+        NotImplementedError: if autocorrect does not support the language
+
+    Returns:
+        Dict[str, int]: word -> frequency
+    """
+    from autocorrect import load_from_tar
+
+    return load_from_tar(lang)
+
+
+@functools.lru_cache(maxsize=None)
+def get_speller(lang: str = "en", fast: bool = False):
+    """
+    Returns the shared autocorrect Speller of a language, built on its first use. The fast and the normal
+    Speller of a language share the same word frequency list.
+
+    Args:
+        lang (str, optional): a language code of autocorrect. Defaults to "en".
+        fast (bool, optional): only corrects single typos. Defaults to False.
+
+    Raises:
+        NotImplementedError: if autocorrect does not support the language
+
+    Returns:
+        Speller: a spell checker of the language
+    """
+    from autocorrect import Speller
+
+    return Speller(lang=lang, fast=fast, nlp_data=load_autocorrect_words(lang))
+
+
+@functools.lru_cache(maxsize=None)
+def get_language_detector_factory():
+    """
+    Returns the shared langdetect DetectorFactory with the profiles of all its languages, read on its first use.
+    Unlike langdetect.detect, it does not depend on the global seed of langdetect.
+
+    Returns:
+        DetectorFactory: a factory of language detectors
+    """
+    from langdetect.detector_factory import PROFILES_DIRECTORY, DetectorFactory
+
+    factory = DetectorFactory()
+    factory.load_profile(PROFILES_DIRECTORY)
+    return factory
+
+
+@functools.lru_cache(maxsize=None)
+def get_ngram_language_identifier():
+    """
+    Returns the shared n-gram language identifier, built from the langdetect profiles on its first use.
+
+    Returns:
+        NgramLanguageIdentifier: a vectorized language identifier
+    """
+    from nlp_utils.preprocessing.language_identifier import NgramLanguageIdentifier
+
+    return NgramLanguageIdentifier.from_langdetect()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_spacy_pipeline(pipeline_name: str, components: Optional[Tuple[str, ...]]) -> "Language":
+    import spacy
+
+    options = {} if components is None else {"enable": list(components)}
+    try:
+        return spacy.load(pipeline_name, **options)
+    except OSError:
+        # The pretrained pipeline is not installed yet; the new package is only found after the import caches are reset
+        spacy.cli.download(pipeline_name)
+        importlib.invalidate_caches()
+        return spacy.load(pipeline_name, **options)
+
+
+def get_spacy_pipeline(pipeline_name: str, components: Optional[Iterable[str]] = None) -> "Language":
+    """
+    Returns the shared spaCy pipeline of the given name and components, loaded on its first use and downloaded if
+    it is not installed. Every combination of components is loaded once per process.
+
+    Note:
+        The components that are not enabled are disabled, so nlp(text) and nlp.pipe do not run them, but spaCy
+        still loads them.
+
+    Args:
+        pipeline_name (str): a pretrained pipeline, e.g. "en_core_web_sm", or "blank:<lang>"
+        components (Optional[Iterable[str]], optional): the components to run, e.g. ["tok2vec", "tagger",
+            "attribute_ruler", "lemmatizer"]; an empty one only runs the tokenizer. Defaults to all the components.
+
+    Returns:
+        Language: a spaCy pipeline
+    """
+    # The order and the duplicates of the components do not make another pipeline
+    return _load_spacy_pipeline(pipeline_name, None if components is None else tuple(sorted(set(components))))
+
+
+def _nltk_stopwords_corpus():
+    import nltk
+    from nltk.corpus import stopwords as nltk_sw
+
+    try:
+        nltk.data.find("corpora/stopwords")
+    except LookupError:
+        nltk.download("stopwords")
+    return nltk_sw
+
+
+@functools.lru_cache(maxsize=None)
+def get_nltk_stopword_languages() -> FrozenSet[str]:
+    """
+    Returns the languages of the NLTK stopwords corpus, which is downloaded on its first use if it is missing.
+
+    Returns:
+        FrozenSet[str]: the lower case language names, e.g. "english"
+    """
+    return frozenset(_nltk_stopwords_corpus().fileids())
+
+
+@functools.lru_cache(maxsize=None)
+def get_nltk_stopwords(language: str) -> FrozenSet[str]:
+    """
+    Returns the NLTK stopwords of a language, read once per process.
+
+    Args:
+        language (str): a language of get_nltk_stopword_languages, e.g. "english"
+
+    Returns:
+        FrozenSet[str]: the stopwords of the language
+    """
+    return frozenset(_nltk_stopwords_corpus().words(language))
+
+
+@functools.lru_cache(maxsize=None)
+def get_lemmatizer():
+    """
+    Returns the shared WordNet lemmatizer. The WordNet corpus itself is read on the first lemmatization.
+
+    Returns:
+        WordNetLemmatizer: a lemmatizer
+    """
+    from nltk.stem import WordNetLemmatizer
+
+    return WordNetLemmatizer()
+
+
+@functools.lru_cache(maxsize=None)
+def get_wordnet_map() -> Dict[str, str]:
+    """
+    Returns the WordNet POS of the first letter of the Penn Treebank tags: Noun, Verb, Adjective and Adverb.
+
+    Returns:
+        Dict[str, str]: first letter of a Penn Treebank tag -> WordNet POS
+    """
+    from nltk.corpus import wordnet
+
+    return {"N": wordnet.NOUN, "V": wordnet.VERB, "J": wordnet.ADJ, "R": wordnet.ADV}
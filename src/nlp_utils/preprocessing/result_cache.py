@@ -0,0 +1,215 @@
+"""Module providing a size-bounded, content-addressed cache of the results of a preprocessing pipeline."""
+# ───────────────────────────────── Imports ────────────────────────────────── #
+# Standard Library
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, NamedTuple, Tuple
+import hashlib
+import threading
+
+# 3rd Party
+
+# Private
+
+# ───────────────────────────────── Code ────────────────────────────────── #
+# The retweets and the templated posts of a feed are the same texts over and over, and every copy would pay for
+# every step of the pipeline. A ResultCache keeps the result of a text under (the fingerprint of the pipeline
+# configuration, the digest of the text), so a copy costs a hash of the text and a dict lookup, and two pipelines
+# with different steps or arguments never share a result. The entries are bounded by max_size and evicted like
+# functools.lru_cache (the least recently used one) or by frequency (the least often used one, the oldest of them
+# on a tie), which keeps the templated posts that come back all day.
+#
+# Every operation holds a lock, so the threads of a batch can share a cache. A cache is local to its process: a
+# pickled cache, e.g. of a Pipeline sent to the workers of parallel_apply, is a new empty cache of the same size,
+# and parallel_apply looks the texts up in the cache of the parent instead (see parallel.parallel_apply).
+
+# The default number of entries of a cache
+RESULT_CACHE_SIZE = 2 ** 16
+
+# The eviction policies
+POLICIES = ("lru", "lfu")
+
+
+def text_digest(text: str) -> bytes:
+    """
+    Hashes a text into the key of its results, which takes 16 bytes whatever the length of the text.
+
+    Args:
+        text (str): a text
+
+    Returns:
+        bytes: the 128-bit BLAKE2 digest of the UTF-8 text
+    """
+    # surrogatepass keeps the lone surrogates of broken emoji distinct instead of raising
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class ResultCacheInfo(NamedTuple):
+    """The statistics of a ResultCache, like the CacheInfo of functools.lru_cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    max_size: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResultCache():
+    """
+    A thread-safe mapping of (pipeline fingerprint, text digest) keys to results with a bounded number of entries.
+
+    Example:
+        cache = ResultCache(max_size=100_000, policy="lfu")
+        pipeline = Pipeline([remove_url, to_lower, remove_punctuation, to_strip], cache=cache)
+        df["clean_text"] = parallel_apply(pipeline, df["text"], n_workers=4)
+        cache.info().hit_rate
+    """
+
+    def __init__(self, max_size: int = RESULT_CACHE_SIZE, policy: str = "lru") -> None:
+        """
+        Constructs an empty cache.
+
+        Args:
+            max_size (int, optional): the largest number of entries. Defaults to RESULT_CACHE_SIZE.
+            policy (str, optional): the eviction policy, "lru" (least recently used) or "lfu" (least frequently
+                used). Defaults to "lru".
+
+        Raises:
+            ValueError: if max_size is not a positive integer or the policy is unknown
+        """
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError(f"max_size must be a positive integer. Got {max_size!r}")
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {POLICIES}. Got {policy!r}")
+
+        self.max_size = max_size
+        self.policy = policy
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        # LRU: the entries from the least recently used one
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        # LFU: key -> number of uses, and number of uses -> the keys from the least recently used one
+        self._frequencies: Dict[Hashable, int] = {}
+        self._buckets: Dict[int, "OrderedDict[Hashable, None]"] = {}
+        self._min_frequency = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # The lock cannot be pickled, and the entries of another process are not worth sending
+        return type(self), (self.max_size, self.policy)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(max_size={self.max_size}, policy={self.policy!r}, size={len(self._entries)})"
+
+    @staticmethod
+    def key(fingerprint: str, text: str) -> Tuple[str, bytes]:
+        return fingerprint, text_digest(text)
+
+    def _touch(self, key: Hashable) -> None:
+        """
+        [Private method] Records a use of a key that is in the cache. The lock must be held.
+
+        Args:
+            key (Hashable): a key of the cache
+        """
+        if self.policy == "lru":
+            self._entries.move_to_end(key)
+            return
+
+        frequency = self._frequencies[key]
+        bucket = self._buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[frequency]
+            if self._min_frequency == frequency:
+                self._min_frequency = frequency + 1
+
+        self._frequencies[key] = frequency + 1
+        self._buckets.setdefault(frequency + 1, OrderedDict())[key] = None
+
+    def _evict(self) -> None:
+        """
+        [Private method] Removes the entry the policy chooses. The lock must be held.
+        """
+        if self.policy == "lru":
+            self._entries.popitem(last=False)
+        else:
+            bucket = self._buckets[self._min_frequency]
+            key, _ = bucket.popitem(last=False)
+            if not bucket:
+                del self._buckets[self._min_frequency]
+            del self._frequencies[key]
+            del self._entries[key]
+
+        self._evictions += 1
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Finds the result of a key and records the lookup in the statistics.
+
+        Args:
+            key (Hashable): a key, e.g. ResultCache.key(pipeline.fingerprint, text)
+            default (Any, optional): the result of a missing key. Defaults to None.
+
+        Returns:
+            Any: the result of the key, or default
+        """
+        with self._lock:
+            if key not in self._entries:
+                self._misses += 1
+                return default
+
+            self._hits += 1
+            self._touch(key)
+            return self._entries[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Stores the result of a key, evicting an entry if the cache is full.
+
+        Args:
+            key (Hashable): a key, e.g. ResultCache.key(pipeline.fingerprint, text)
+            value (Any): its result, which should not be changed afterwards
+        """
+        with self._lock:
+            if key in self._entries:
+                # Another thread computed the same text in the meantime
+                self._entries[key] = value
+                self._touch(key)
+                return
+
+            if len(self._entries) >= self.max_size:
+                self._evict()
+
+            self._entries[key] = value
+            if self.policy == "lfu":
+                self._frequencies[key] = 1
+                self._buckets.setdefault(1, OrderedDict())[key] = None
+                self._min_frequency = 1
+
+    def info(self) -> ResultCacheInfo:
+        with self._lock:
+            return ResultCacheInfo(self._hits, self._misses, self._evictions, self.max_size, len(self._entries))
+
+    def clear(self) -> None:
+        """
+        Removes all the entries and resets the statistics.
+        """
+        with self._lock:
+            self._reset()
+
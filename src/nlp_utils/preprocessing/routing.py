@@ -0,0 +1,212 @@
+"""Module providing a router that preprocesses a multilingual Series one language at a time."""
+# ───────────────────────────────── Imports ────────────────────────────────── #
+# Standard Library
+from typing import TYPE_CHECKING, Dict, FrozenSet, Optional, Sequence, Tuple, Union
+import numpy as np
+import pandas as pd
+
+# 3rd Party
+
+# Private
+from nlp_utils.preprocessing import batch_preprocessing as bp
+from nlp_utils.preprocessing import text_preprocessing as tp
+
+if TYPE_CHECKING:
+    from spacy.language import Language
+
+# ───────────────────────────────── Code ────────────────────────────────── #
+
+# langdetect code -> (language of the NLTK stopwords, language of pipeline_selector_spacy), None if there is none
+ROUTED_LANGUAGES: Dict[str, Tuple[Optional[str], Optional[str]]] = {
+    "ar": ("arabic", None), "bn": ("bengali", None), "ca": ("catalan", "Catalan"), "cs": (None, None),
+    "da": ("danish", "Danish"), "de": ("german", "German"), "el": ("greek", "Greek"), "en": ("english", "English"),
+    "es": ("spanish", "Spanish"), "fi": ("finnish", "Finnish"), "fr": ("french", "French"), "he": ("hebrew", None),
+    "hr": (None, "Croatian"), "hu": ("hungarian", None), "id": ("indonesian", None), "it": ("italian", "Italian"),
+    "ja": (None, "Japanese"), "ko": (None, "Korean"), "lt": (None, "Lithuanian"), "mk": (None, "Macedonian"),
+    "ne": ("nepali", None), "nl": ("dutch", "Dutch"), "no": ("norwegian", "Norwegian Bokmål"), "pl": (None, "Polish"),
+    "pt": ("portuguese", "Portuguese"), "ro": ("romanian", "Romanian"), "ru": ("russian", "Russian"),
+    "sl": ("slovene", None), "sv": ("swedish", "Swedish"), "tr": ("turkish", None), "uk": (None, "Ukrainian"),
+    "zh-cn": ("chinese", "Chinese"), "zh-tw": ("chinese", "Chinese"),
+}
+
+# The components a spaCy pipeline needs for the lemmas: the rule-based lemmatizers read the POS of the tagger or
+# of the morphologizer. The components a pipeline does not have are ignored.
+LEMMATIZER_COMPONENTS = ("tok2vec", "tagger", "morphologizer", "attribute_ruler", "lemmatizer", "trainable_lemmatizer")
+
+
+class LanguageRouter():
+    """
+    Preprocesses a multilingual Series language by language. The language of every row is detected once, the
+    rows are grouped by language, and each group goes through the spell checker, the spaCy lemmatizer and the
+    stopwords of its language as a single batch. The results are put back in the order of the rows.
+
+    Note:
+        The resources of a language (the Speller, the spaCy pipeline and the stopwords) are loaded once per process
+        and looked up once per group, instead of once per row. A step is skipped for a language that has no such
+        resource, e.g. the spell checker of autocorrect for Dutch, and the rows whose language is unknown are kept
+        as they are.
+
+    Example:
+        router = LanguageRouter(spell_correction=True, lemmatize=True, remove_stopwords=True)
+        clean_series, languages = router(df["text"])
+    """
+
+    def __init__(self, spell_correction: bool = True, lemmatize: bool = True, remove_stopwords: bool = True,
+                 detector: str = "langdetect", pipeline_size: str = "small", batch_size: int = 1000, n_process: int = 1,
+                 fast_speller: bool = False) -> None:
+        """
+        Constructs the router.
+
+        Args:
+            spell_correction (bool, optional): corrects the texts with the Speller of their language. Defaults to True.
+            lemmatize (bool, optional): lemmatizes the texts with the spaCy pipeline of their language. Defaults to True.
+            remove_stopwords (bool, optional): removes the NLTK stopwords of their language. Defaults to True.
+            detector (str, optional): the detector of the texts the script does not decide, "langdetect" or "ngram"
+                (see script_routed_language_detection_batch). Defaults to "langdetect".
+            pipeline_size (str, optional): the size of the spaCy pipelines, "small", "medium", "large" or
+                "transformer". Defaults to "small".
+            batch_size (int, optional): the number of texts spaCy processes at once. Defaults to 1000.
+            n_process (int, optional): the number of processes of spaCy. Defaults to 1.
+            fast_speller (bool, optional): the Spellers only correct single typos. Defaults to False.
+
+        Raises:
+            ValueError: if the detector or the pipeline size is unknown
+        """
+        if detector not in ("langdetect", "ngram"):
+            raise ValueError(f"detector must be 'langdetect' or 'ngram'. Got {detector!r}")
+        if tp.pipeline_size_str_conv_spacy(pipeline_size) is None:
+            raise ValueError(f"pipeline_size must be 'small', 'medium', 'large' or 'transformer'. Got {pipeline_size!r}")
+
+        self.spell_correction = spell_correction
+        self.lemmatize = lemmatize
+        self.remove_stopwords = remove_stopwords
+        self.detector = detector
+        self.pipeline_size = pipeline_size
+        self.batch_size = batch_size
+        self.n_process = n_process
+        self.fast_speller = fast_speller
+
+    def __repr__(self) -> str:
+        return (f"LanguageRouter(spell_correction={self.spell_correction}, lemmatize={self.lemmatize}, "
+                f"remove_stopwords={self.remove_stopwords}, detector={self.detector!r})")
+
+    def stopwords(self, language: str) -> Optional[FrozenSet[str]]:
+        """
+        Returns the NLTK stopwords of a language, the shared frozenset of stopwords_nltk.
+
+        Args:
+            language (str): a langdetect language code
+
+        Returns:
+            Optional[FrozenSet[str]]: the stopwords, or None if NLTK does not have the language
+        """
+        nltk_language = ROUTED_LANGUAGES.get(language, (None, None))[0]
+        if nltk_language is None:
+            return None
+        return tp.stopwords_nltk([nltk_language])
+
+    def spacy_pipeline(self, language: str) -> Optional["Language"]:
+        """
+        Returns the spaCy lemmatizer pipeline of a language (see pipeline_selector_spacy).
+
+        Args:
+            language (str): a langdetect language code
+
+        Returns:
+            Optional[Language]: the pipeline, or None if spaCy does not have the language
+        """
+        spacy_language = ROUTED_LANGUAGES.get(language, (None, None))[1]
+        if spacy_language is None:
+            return None
+        return tp.pipeline_selector_spacy(spacy_language, self.pipeline_size, components=LEMMATIZER_COMPONENTS)
+
+    def spell_checker(self, language: str) -> Optional[tp.Spell_checker_v1]:
+        """
+        Returns the spell checker of a language.
+
+        Args:
+            language (str): a langdetect language code
+
+        Returns:
+            Optional[Spell_checker_v1]: the spell checker, or None if autocorrect does not have the language
+        """
+        if tp._autocorrect_language(language) is None:
+            return None
+        return tp.Spell_checker_v1(language, self.fast_speller)
+
+    def _process_group(self, language: str, group_series: pd.Series) -> pd.Series:
+        """
+        [Private method] Runs the steps of a language on its texts.
+
+        Args:
+            language (str): the langdetect code of the texts
+            group_series (pd.Series): texts that are strings, all in that language
+
+        Returns:
+            pd.Series: the processed texts, on the same index
+        """
+        if self.spell_correction:
+            spell_checker = self.spell_checker(language)
+            if spell_checker is not None:
+                group_series = spell_checker.autocorrect_series(group_series)
+
+        if self.lemmatize:
+            nlp = self.spacy_pipeline(language)
+            if nlp is not None:
+                docs = tp.pipe_spacy(group_series.values, nlp, batch_size=self.batch_size, n_process=self.n_process)
+                lemmatized_texts = ["".join([token.lemma_ + token.whitespace_ for token in doc]) for doc in docs]
+                group_series = pd.Series(lemmatized_texts, index=group_series.index, name=group_series.name, dtype=object)
+
+        if self.remove_stopwords:
+            stopwords = self.stopwords(language)
+            if stopwords is not None:
+                group_series = bp.remove_stopwords_batch(group_series, stopwords)
+
+        return group_series
+
+    def run(self, text_series: Optional[pd.Series],
+            languages: Optional[Union[Sequence[Optional[str]], pd.Series]] = None) -> Tuple[Optional[pd.Series], Optional[pd.Series]]:
+        """
+        Preprocesses every text with the resources of its language.
+
+        Args:
+            text_series (Optional[pd.Series]): a text series in any languages
+            languages (Optional[Union[Sequence[Optional[str]], pd.Series]], optional): the langdetect code of every
+                text, if it is already known. Defaults to detecting it.
+
+        Raises:
+            ValueError: if there is not one language per text
+
+        Returns:
+            Tuple[Optional[pd.Series], Optional[pd.Series]]: (the processed texts, the language of every text), None
+                for the rows that are not strings
+        """
+        # Input checking
+        if not isinstance(text_series, pd.Series):
+            return None, None
+
+        if languages is None:
+            language_series, _ = bp.script_routed_language_detection_batch(text_series, detector=self.detector)
+        else:
+            if len(languages) != len(text_series):
+                raise ValueError(f"languages must have one language per text. Got {len(languages)} for {len(text_series)} texts")
+            language_series = pd.Series(list(languages), index=text_series.index, name=text_series.name, dtype=object)
+
+        mask = bp._valid_text_mask(text_series)
+        language_series[~mask] = None
+        texts = np.full(len(text_series), None, dtype=object)
+        texts[mask] = text_series.values[mask]
+
+        # One batch per language; the rows of a language keep their order inside the group
+        positions_by_language: Dict[str, list] = {}
+        for position, language in zip(np.flatnonzero(mask), language_series.values[mask]):
+            if isinstance(language, str):
+                positions_by_language.setdefault(language, []).append(position)
+
+        for language, positions in positions_by_language.items():
+            processed_series = self._process_group(language, text_series.iloc[positions])
+            texts[positions] = processed_series.values
+
+        return bp._to_series(texts, text_series), language_series
+
+    __call__ = run
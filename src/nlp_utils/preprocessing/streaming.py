@@ -0,0 +1,120 @@
+"""Module providing file-to-file preprocessing that streams the records instead of loading the whole file."""
+# ───────────────────────────────── Imports ────────────────────────────────── #
+# Standard Library
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Union
+import pandas as pd
+
+# 3rd Party
+
+# Private
+
+# ───────────────────────────────── Code ────────────────────────────────── #
+# The files are read with pd.read_csv(chunksize=...), which parses quoted multi-line records (e.g. the tweets of
+# Datasets/Twitter_Detected_Languages.csv) correctly and only keeps one chunk of rows in memory at a time.
+
+PathLike = Union[str, Path]
+
+
+def read_text_chunks(input_path: PathLike, chunk_size: int = 10_000, **read_csv_kwargs: Any) -> Iterator[pd.DataFrame]:
+    """
+    Lazily reads a CSV/TSV file chunk by chunk.
+
+    Example:
+        for chunk in read_text_chunks("Datasets/Twitter_DS_emotion.txt", sep="\t", header=None, names=["Index", "Text", "Feeling"]):
+            ...
+
+    Args:
+        input_path (PathLike): the path of the file
+        chunk_size (int, optional): the number of records per chunk. Defaults to 10_000.
+        **read_csv_kwargs (Any): passed to pd.read_csv, e.g. sep, header, names
+
+    Raises:
+        ValueError: if chunk_size is not a positive integer
+
+    Yields:
+        Iterator[pd.DataFrame]: the chunks of the file, in order
+    """
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError(f"chunk_size must be a positive integer. Got {chunk_size!r}")
+
+    with pd.read_csv(input_path, chunksize=chunk_size, **read_csv_kwargs) as reader:
+        for chunk in reader:
+            yield chunk
+
+
+def iter_preprocessed_chunks(pipeline: Callable[[Any], Any], input_path: PathLike, text_column: str,
+                             output_column: Optional[str] = None, chunk_size: int = 10_000,
+                             **read_csv_kwargs: Any) -> Iterator[pd.DataFrame]:
+    """
+    Lazily reads a CSV/TSV file and applies the pipeline to the text column of every record.
+
+    Args:
+        pipeline (Callable[[Any], Any]): a Pipeline or any callable that takes a single text
+        input_path (PathLike): the path of the file
+        text_column (str): the column that contains the texts
+        output_column (Optional[str], optional): the column of the results. Defaults to replacing the text column.
+        chunk_size (int, optional): the number of records per chunk. Defaults to 10_000.
+        **read_csv_kwargs (Any): passed to pd.read_csv, e.g. sep, header, names
+
+    Raises:
+        TypeError: if the pipeline is not callable
+        ValueError: if the file does not have the text column
+
+    Yields:
+        Iterator[pd.DataFrame]: the chunks of the file with the processed texts, in order
+    """
+    if not callable(pipeline):
+        raise TypeError(f"pipeline must be callable. Got {type(pipeline)}")
+
+    output_column = text_column if output_column is None else output_column
+
+    for chunk in read_text_chunks(input_path, chunk_size=chunk_size, **read_csv_kwargs):
+        if text_column not in chunk.columns:
+            raise ValueError(f"The file does not have the column {text_column!r}. Got {list(chunk.columns)}")
+
+        chunk[output_column] = [pipeline(text) for text in chunk[text_column].values]
+        yield chunk
+
+
+def stream_preprocess(pipeline: Callable[[Any], Any], input_path: PathLike, output_path: PathLike, text_column: str,
+                      output_column: Optional[str] = None, chunk_size: int = 10_000, sep: str = ",",
+                      output_sep: Optional[str] = None, write_header: bool = True, **read_csv_kwargs: Any) -> int:
+    """
+    Applies a pipeline to every record of a CSV/TSV file and writes the result to another file, one chunk at a time,
+    so the memory use depends on chunk_size and not on the size of the file.
+
+    Example:
+        pipeline = Pipeline([remove_url, remove_twitter_username, to_lower, remove_punctuation, to_strip])
+        stream_preprocess(pipeline, "Datasets/Twitter_DS_emotion.txt", "emotion_clean.tsv", text_column="Text",
+                          sep="\t", header=None, names=["Index", "Text", "Feeling"])
+
+    Args:
+        pipeline (Callable[[Any], Any]): a Pipeline or any callable that takes a single text
+        input_path (PathLike): the path of the input file
+        output_path (PathLike): the path of the output file, overwritten if it exists
+        text_column (str): the column that contains the texts
+        output_column (Optional[str], optional): the column of the results. Defaults to replacing the text column.
+        chunk_size (int, optional): the number of records read, processed and written at once. Defaults to 10_000.
+        sep (str, optional): the separator of the input file. Defaults to ",".
+        output_sep (Optional[str], optional): the separator of the output file. Defaults to sep.
+        write_header (bool, optional): writes the column names as the first line of the output. Defaults to True.
+        **read_csv_kwargs (Any): passed to pd.read_csv, e.g. header, names
+
+    Raises:
+        TypeError: if the pipeline is not callable
+        ValueError: if the file does not have the text column or chunk_size is not a positive integer
+
+    Returns:
+        int: the number of records written
+    """
+    output_sep = sep if output_sep is None else output_sep
+    n_records = 0
+
+    with open(output_path, "w", newline="", encoding="utf-8") as output_file:
+        for chunk in iter_preprocessed_chunks(pipeline, input_path, text_column, output_column=output_column,
+                                              chunk_size=chunk_size, sep=sep, **read_csv_kwargs):
+            chunk.to_csv(output_file, sep=output_sep, header=write_header and n_records == 0, index=False)
+            n_records += len(chunk)
+
+    return n_records
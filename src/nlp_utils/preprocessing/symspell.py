@@ -0,0 +1,483 @@
+"""Module providing a symmetric delete spell checker whose index is a file that worker processes memory-map."""
+# ───────────────────────────────── Imports ────────────────────────────────── #
+# Standard Library
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+import gzip
+import json
+import os
+import string
+import struct
+import tempfile
+import zlib
+import numpy as np
+
+# 3rd Party
+
+# Private
+
+# ───────────────────────────────── Code ────────────────────────────────── #
+# Symmetric delete spelling correction (https://github.com/wolfgarbe/SymSpell): two words are within edit distance d
+# only if they share a string obtained by deleting at most d characters from each of them. The deletes of every
+# dictionary word are precomputed, so a lookup only generates the deletes of the query and verifies the few words
+# found under them, instead of generating and checking every possible edit like pyspellchecker does.
+#
+# The index is a single little-endian file that is opened with np.memmap, so all the worker processes of a machine
+# share the same read-only pages instead of building their own dictionary:
+#
+#   header        magic, format version, max_distance, prefix_length, longest word, array sizes
+#   key_hashes    uint64[n_keys]       sorted hashes of the deletes
+#   key_offsets   int64[n_keys + 1]    postings of key i are postings[key_offsets[i]:key_offsets[i + 1]]
+#   postings      int32[n_postings]    word ids
+#   posting_levels uint8[n_postings]   number of characters deleted from the word to get the key
+#   word_hashes   uint64[n_words]      sorted hashes of the words, for the exact lookup
+#   word_hash_ids int32[n_words]       word id of every word hash
+#   word_counts   int64[n_words]       frequency of every word
+#   word_lengths  int16[n_words]       number of characters of every word
+#   word_offsets  int64[n_words + 1]   UTF-8 bytes of word i are word_blob[word_offsets[i]:word_offsets[i + 1]]
+#   word_blob     uint8[blob_size]
+
+MAGIC = b"SYMSPELL"
+FORMAT_VERSION = 2
+_HEADER = struct.Struct("<8s4I4Q")
+_HEADER_SIZE = 64
+
+PathLike = Union[str, Path]
+
+
+def _delete_hash(text: str) -> int:
+    # A stable 64-bit key: the CRC32 of the text and its length. A collision only adds a candidate that the
+    # edit distance check then rejects.
+    return zlib.crc32(text.encode("utf-8")) | (len(text) << 32)
+
+
+def _deletes(word: str, max_distance: int) -> Dict[str, int]:
+    """
+    [Private function] Returns the word and all the strings obtained by deleting up to max_distance characters.
+
+    Args:
+        word (str): a word
+        max_distance (int): the maximum number of deleted characters
+
+    Returns:
+        Dict[str, int]: delete -> the fewest characters deleted to get it, including the word itself with 0
+    """
+    deletes = {word: 0}
+    edits = {word}
+    for level in range(1, max_distance + 1):
+        edits = {edit[:i] + edit[i + 1:] for edit in edits for i in range(len(edit))}
+        for edit in edits:
+            deletes.setdefault(edit, level)
+    return deletes
+
+
+def _osa_distance(source: str, target: str, max_distance: int) -> int:
+    """
+    [Private function] Computes the optimal string alignment distance (insertions, deletions, substitutions and
+    transpositions of adjacent characters), the edits pyspellchecker uses.
+
+    Args:
+        source (str): a string
+        target (str): another string
+        max_distance (int): the distance above which the exact value is not needed
+
+    Returns:
+        int: the distance, or max_distance + 1 if it is larger than max_distance
+    """
+    # Only the part between the common prefix and the common suffix is aligned
+    start = 0
+    while start < len(source) and start < len(target) and source[start] == target[start]:
+        start += 1
+    source, target = source[start:], target[start:]
+    while source and target and source[-1] == target[-1]:
+        source, target = source[:-1], target[:-1]
+
+    if abs(len(source) - len(target)) > max_distance:
+        return max_distance + 1
+    if not source or not target:
+        return len(source) + len(target)
+
+    # Only the cells within max_distance of the diagonal can stay within max_distance. A cell outside the band
+    # keeps too_far, which is never more than its real value, so the cells within max_distance stay exact.
+    too_far = max_distance + 1
+    previous_previous_row = None
+    previous_row = list(range(len(target) + 1))
+    for i in range(1, len(source) + 1):
+        source_char = source[i - 1]
+        row = [too_far] * (len(target) + 1)
+        row[0] = i
+        row_min = i
+        for j in range(max(1, i - max_distance), min(len(target), i + max_distance) + 1):
+            distance = previous_row[j - 1] if source_char == target[j - 1] else previous_row[j - 1] + 1
+            if previous_row[j] + 1 < distance:
+                distance = previous_row[j] + 1
+            if row[j - 1] + 1 < distance:
+                distance = row[j - 1] + 1
+            if i > 1 and j > 1 and source_char == target[j - 2] and source[i - 2] == target[j - 1] \
+                    and previous_previous_row[j - 2] + 1 < distance:
+                distance = previous_previous_row[j - 2] + 1
+            row[j] = distance
+            if distance < row_min:
+                row_min = distance
+
+        if row_min > max_distance:
+            return too_far
+        previous_previous_row, previous_row = previous_row, row
+
+    return previous_row[-1] if previous_row[-1] < too_far else too_far
+
+
+class SymSpell():
+    """
+    A spell checker over a precomputed symmetric delete index. It gives the same kind of corrections as
+    pyspellchecker: the known words at the smallest edit distance, the most frequent one first.
+
+    Note:
+        The lookups are written in Python and NumPy, so an unknown word takes about 0.1-0.5 ms (a dictionary
+        word about 10 µs) instead of the sub-microsecond of a native SymSpell. That is still a few hundred times
+        faster than pyspellchecker, and spell_correction_v2 caches the corrections per word, so a repeated word
+        costs a dictionary lookup.
+
+    Example:
+        SymSpell.from_pyspellchecker("en").save("symspell_en.bin")
+        ...
+        symspell = SymSpell.load("symspell_en.bin")  # in every worker, memory-mapped
+        symspell.lookup("speling")  # "spelling"
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray], max_distance: int, prefix_length: int, longest_word_length: int) -> None:
+        """
+        Constructs the spell checker over the given index arrays. Use build, from_pyspellchecker or load instead.
+
+        Args:
+            arrays (Dict[str, np.ndarray]): the index arrays, see the layout at the top of the module
+            max_distance (int): the largest edit distance of the index
+            prefix_length (int): the number of leading characters of the words whose deletes are indexed
+            longest_word_length (int): the number of characters of the longest word
+        """
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.longest_word_length = longest_word_length
+
+        self._key_hashes = arrays["key_hashes"]
+        self._key_offsets = arrays["key_offsets"]
+        self._postings = arrays["postings"]
+        self._posting_levels = arrays["posting_levels"]
+        self._word_hashes = arrays["word_hashes"]
+        self._word_hash_ids = arrays["word_hash_ids"]
+        self._word_counts = arrays["word_counts"]
+        self._word_lengths = arrays["word_lengths"]
+        self._word_offsets = arrays["word_offsets"]
+        self._word_blob = arrays["word_blob"]
+        self._word_bytes = memoryview(self._word_blob)
+
+    # The order of the arrays in the file
+    _ARRAY_DTYPES: Tuple[Tuple[str, type], ...] = (
+        ("key_hashes", np.uint64),
+        ("key_offsets", np.int64),
+        ("postings", np.int32),
+        ("posting_levels", np.uint8),
+        ("word_hashes", np.uint64),
+        ("word_hash_ids", np.int32),
+        ("word_counts", np.int64),
+        ("word_lengths", np.int16),
+        ("word_offsets", np.int64),
+        ("word_blob", np.uint8),
+    )
+
+    @classmethod
+    def build(cls, word_counts: Dict[str, int], max_distance: int = 2, prefix_length: int = 7) -> "SymSpell":
+        """
+        Builds the index of a word frequency list in memory.
+
+        Args:
+            word_counts (Dict[str, int]): word -> frequency
+            max_distance (int, optional): the largest edit distance of the lookups. Defaults to 2.
+            prefix_length (int, optional): only the deletes of the first prefix_length characters of a word are
+                indexed, which keeps the index small; the candidates are still checked on the whole word. Defaults to 7.
+
+        Raises:
+            ValueError: if max_distance or prefix_length is invalid
+
+        Returns:
+            SymSpell: the spell checker
+        """
+        if not isinstance(max_distance, int) or max_distance < 0:
+            raise ValueError(f"max_distance must be a non-negative integer. Got {max_distance!r}")
+        if not isinstance(prefix_length, int) or prefix_length <= max_distance:
+            raise ValueError(f"prefix_length must be an integer larger than max_distance. Got {prefix_length!r}")
+
+        words = sorted(word for word in word_counts if word)
+
+        delete_hashes, delete_word_ids, delete_levels = array("Q"), array("i"), array("B")
+        for word_id, word in enumerate(words):
+            for delete, level in _deletes(word[:prefix_length], max_distance).items():
+                delete_hashes.append(_delete_hash(delete))
+                delete_word_ids.append(word_id)
+                delete_levels.append(level)
+
+        # Group the word ids by delete; the stable sort keeps the ids of a delete in increasing order
+        delete_hashes = np.frombuffer(delete_hashes, dtype=np.uint64)
+        order = np.argsort(delete_hashes, kind="stable")
+        delete_hashes = delete_hashes[order]
+        key_hashes, key_starts = np.unique(delete_hashes, return_index=True)
+
+        encoded_words = [word.encode("utf-8") for word in words]
+        word_hashes = np.fromiter((_delete_hash(word) for word in words), dtype=np.uint64, count=len(words))
+        word_hash_order = np.argsort(word_hashes, kind="stable")
+
+        arrays = {
+            "key_hashes": key_hashes,
+            "key_offsets": np.append(key_starts, len(delete_hashes)).astype(np.int64),
+            "postings": np.frombuffer(delete_word_ids, dtype=np.int32)[order],
+            "posting_levels": np.frombuffer(delete_levels, dtype=np.uint8)[order],
+            "word_hashes": word_hashes[word_hash_order],
+            "word_hash_ids": word_hash_order.astype(np.int32),
+            "word_counts": np.fromiter((word_counts[word] for word in words), dtype=np.int64, count=len(words)),
+            "word_lengths": np.fromiter((len(word) for word in words), dtype=np.int16, count=len(words)),
+            "word_offsets": np.cumsum([0] + [len(word) for word in encoded_words], dtype=np.int64),
+            "word_blob": np.frombuffer(b"".join(encoded_words), dtype=np.uint8),
+        }
+
+        return cls(arrays, max_distance, prefix_length, max((len(word) for word in words), default=0))
+
+    @classmethod
+    def from_pyspellchecker(cls, language: str = "en", max_distance: int = 2, prefix_length: int = 7) -> "SymSpell":
+        """
+        Builds the index of the word frequency list that pyspellchecker ships for the given language, so the
+        corrections stay comparable to spell_correction_v1.
+
+        Args:
+            language (str, optional): a language of pyspellchecker, e.g. "en", "es", "fr", "de". Defaults to "en".
+            max_distance (int, optional): the largest edit distance of the lookups. Defaults to 2.
+            prefix_length (int, optional): the number of indexed leading characters of a word. Defaults to 7.
+
+        Raises:
+            ValueError: if pyspellchecker does not have the language
+
+        Returns:
+            SymSpell: the spell checker
+        """
+        import spellchecker
+
+        frequency_path = Path(spellchecker.__file__).parent / "resources" / f"{language}.json.gz"
+        if not frequency_path.exists():
+            raise ValueError(f"pyspellchecker does not support the language {language!r}")
+
+        with gzip.open(frequency_path, "rt", encoding="utf-8") as frequency_file:
+            word_counts = json.load(frequency_file)
+
+        return cls.build(word_counts, max_distance=max_distance, prefix_length=prefix_length)
+
+    def save(self, path: PathLike) -> None:
+        """
+        Writes the index to a file. The file is written next to its destination and then renamed, so processes
+        that load it at the same time never see a partial file.
+
+        Args:
+            path (PathLike): the path of the index file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        arrays = [np.ascontiguousarray(getattr(self, "_" + name), dtype=dtype) for name, dtype in self._ARRAY_DTYPES]
+        header = _HEADER.pack(MAGIC, FORMAT_VERSION, self.max_distance, self.prefix_length, self.longest_word_length,
+                              len(self._word_counts), len(self._key_hashes), len(self._postings), len(self._word_blob))
+
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as index_file:
+                index_file.write(header.ljust(_HEADER_SIZE, b"\0"))
+                for values in arrays:
+                    index_file.write(values.tobytes())
+                    # Every array starts on an 8-byte boundary
+                    index_file.write(b"\0" * (-values.nbytes % 8))
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    @classmethod
+    def load(cls, path: PathLike) -> "SymSpell":
+        """
+        Memory-maps an index file read-only. Nothing is copied: the pages are read on demand and shared by all
+        the processes that load the same file.
+
+        Args:
+            path (PathLike): the path of the index file
+
+        Raises:
+            ValueError: if the file is not an index of this format version
+
+        Returns:
+            SymSpell: the spell checker
+        """
+        with open(path, "rb") as index_file:
+            header = index_file.read(_HEADER_SIZE)
+
+        if len(header) < _HEADER.size:
+            raise ValueError(f"{path} is not a SymSpell index")
+        magic, version, max_distance, prefix_length, longest_word_length, n_words, n_keys, n_postings, blob_size = _HEADER.unpack_from(header)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a SymSpell index of format version {FORMAT_VERSION}")
+
+        sizes = {
+            "key_hashes": n_keys, "key_offsets": n_keys + 1, "postings": n_postings, "posting_levels": n_postings,
+            "word_hashes": n_words, "word_hash_ids": n_words, "word_counts": n_words, "word_lengths": n_words,
+            "word_offsets": n_words + 1, "word_blob": blob_size,
+        }
+
+        arrays = {}
+        offset = _HEADER_SIZE
+        for name, dtype in cls._ARRAY_DTYPES:
+            nbytes = sizes[name] * np.dtype(dtype).itemsize
+            # A plain ndarray view of the mapping, indexing a np.memmap is noticeably slower
+            arrays[name] = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(sizes[name],)).view(np.ndarray) \
+                if nbytes else np.zeros(0, dtype=dtype)
+            offset += nbytes + (-nbytes % 8)
+
+        return cls(arrays, max_distance, prefix_length, longest_word_length)
+
+    def __len__(self) -> int:
+        return len(self._word_counts)
+
+    def __contains__(self, word: str) -> bool:
+        return self._word_id(word) is not None
+
+    def __repr__(self) -> str:
+        return f"SymSpell(n_words={len(self)}, max_distance={self.max_distance}, prefix_length={self.prefix_length})"
+
+    def _word(self, word_id: int) -> str:
+        return str(self._word_bytes[self._word_offsets[word_id]:self._word_offsets[word_id + 1]], "utf-8")
+
+    def _word_id(self, word: str) -> Optional[int]:
+        word_hash = _delete_hash(word)
+        position = int(np.searchsorted(self._word_hashes, np.uint64(word_hash)))
+        while position < len(self._word_hashes) and self._word_hashes[position] == word_hash:
+            word_id = int(self._word_hash_ids[position])
+            if self._word(word_id) == word:
+                return word_id
+            position += 1
+        return None
+
+    def word_count(self, word: str) -> int:
+        """
+        Returns the frequency of a word, 0 if the word is unknown.
+
+        Args:
+            word (str): a word
+
+        Returns:
+            int: the frequency of the word
+        """
+        word_id = self._word_id(word)
+        return 0 if word_id is None else int(self._word_counts[word_id])
+
+    def is_checkable(self, word: str) -> bool:
+        """
+        Tells whether a word should be spell checked, with the rules of pyspellchecker: single punctuation
+        characters, numbers and words much longer than any known word are not.
+
+        Args:
+            word (str): a word
+
+        Returns:
+            bool: True if the word should be checked
+        """
+        if len(word) == 1 and word in string.punctuation:
+            return False
+        if len(word) > self.longest_word_length + 3:
+            return False
+        if word.lower() in ("nan", "inf", "infinity"):
+            return True
+        try:
+            float(word)
+            return False
+        except ValueError:
+            return True
+
+    def _candidates(self, word: str, max_distance: int) -> List[Tuple[str, int, int]]:
+        """
+        [Private method] Finds the known words within the edit distance of the given word.
+
+        Args:
+            word (str): a word
+            max_distance (int): the largest edit distance, at most the one of the index
+
+        Returns:
+            List[Tuple[str, int, int]]: (known word, edit distance, frequency), unordered
+        """
+        if len(word) - max_distance > self.longest_word_length or len(self._key_hashes) == 0:
+            return []
+
+        # The words sharing a delete with the word are candidates, found with a single binary search
+        query_deletes = _deletes(word[:self.prefix_length], max_distance)
+        query_hashes = np.fromiter((_delete_hash(delete) for delete in query_deletes), dtype=np.uint64, count=len(query_deletes))
+        positions = np.searchsorted(self._key_hashes, query_hashes)
+        in_range = positions < len(self._key_hashes)
+        positions, query_hashes = positions[in_range], query_hashes[in_range]
+        positions = positions[self._key_hashes[positions] == query_hashes]
+        if len(positions) == 0:
+            return []
+
+        ranges = list(zip(self._key_offsets[positions].tolist(), self._key_offsets[positions + 1].tolist()))
+        word_ids = np.concatenate([self._postings[start:end] for start, end in ranges])
+        levels = np.concatenate([self._posting_levels[start:end] for start, end in ranges])
+
+        # A word within the distance shares a delete that takes at most max_distance deletions on both sides,
+        # so the deeper deletes of the words, the bulk of the index, are skipped for the smaller distances
+        word_ids = np.unique(word_ids[levels <= max_distance])
+        word_ids = word_ids[np.abs(self._word_lengths[word_ids].astype(np.int64) - len(word)) <= max_distance]
+
+        # Sharing a delete does not bound the edit distance, so every candidate is checked
+        found = []
+        for start, end, count in zip(self._word_offsets[word_ids].tolist(), self._word_offsets[word_ids + 1].tolist(),
+                                     self._word_counts[word_ids].tolist()):
+            candidate = str(self._word_bytes[start:end], "utf-8")
+            distance = _osa_distance(word, candidate, max_distance)
+            if distance <= max_distance:
+                found.append((candidate, distance, count))
+
+        return found
+
+    def candidates(self, word: str, max_distance: Optional[int] = None) -> List[Tuple[str, int, int]]:
+        """
+        Returns the known words within the edit distance of the given word.
+
+        Args:
+            word (str): a word
+            max_distance (Optional[int], optional): the largest edit distance, at most the one of the index.
+                Defaults to the one of the index.
+
+        Returns:
+            List[Tuple[str, int, int]]: (known word, edit distance, frequency), the closest and most frequent first
+        """
+        max_distance = self.max_distance if max_distance is None else min(max_distance, self.max_distance)
+
+        return sorted(self._candidates(word, max_distance), key=lambda candidate: (candidate[1], -candidate[2]))
+
+    def lookup(self, word: str, max_distance: Optional[int] = None) -> Optional[str]:
+        """
+        Returns the most likely correction of a word: the word itself if it is known, otherwise the most frequent
+        known word at the smallest edit distance.
+
+        Args:
+            word (str): a word
+            max_distance (Optional[int], optional): the largest edit distance. Defaults to the one of the index.
+
+        Returns:
+            Optional[str]: the correction, or None if there is no known word within the edit distance
+        """
+        if self._word_id(word) is not None:
+            return word
+
+        # Like pyspellchecker, a farther word is only considered if there is no closer one, which also spares
+        # checking the many candidates of the larger distance
+        max_distance = self.max_distance if max_distance is None else min(max_distance, self.max_distance)
+        for distance in range(1, max_distance + 1):
+            found = self._candidates(word, distance)
+            if found:
+                return max(found, key=lambda candidate: (-candidate[1], candidate[2]))[0]
+
+        return None
@@ -1,37 +1,104 @@
 """Module providing utils code for cleaning users text data."""
 # ───────────────────────────────── Imports ────────────────────────────────── #
 # Standard Library
-from typing import Any, Callable, List, Literal, Optional, Set, Tuple, Union
+from typing import TYPE_CHECKING, AbstractSet, Any, Callable, Collection, Deque, Dict, FrozenSet, Iterable, Iterator, List, Literal, Optional, Pattern, Sequence, Set, Tuple, Union
 import numpy as np
 import pandas as pd
 import string
 import re
-import pickle
-from collections import Counter
+import functools
+from collections import Counter, deque
 
 # 3rd Party
-import nltk
-from nltk.corpus import stopwords as nltk_sw
-from nltk.corpus import wordnet
-from nltk.stem import WordNetLemmatizer
-from nltk.tokenize import word_tokenize
-from gensim import utils
-import spacy
-from spacy.language import Language
-from emot.emo_unicode import UNICODE_EMOJI, EMOTICONS_EMO
+# NLTK, spaCy, gensim, emot and langdetect take seconds to import, so they are imported by the functions that use them
 import contractions
-from cleaner_helper import custom_extended_stopwords, custom_shortforms, custom_direct_replacement_dict
-from spellchecker import SpellChecker
-from autocorrect import Speller
-from langdetect import detect, detect_langs
+from cleaner_helper import custom_extended_stopwords, custom_shortforms, custom_direct_replacement_dict, rainbow_stopwords
+from autocorrect.constants import word_regexes
+
+if TYPE_CHECKING:
+    from spacy.language import Language
+    from spacy.tokens import Doc
 
 # Private
+from nlp_utils.preprocessing import resources
+from nlp_utils.preprocessing.frequency import FrequencyTable
+from nlp_utils.preprocessing.result_cache import ResultCache, ResultCacheInfo
 
 # ───────────────────────────────── Code ────────────────────────────────── #
 # Using re.compile() and saving the resulting regular expression object for
 # reuse is more efficient when the expression will be used several times in a
 # single program
 
+
+def _trie_regex(keys: Iterable[str]) -> str:
+    """
+    [Private function] Builds a regular expression that matches any of the given strings.
+
+    The strings are merged into a character trie first and the trie is written out as nested groups, so
+    branches share their common prefixes and the regex engine reads every character once per position,
+    instead of retrying each string of a flat alternation. Longer strings are preferred, and the engine
+    falls back to a shorter one only if whatever follows the group fails.
+
+    Args:
+        keys (Iterable[str]): the strings to match (empty strings are ignored)
+
+    Returns:
+        str: the uncompiled regular expression
+    """
+    trie = {}
+    for key in keys:
+        if not key:
+            continue
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node[None] = None  # A key ends at this node
+
+    def node_to_regex(node: dict) -> str:
+        branches = [re.escape(char) + node_to_regex(child) for char, child in sorted(node.items(), key=lambda item: str(item[0])) if char is not None]
+        if not branches:
+            return ""
+
+        if len(branches) > 1:
+            regex = "(?:" + "|".join(branches) + ")"
+        elif None in node:
+            regex = "(?:" + branches[0] + ")"
+        else:
+            regex = branches[0]
+
+        # A key ending at this node is the fallback of the longer keys sharing its prefix
+        return regex + "?" if None in node else regex
+
+    return node_to_regex(trie)
+
+
+def _char_class(chars: Iterable[str]) -> str:
+    """
+    [Private function] Builds a regex character class of the given characters with consecutive codepoints
+    merged into ranges. The re module checks a class of thousands of single non-BMP characters one by one,
+    but a class of a few ranges quickly.
+    """
+    ranges = []
+    for codepoint in sorted({ord(char) for char in chars}):
+        if ranges and ranges[-1][1] == codepoint - 1:
+            ranges[-1][1] = codepoint
+        else:
+            ranges.append([codepoint, codepoint])
+
+    return "[" + "".join(re.escape(chr(first)) if first == last else re.escape(chr(first)) + "-" + re.escape(chr(last))
+                         for first, last in ranges) + "]"
+
+
+def _regex_literal(regex: str) -> Optional[str]:
+    """
+    [Private function] Returns the only string matched by a regex snippet if the snippet is a plain literal
+    (e.g. ":\\)" -> ":)"), otherwise None.
+    """
+    if re.search(r"[.^$*+?{}\[\]|()\\]", re.sub(r"\\[^0-9A-Za-z]", "", regex)):
+        return None
+    return re.sub(r"\\(.)", r"\1", regex)
+
+
 EMOJI_PATTERN = re.compile("["
                            u"\U0001F600-\U0001F64F"  # emoticons
                            u"\U0001F300-\U0001F5FF"  # symbols & pictographs
@@ -53,12 +120,50 @@ EMOJI_PATTERN = re.compile("["
                            u"\u3030"
                            "]+", flags=re.UNICODE)
 
+# The emoji and emoticon tables come from the assets and large tries, so they are built on first use
+@functools.lru_cache(maxsize=None)
+def _emoji_replacements() -> Dict[str, str]:
+    # Precomputed replacement words of the emojis, e.g. "😂" -> "face_with_tears_of_joy "
+    return {emot: "_".join(emot_meaning.replace(",", "").replace(":", "").split()) + " "
+            for emot, emot_meaning in resources.load_unicode_emoji().items()}
+
+
+@functools.lru_cache(maxsize=None)
+def _emoji_words_pattern() -> Pattern:
+    # A longest-match trie of the emoji codepoint sequences, e.g. "👩‍💻" is a technologist rather than a woman and a laptop.
+    # The lookahead on the possible first codepoints rejects the other positions before entering the trie.
+    emoji_replacements = _emoji_replacements()
+    return re.compile("(?=" + _char_class(emot[0] for emot in emoji_replacements) + ")(?:" + _trie_regex(emoji_replacements) + ")")
+
+
 # Thanks : https://github.com/NeelShah18/emot/blob/master/emot/emo_unicode.py
 # EMOTICON_PATTERN = re.compile(u'(' + u'|'.join(k for k in EMOTICONS_EMO) + u')')
-# https://medium.com/geekculture/text-preprocessing-how-to-handle-emoji-emoticon-641bbfa6e9e7
-with open('./assets/Emoticon_Dict.p', 'rb') as emoticon_file:
-    Emoticon_Dict = pickle.load(emoticon_file)
-EMOTICON_PATTERN = re.compile(u'(' + u'|'.join(k for k in Emoticon_Dict) + u')')
+@functools.lru_cache(maxsize=None)
+def _emoticon_pattern() -> Pattern:
+    return re.compile(u'(' + u'|'.join(k for k in resources.load_emoticon_dict()) + u')')
+
+
+@functools.lru_cache(maxsize=None)
+def _emoticon_replacements() -> Tuple[Dict[str, str], List[Tuple[Pattern, str]]]:
+    # Precomputed replacement words of the emoticons, e.g. ":)" -> "Happy_face_or_smiley ". The keys of Emoticon_Dict
+    # are regex snippets: the plain literal ones are looked up by the matched text and compiled into a trie, while the
+    # few real regexes (e.g. ":[(\\)]") stay as regexes and are tried after the trie.
+    literal_replacements = {}
+    regex_replacements = []
+    for emot, emot_meaning in resources.load_emoticon_dict().items():
+        emot_replacement = "_".join(emot_meaning.replace(",", "").split()) + " "
+        emot_literal = _regex_literal(emot)
+        if emot_literal is None:
+            regex_replacements.append((re.compile(emot), emot_replacement))
+        else:
+            literal_replacements.setdefault(emot_literal, emot_replacement)
+    return literal_replacements, regex_replacements
+
+
+@functools.lru_cache(maxsize=None)
+def _emoticon_words_pattern() -> Pattern:
+    literal_replacements, regex_replacements = _emoticon_replacements()
+    return re.compile("|".join([_trie_regex(literal_replacements)] + [emot.pattern for emot, _ in regex_replacements]))
 
 URL_PATTERN = re.compile(r"(ftp://|smtp://|SMTP://|http://|https://|http://www\.|https://www\.|www\.)?"
                          r"(?:[\x21-\x39\x3b-\x3f\x41-\x7e]+(?::[!-9;-?A-~]+)?@)?(?:xn--[0-9a-z]+|[0-9A-Za-z_-]+\.)*"
@@ -87,12 +192,38 @@ BLANK_PATTERN = re.compile(r"^\s*$")
 
 CONS_DUPLICATION_PATTERN = re.compile(r"\b(\w+)( \1\b)+", flags=re.IGNORECASE)
 
+# The token version of CONS_DUPLICATION_PATTERN: the word a token starts and ends with, and the case-insensitive
+# backreference that decides whether two words are the same
+LEADING_WORD_PATTERN = re.compile(r"\w+")
+
+TRAILING_WORD_PATTERN = re.compile(r"\w+$")
+
+SAME_WORD_PATTERN = re.compile(r"(\w+) \1", flags=re.IGNORECASE)
+
 PUNCTUATION_PATTERN = re.compile('[%s]' % re.escape(string.punctuation))
 
-# Typos, slang and other
-with open('./assets/slang_words.txt') as file:
-    SAMPLE_TYPOS_SLANG = dict(map(str.strip, line.partition('\t')[::2])
-                              for line in file if line.strip())
+# Entities of remove_entities: name -> (pattern, replacement) of the corresponding single remove_* function.
+# The order is the default order in which they are removed.
+ENTITY_PATTERNS = {
+    "url": (URL_PATTERN, " "),
+    "email": (EMAIL_PATTERN, ""),
+    "twitter_username": (TWITTER_USERNAME_PATTERN, " "),
+    "username": (ANY_USERNAME_PATTERN, ""),
+    "hashtag": (HASHTAG_PATTERN, ""),
+    "xml": (XML_PATTERN, ""),
+}
+
+# A character that every match of the entity contains
+ENTITY_TRIGGERS = {
+    "url": (".",),
+    "email": ("@",),
+    "twitter_username": ("@",),
+    "username": ("@",),
+    "hashtag": ("#", "＃"),
+    "xml": ("<",),
+}
+
+# Typos, slang and other are read from the assets by resources.load_slang_words()
 
 # Acronyms
 SAMPLE_ACRONYMS = {
@@ -340,9 +471,17 @@ SAMPLE_ABBR = {
     "zzz": "sleeping bored and tired"
 }
 
-SAMPLE_TYPOS_SLANG_PATTERN = re.compile(r'(?<!\w)(' + '|'.join(re.escape(key) for key in SAMPLE_TYPOS_SLANG.keys()) + r')(?!\w)')
-SAMPLE_ACRONYMS_PATTERN = re.compile(r'(?<!\w)(' + '|'.join(re.escape(key) for key in SAMPLE_ACRONYMS.keys()) + r')(?!\w)')
-SAMPLE_ABBR_PATTERN = re.compile(r'(?<!\w)(' + '|'.join(re.escape(key) for key in SAMPLE_ABBR.keys()) + r')(?!\w)')
+# All the abbreviation dictionaries in one table. On a shared key the typos/slang replacement wins over
+# the acronym one, which wins over the common abbreviation one.
+@functools.lru_cache(maxsize=None)
+def _abbreviation_dict() -> Dict[str, str]:
+    return {**SAMPLE_ABBR, **SAMPLE_ACRONYMS, **resources.load_slang_words()}
+
+
+@functools.lru_cache(maxsize=None)
+def _abbreviation_pattern() -> Pattern:
+    return re.compile(r'(?<!\w)(' + _trie_regex(_abbreviation_dict()) + r')(?!\w)')
+
 
 # Expanding contractions
 CONTRACTIONS_DIC = {
@@ -374,12 +513,41 @@ CONTRACTIONS_DIC = {
 CONTRACTIONS_PATTERN = re.compile('({})'.format('|'.join(CONTRACTIONS_DIC.keys())), flags=re.IGNORECASE | re.DOTALL)
 
 # For lemmatization, we need to provide the POS tag of the word along with the word.
-# Depending on the POS, the lemmatizer may return different results.
-lemmatizer = WordNetLemmatizer()
-wordnet_map = {"N": wordnet.NOUN, "V": wordnet.VERB, "J": wordnet.ADJ, "R": wordnet.ADV}  # Pos tag, used Noun, Verb, Adjective and Adverb
+# Depending on the POS, the lemmatizer may return different results. The lemmatizer, the POS map and
+# the spell checker version 1 (https://github.com/barrust/pyspellchecker) come from the resources module.
+
+# The module attributes that used to be built at import time, now built on their first access
+_LAZY_ATTRIBUTES: Dict[str, Callable[[], Any]] = {
+    "UNICODE_EMOJI": resources.load_unicode_emoji,
+    "EMOJI_REPLACEMENTS": _emoji_replacements,
+    "EMOJI_WORDS_PATTERN": _emoji_words_pattern,
+    "Emoticon_Dict": resources.load_emoticon_dict,
+    "EMOTICON_PATTERN": _emoticon_pattern,
+    "EMOTICON_LITERAL_REPLACEMENTS": lambda: _emoticon_replacements()[0],
+    "EMOTICON_REGEX_REPLACEMENTS": lambda: _emoticon_replacements()[1],
+    "EMOTICON_WORDS_PATTERN": _emoticon_words_pattern,
+    "SAMPLE_TYPOS_SLANG": resources.load_slang_words,
+    "ABBREVIATION_DICT": _abbreviation_dict,
+    "ABBREVIATION_PATTERN": _abbreviation_pattern,
+    "lemmatizer": resources.get_lemmatizer,
+    "wordnet_map": resources.get_wordnet_map,
+    "spell": resources.get_spell_checker,
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        return _LAZY_ATTRIBUTES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Spell Checker version 1: https://github.com/barrust/pyspellchecker
-spell = SpellChecker()
+
+# Most of the cleaning functions below are split into a public function that checks its input and a private
+# kernel (the same name with a leading underscore) that assumes a valid string. A Pipeline validates the text
+# once and then chains the kernels directly.
+
+
+def _remove_xml(html_text: str) -> Tuple[str, int]:
+    return re.subn(XML_PATTERN, r"", html_text)
 
 
 def remove_xml(html_text: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
@@ -405,7 +573,11 @@ def remove_xml(html_text: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
     if not isinstance(html_text, str):
         return None, 0
 
-    return re.subn(XML_PATTERN, r"", html_text)
+    return _remove_xml(html_text)
+
+
+def _to_lower(text: str) -> str:
+    return text.lower()
 
 
 def to_lower(text: Optional[str]) -> Optional[str]:
@@ -422,7 +594,11 @@ def to_lower(text: Optional[str]) -> Optional[str]:
     if pd.isnull(text) or not isinstance(text, str):
         return None
 
-    return text.lower()
+    return _to_lower(text)
+
+
+def _remove_number(text: str) -> str:
+    return ''.join(c for c in text if not c.isdigit())
 
 
 def remove_number(text: Optional[str]) -> Optional[str]:
@@ -438,7 +614,11 @@ def remove_number(text: Optional[str]) -> Optional[str]:
     # Input checking
     if pd.isnull(text) or not isinstance(text, str):
         return None
-    return ''.join(c for c in text if not c.isdigit())
+    return _remove_number(text)
+
+
+def _to_strip(text: str) -> str:
+    return " ".join([c for c in text.split()])
 
 
 def to_strip(text: Optional[str]) -> Optional[str]:
@@ -456,7 +636,11 @@ def to_strip(text: Optional[str]) -> Optional[str]:
     if pd.isnull(text) or not isinstance(text, str):
         return None
 
-    return " ".join([c for c in text.split()])
+    return _to_strip(text)
+
+
+def _remove_any_char(text: str) -> Tuple[str, int]:
+    return re.subn(CHAR_PATTERN, r" ", text, re.I | re.A)
 
 
 def remove_any_char(text: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
@@ -476,7 +660,16 @@ def remove_any_char(text: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
     if not isinstance(text, str):
         return None, 0
 
-    return re.subn(CHAR_PATTERN, r" ", text, re.I | re.A)
+    return _remove_any_char(text)
+
+
+def _remove_duplicate_tokens(tokens: List[str]) -> List[str]:
+    # The keys of a dict keep the first occurrence of every token, in a single pass
+    return list(dict.fromkeys(tokens))
+
+
+def _remove_all_duplication(text: str) -> str:
+    return " ".join(_remove_duplicate_tokens(text.split()))
 
 
 def remove_all_duplication(text: Optional[str]) -> Optional[str]:
@@ -494,8 +687,46 @@ def remove_all_duplication(text: Optional[str]) -> Optional[str]:
         return None
 
     # lower_case_text = to_lower(text)
-    tokenize_text = text.split()
-    return " ".join(sorted(set(tokenize_text), key=tokenize_text.index))
+    return _remove_all_duplication(text)
+
+
+def _remove_consecutive_duplication(text: str) -> str:
+    return re.sub(CONS_DUPLICATION_PATTERN, r'\1', text)
+
+
+def _remove_consecutive_duplicate_tokens(tokens: List[str]) -> List[str]:
+    """
+    [Private function] The token version of _remove_consecutive_duplication, which gives the same text on the
+    single-spaced text of the tokens: when a token starts with the word the token before it ends with, ignoring
+    the case, the word is removed and the rest of the token (e.g. a punctuation mark) joins the token before it.
+
+    Args:
+        tokens (List[str]): the tokens of a text
+
+    Returns:
+        List[str]: the tokens without the consecutive duplicate words
+    """
+    result_tokens: List[str] = []
+    last_word = None
+    for token in tokens:
+        if last_word is not None:
+            match = LEADING_WORD_PATTERN.match(token)
+            if match is not None:
+                word = match.group()
+                if word == last_word or SAME_WORD_PATTERN.fullmatch(f"{last_word} {word}") is not None:
+                    rest = token[match.end():]
+                    result_tokens[-1] += rest
+                    if rest:
+                        # The rest starts with a non-word character, so its last word is after the match
+                        trailing_match = TRAILING_WORD_PATTERN.search(rest)
+                        last_word = None if trailing_match is None else trailing_match.group()
+                    continue
+
+        result_tokens.append(token)
+        trailing_match = TRAILING_WORD_PATTERN.search(token)
+        last_word = None if trailing_match is None else trailing_match.group()
+
+    return result_tokens
 
 
 def remove_consecutive_duplication(text: Optional[str]) -> Optional[str]:
@@ -512,7 +743,11 @@ def remove_consecutive_duplication(text: Optional[str]) -> Optional[str]:
     if pd.isnull(text) or not isinstance(text, str):
         return None
 
-    return re.sub(CONS_DUPLICATION_PATTERN, r'\1', text)
+    return _remove_consecutive_duplication(text)
+
+
+def _remove_many_spaces(text: str) -> str:
+    return re.sub(SPACE_PATTERN, r" ", text)
 
 
 def remove_many_spaces(text: Optional[str]) -> Optional[str]:
@@ -529,7 +764,18 @@ def remove_many_spaces(text: Optional[str]) -> Optional[str]:
     if pd.isnull(text) or not isinstance(text, str):
         return None
 
-    return re.sub(SPACE_PATTERN, r" ", text)
+    return _remove_many_spaces(text)
+
+
+def _remove_emoji(text: str) -> Tuple[str, int]:
+    emoji_lst = EMOJI_PATTERN.findall(text)
+    emoji_count = 0
+    for _emoji in emoji_lst:
+        emoji_count += len(_emoji)
+
+    text = EMOJI_PATTERN.sub(r' ', text)
+
+    return text, emoji_count
 
 
 def remove_emoji(text: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
@@ -549,14 +795,11 @@ def remove_emoji(text: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
     if pd.isnull(text) or not isinstance(text, str):
         return None, 0
 
-    emoji_lst = EMOJI_PATTERN.findall(text)
-    emoji_count = 0
-    for _emoji in emoji_lst:
-        emoji_count += len(_emoji)
+    return _remove_emoji(text)
 
-    text = EMOJI_PATTERN.sub(r' ', text)
 
-    return text, emoji_count
+def _remove_url(text: str) -> Tuple[str, int]:
+    return re.subn(URL_PATTERN, r' ', text)
 
 
 def remove_url(text: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
@@ -573,7 +816,11 @@ def remove_url(text: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
     if pd.isnull(text) or not isinstance(text, str):
         return None, 0
 
-    return re.subn(URL_PATTERN, r' ', text)
+    return _remove_url(text)
+
+
+def _remove_twitter_username(text: str) -> Tuple[str, int]:
+    return re.subn(TWITTER_USERNAME_PATTERN, r' ', text)
 
 
 def remove_twitter_username(text: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
@@ -591,7 +838,11 @@ def remove_twitter_username(text: Optional[str]) -> Tuple[Optional[str], Optiona
     if pd.isnull(text) or not isinstance(text, str):
         return None, 0
 
-    return re.subn(TWITTER_USERNAME_PATTERN, r' ', text)
+    return _remove_twitter_username(text)
+
+
+def _remove_username(text: str) -> Tuple[str, int]:
+    return re.subn(ANY_USERNAME_PATTERN, r'', text)
 
 
 def remove_username(text: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
@@ -609,7 +860,11 @@ def remove_username(text: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
     if pd.isnull(text) or not isinstance(text, str):
         return None, 0
 
-    return re.subn(ANY_USERNAME_PATTERN, r'', text)
+    return _remove_username(text)
+
+
+def _remove_hashtag(text: str) -> Tuple[str, int]:
+    return re.subn(HASHTAG_PATTERN, r'', text)
 
 
 def remove_hashtag(text: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
@@ -629,7 +884,11 @@ def remove_hashtag(text: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
     if pd.isnull(text) or not isinstance(text, str):
         return None, 0
 
-    return re.subn(HASHTAG_PATTERN, r'', text)
+    return _remove_hashtag(text)
+
+
+def _remove_email_address(text: str) -> Tuple[str, int]:
+    return re.subn(EMAIL_PATTERN, r'', text)
 
 
 def remove_email_address(text: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
@@ -646,7 +905,53 @@ def remove_email_address(text: Optional[str]) -> Tuple[Optional[str], Optional[i
     if pd.isnull(text) or not isinstance(text, str):
         return None, 0
 
-    return re.subn(EMAIL_PATTERN, r'', text)
+    return _remove_email_address(text)
+
+
+def _remove_entities(text: str, entities: Tuple[str, ...]) -> Tuple[str, Dict[str, int]]:
+    counts = dict.fromkeys(entities, 0)
+    for entity in entities:
+        # The pattern only scans the text if it contains a character that every match of the entity contains
+        if any(trigger in text for trigger in ENTITY_TRIGGERS[entity]):
+            pattern, replacement = ENTITY_PATTERNS[entity]
+            text, counts[entity] = pattern.subn(replacement, text)
+
+    return text, counts
+
+
+def remove_entities(text: Optional[str], entities: Sequence[str] = tuple(ENTITY_PATTERNS)) -> Tuple[Optional[str], Dict[str, int]]:
+    """
+    Removes URLs, email addresses, usernames, hashtags and HTML tags from the given text. The result and the
+    counts are the same as applying the single remove_* functions in the order of `entities`, but a text is
+    only scanned for the entities whose marker character it contains (e.g. "@" for a username, "#" for a
+    hashtag), so most tweets take one or two scans instead of six.
+
+    Note:
+        The entities are removed one after another because their matches can overlap: in "hi @john.doe"
+        removing the URL first leaves "hi @ " with no username, while removing the username first leaves
+        "hi .doe" with no URL.
+
+    Args:
+        text (Optional[str]): a text that may contain multiple entities
+        entities (Sequence[str], optional): the entities to remove, in priority order. Any of "url", "email",
+            "twitter_username", "username", "hashtag" and "xml". Defaults to all of them.
+
+    Raises:
+        ValueError: if an entity is not supported
+
+    Returns:
+        Tuple[Optional[str], Dict[str, int]]: (the purified text, the number of matches per entity)
+    """
+    entities = tuple(entities)
+    unknown_entities = set(entities) - set(ENTITY_PATTERNS)
+    if unknown_entities:
+        raise ValueError(f"Unsupported entities: {unknown_entities}. Choose from {list(ENTITY_PATTERNS)}")
+
+    # Input checking
+    if pd.isnull(text) or not isinstance(text, str):
+        return None, dict.fromkeys(entities, 0)
+
+    return _remove_entities(text, entities)
 
 
 def blank_checker(text: Optional[str]) -> Optional[bool]:
@@ -669,6 +974,15 @@ def blank_checker(text: Optional[str]) -> Optional[bool]:
         return False
 
 
+def _remove_special_char(text: str, special_char: List[str]) -> Tuple[str, int]:
+    count = 0
+    for char in special_char:
+        count += text.count(char)
+        text = text.replace(char, " ")
+
+    return text, count
+
+
 def remove_special_char(text: Optional[str], special_char: Optional[List[str]]) -> Tuple[Optional[str], int]:
     """
     Removes special characters through the input list from the given text
@@ -690,29 +1004,10 @@ def remove_special_char(text: Optional[str], special_char: Optional[List[str]])
     if len(special_char) == 0:
         return text, 0
 
-    count = 0
-    for char in special_char:
-        count += text.count(char)
-        text = text.replace(char, " ")
-
-    return text, count
-
-
-def expand_contractions(text: Optional[str]) -> Optional[str]:
-    """
-    Contractions are words or combinations of words that are shortened by dropping letters and replacing them with an apostrophe. 
-    With this function, we are going to convert the text into the standard form.
+    return _remove_special_char(text, special_char)
 
-    Args:
-        text (Optional[str]): a text that may contain shortened forms of words
-
-    Returns:
-        Optional[str]: A converted text in which shortened words are transferred to a standard shape. 
-    """
-    # Input checking
-    if pd.isnull(text) or not isinstance(text, str):
-        return None
 
+def _expand_contractions(text: str) -> str:
     def expand_match(contraction):
         match = contraction.group(0)
         first_char = match[0]
@@ -732,6 +1027,24 @@ def expand_contractions(text: Optional[str]) -> Optional[str]:
     return expanded_text
 
 
+def expand_contractions(text: Optional[str]) -> Optional[str]:
+    """
+    Contractions are words or combinations of words that are shortened by dropping letters and replacing them with an apostrophe. 
+    With this function, we are going to convert the text into the standard form.
+
+    Args:
+        text (Optional[str]): a text that may contain shortened forms of words
+
+    Returns:
+        Optional[str]: A converted text in which shortened words are transferred to a standard shape. 
+    """
+    # Input checking
+    if pd.isnull(text) or not isinstance(text, str):
+        return None
+
+    return _expand_contractions(text)
+
+
 def convert_to_unicode(text: Optional[Any], encoding: str = "utf-8") -> Optional[str]:
     """
     Converts the given text to Unicode. Input must be utf-8.
@@ -750,6 +1063,8 @@ def convert_to_unicode(text: Optional[Any], encoding: str = "utf-8") -> Optional
     # else:
     #     return None
 
+    from gensim import utils
+
     return utils.to_unicode(text)
 
 
@@ -759,6 +1074,8 @@ def stop_words_spacy():
     # python - m spacy download xx_ent_wiki_sm
     # python -m spacy download xx_sent_ud_sm
 
+    import spacy
+
     # loading the english language small model of spacy
     en = spacy.load('en_core_web_sm')
     stopwords = en.Defaults.stop_words
@@ -802,59 +1119,99 @@ def stop_words_spacy():
     print('Number of stop words: %d' % len(spacy_stopwords))
 
 
-def stopwords_nltk(pref_lang_lst: Optional[List[str]]) -> Optional[Set[str]]:
+# The number of stopword sets kept: one per combination of languages and one per set derived by
+# add_word_to_stopwords_set
+STOPWORDS_CACHE_SIZE = 2 ** 10
+
+
+@functools.lru_cache(maxsize=STOPWORDS_CACHE_SIZE)
+def _stopwords_set(languages: FrozenSet[str], rainbow: bool) -> FrozenSet[str]:
+    """
+    [Private function] Builds the stopwords of a combination of languages, once per combination.
+
+    Args:
+        languages (FrozenSet[str]): languages of the NLTK stopwords corpus
+        rainbow (bool): adds the rainbow stopwords
+
+    Returns:
+        FrozenSet[str]: the NLTK stopwords of the languages and the custom extended stopwords
+    """
+    stopword_sets = [resources.get_nltk_stopwords(language) for language in languages]
+    if rainbow:
+        stopword_sets.append(rainbow_stopwords)
+    return frozenset(custom_extended_stopwords).union(*stopword_sets)
+
+
+@functools.lru_cache(maxsize=STOPWORDS_CACHE_SIZE)
+def _add_words_to_stopwords(stop_words: FrozenSet[str], words: FrozenSet[str]) -> FrozenSet[str]:
+    return stop_words | words
+
+
+def stopwords_cache_info() -> functools._CacheInfo:
+    """
+    Returns the statistics of the cache of stopword sets built by stopwords_nltk.
+
+    Returns:
+        functools._CacheInfo: (hits, misses, maxsize, currsize)
+    """
+    return _stopwords_set.cache_info()
+
+
+def clear_stopwords_cache() -> None:
+    """
+    Empties the caches of the stopword sets of stopwords_nltk and add_word_to_stopwords_set and resets their statistics.
+    """
+    _stopwords_set.cache_clear()
+    _add_words_to_stopwords.cache_clear()
+
+
+def stopwords_nltk(pref_lang_lst: Optional[List[str]], rainbow: bool = False) -> Optional[FrozenSet[str]]:
     """
     Returns a set that contains all stop words in NLTK based on the given language list.
 
+    Note:
+        The set of a combination of languages is built once and then shared by every call, so it is a frozenset.
+        Use add_word_to_stopwords_set to get a set with more words.
+
     Args:
         pref_lang_lst (Optional[List[str]]): a list of languages
+        rainbow (bool, optional): adds the rainbow stopwords of cleaner_helper. Defaults to False.
 
     Returns:
-        Optional[Set[str]]: a set of all stop words w.r.t the given languages
+        Optional[FrozenSet[str]]: a set of all stop words w.r.t the given languages
     """
     # Input checking
     if isinstance(pref_lang_lst, str):
         # The input is in string format, instead of list or set
         pref_lang_lst = [pref_lang_lst]
-    elif pd.isnull(pref_lang_lst) or not isinstance(pref_lang_lst, (Set, List)):
+    elif not isinstance(pref_lang_lst, (Set, List)):
         return None
     if len(pref_lang_lst) == 0:
         return None
 
-    NLTK_sup_lang = set(nltk_sw.fileids())
-    pref_lang_lst_lower_case = [lang.lower().strip() for lang in pref_lang_lst]
-    pref_lang_set = set(pref_lang_lst_lower_case)
-
-    # Check the intersection between two sets: NLTK_sup_lang and pref_lang_set
-    if pref_lang_set.issubset(NLTK_sup_lang):
-        total_lang = pref_lang_set
-    elif pref_lang_set - NLTK_sup_lang:
-        total_lang = pref_lang_set.intersection(NLTK_sup_lang)
-    else:
-        # There is no intersection between sets
+    # The languages that NLTK does not have are ignored
+    total_lang = {lang.lower().strip() for lang in pref_lang_lst} & resources.get_nltk_stopword_languages()
+    if not total_lang:
         return None
-    try:
-        stop_words = set()
-        stop_words = nltk_sw.words("english")
-    except LookupError:
-        nltk.download('stopwords')
-    finally:
-        stop_words = set()
-        for language in total_lang:
-            stop_words = stop_words.union(set(nltk_sw.words(language)))
 
-    full_stopwords_set = set.union(set(custom_extended_stopwords), set(stop_words))
+    return _stopwords_set(frozenset(total_lang), rainbow)
+
 
-    return full_stopwords_set
+def _remove_stopword_tokens(tokens: List[str], stopwords: AbstractSet[str]) -> List[str]:
+    return [word for word in tokens if word not in stopwords]
 
 
-def remove_stopwords(text: Optional[str], stopwords: Set) -> Optional[str]:
+def _remove_stopwords(text: str, stopwords: AbstractSet[str]) -> str:
+    return " ".join(_remove_stopword_tokens(str(text).split(), stopwords))
+
+
+def remove_stopwords(text: Optional[str], stopwords: AbstractSet[str]) -> Optional[str]:
     """
     Removes all stopwords from the given text
 
     Args:
         text (Optional[str]): a text may contain stopwords
-        stopwords (Set): the desired stopwords set based on a specific language/s
+        stopwords (AbstractSet[str]): the desired stopwords set or frozenset based on a specific language/s
 
     Returns:
         Optional[str]: a purified text w/o any stopwords
@@ -863,79 +1220,325 @@ def remove_stopwords(text: Optional[str], stopwords: Set) -> Optional[str]:
     if pd.isnull(text) or not isinstance(text, str):
         return None
 
-    if pd.isnull(stopwords) or not isinstance(stopwords, Set):
+    if pd.isnull(stopwords) or not isinstance(stopwords, (set, frozenset)):
         return None
 
-    return " ".join([word for word in str(text).split() if word not in stopwords])
+    return _remove_stopwords(text, stopwords)
 
 
-def language_detection(text: Optional[str]) -> Optional[str]:
-    """
-    To detect the language of the text. The method returns a single language 
-    name which has the highest probability.
+# The seed of the random sampling of the n-grams of langdetect. With a fixed seed a text always gets the same
+# languages, so its detection can be cached.
+LANGUAGE_DETECTION_SEED = 0
 
-    Note: 
-        Language detection algorithm is non-deterministic, which means that if 
-        we try to run it on a text which is either too short or too ambiguous, we 
-        might get different results everytime you run it.
+# The number of (text, seed) pairs whose detection is kept. Tweets come back as retweets and quotes, and a
+# detection samples thousands of n-grams.
+LANGUAGE_DETECTION_CACHE_SIZE = 2 ** 16
+
+
+# (text, seed) -> the detected languages. A ResultCache rather than an lru_cache, so the batch versions can look the
+# texts up in the calling process and only send the unknown ones to a pool of processes (see
+# batch_preprocessing._detect_languages), then keep what the workers detected.
+_language_detection_cache = ResultCache(max_size=LANGUAGE_DETECTION_CACHE_SIZE)
+
+# The result of a text that is not in the cache, which is never a detection
+_NOT_CACHED = object()
 
-    See more:
-        https://code.google.com/archive/p/language-detection/wikis/Tools.wiki
-        https://github.com/Mimino666/langdetect
+
+def _compute_language_probabilities(text: str, seed: int) -> Tuple[Any, ...]:
+    """
+    [Private function] Detects the languages of a text with a seeded detector, without the cache.
 
     Args:
-        text (Optional[str]): a given that that can be in any language
+        text (str): a text
+        seed (int): the seed of the detector
+
+    Raises:
+        LangDetectException: if the text has no feature to detect a language from, e.g. only digits
 
     Returns:
-        Optional[str]: a single language abbreviation which has the highest probability.
+        Tuple[Any, ...]: the langdetect Language (lang, prob) of the text, from the most to the least probable
     """
-    # Input checking
-    if pd.isnull(text) or not isinstance(text, str):
-        return None
+    detector = resources.get_language_detector_factory().create()
+    detector.seed = seed
+    detector.append(text)
+    return tuple(detector.get_probabilities())
 
-    return detect(text)
 
+def _try_compute_language_probabilities(text: str, seed: int) -> Optional[Tuple[Any, ...]]:
+    from langdetect.lang_detect_exception import LangDetectException
 
-def language_prob_detection(text: Optional[str]) -> Optional[List[Tuple[str, float]]]:
-    """
-    To find out the probabilities for the top languages.
+    try:
+        return _compute_language_probabilities(text, seed)
+    except LangDetectException:
+        return None
 
-    Note: 
-        Language detection algorithm is non-deterministic, which means that if 
-        we try to run it on a text which is either too short or too ambiguous, we 
-        might get different results everytime you run it.
 
-    See more:
-        https://code.google.com/archive/p/language-detection/wikis/Tools.wiki
-        https://github.com/Mimino666/langdetect
+def _cached_language_probabilities(text: str, seed: int) -> Optional[Tuple[Any, ...]]:
+    """
+    [Private function] Detects the languages of a text with a seeded detector, once per (text, seed).
 
     Args:
-        text (Optional[str]): a given that that can be in any language
+        text (str): a text
+        seed (int): the seed of the detector
 
     Returns:
-        Optional[List[Tuple[str, float]]]: a list of multiple languages and their probabilities.
+        Optional[Tuple[Any, ...]]: the langdetect Language (lang, prob) of the text, from the most to the least
+            probable, or None if the text has no feature to detect a language from
     """
-
-    # Input checking
-    if pd.isnull(text) or not isinstance(text, str):
-        return None
-
-    return detect_langs(text)
+    probabilities = _language_detection_cache.get((text, seed), _NOT_CACHED)
+    if probabilities is _NOT_CACHED:
+        # The detection is seeded, so an undetectable text is cached as None too
+        probabilities = _try_compute_language_probabilities(text, seed)
+        _language_detection_cache.put((text, seed), probabilities)
+    return probabilities
 
 
-def lang_conv_spacy(lang: Optional[str]) -> Optional[str]:
+def _detect_language_probabilities(text: str, seed: int) -> Tuple[Any, ...]:
     """
-    This function maps the name of the language into its corresponding abbreviation form. 
-    I have to mention that Spacy doesn't support ISO-639-1 (https://github.com/noumar/iso639).
+    [Private function] Detects the languages of a text with a seeded detector, once per (text, seed).
 
     Args:
-        lang (Optional[str]): the name of the language
+        text (str): a text
+        seed (int): the seed of the detector
+
+    Raises:
+        LangDetectException: if the text has no feature to detect a language from, e.g. only digits
 
     Returns:
-        Optional[str]: the abbreviation form of a language
+        Tuple[Any, ...]: the langdetect Language (lang, prob) of the text, from the most to the least probable
     """
-    # Input checking
-    if pd.isnull(lang) or not isinstance(lang, str):
+    from langdetect.lang_detect_exception import ErrorCode, LangDetectException
+
+    probabilities = _cached_language_probabilities(text, seed)
+    if probabilities is None:
+        # The error langdetect raises for a text without features
+        raise LangDetectException(ErrorCode.CantDetectError, "No features in text.")
+    return probabilities
+
+
+def _most_probable_language(probabilities: Tuple[Any, ...]) -> str:
+    # Like langdetect.detect, a text without any probable language is "unknown"
+    return probabilities[0].lang if probabilities else "unknown"
+
+
+def language_detection_cache_info() -> ResultCacheInfo:
+    """
+    Returns the statistics of the cache of detected languages used by language_detection, language_prob_detection
+    and their batch versions.
+
+    Returns:
+        ResultCacheInfo: (hits, misses, evictions, max_size, size)
+    """
+    return _language_detection_cache.info()
+
+
+def clear_language_detection_cache() -> None:
+    """
+    Empties the cache of detected languages and resets its statistics.
+    """
+    _language_detection_cache.clear()
+
+
+def language_detection(text: Optional[str], seed: int = LANGUAGE_DETECTION_SEED) -> Optional[str]:
+    """
+    To detect the language of the text. The method returns a single language 
+    name which has the highest probability.
+
+    Note: 
+        Language detection algorithm samples the n-grams of the text at random, so 
+        on a text which is either too short or too ambiguous, different seeds might 
+        give different results. The seed is fixed, so a text always gets the same 
+        language, and the detections are cached per text in a bounded LRU cache 
+        (see language_detection_cache_info).
+
+    See more:
+        https://code.google.com/archive/p/language-detection/wikis/Tools.wiki
+        https://github.com/Mimino666/langdetect
+
+    Args:
+        text (Optional[str]): a given that that can be in any language
+        seed (int, optional): the seed of the random sampling. Defaults to LANGUAGE_DETECTION_SEED.
+
+    Raises:
+        LangDetectException: if the text has no feature to detect a language from, e.g. only digits
+
+    Returns:
+        Optional[str]: a single language abbreviation which has the highest probability.
+    """
+    # Input checking
+    if pd.isnull(text) or not isinstance(text, str):
+        return None
+
+    return _most_probable_language(_detect_language_probabilities(text, seed))
+
+
+def language_prob_detection(text: Optional[str], seed: int = LANGUAGE_DETECTION_SEED) -> Optional[List[Tuple[str, float]]]:
+    """
+    To find out the probabilities for the top languages.
+
+    Note: 
+        Language detection algorithm samples the n-grams of the text at random, so 
+        on a text which is either too short or too ambiguous, different seeds might 
+        give different results. The seed is fixed, so a text always gets the same 
+        probabilities, and the detections are cached per text in a bounded LRU cache 
+        (see language_detection_cache_info).
+
+    See more:
+        https://code.google.com/archive/p/language-detection/wikis/Tools.wiki
+        https://github.com/Mimino666/langdetect
+
+    Args:
+        text (Optional[str]): a given that that can be in any language
+        seed (int, optional): the seed of the random sampling. Defaults to LANGUAGE_DETECTION_SEED.
+
+    Raises:
+        LangDetectException: if the text has no feature to detect a language from, e.g. only digits
+
+    Returns:
+        Optional[List[Tuple[str, float]]]: a list of multiple languages and their probabilities.
+    """
+
+    # Input checking
+    if pd.isnull(text) or not isinstance(text, str):
+        return None
+
+    return list(_detect_language_probabilities(text, seed))
+
+
+# Unicode script -> the only language of langdetect written in it. Cyrillic (ru, uk, bg, mk), Arabic (ar, fa, ur),
+# Devanagari (hi, mr, ne) and Han alone (zh-cn, zh-tw, ja) are written in several languages, so they are left to
+# the detector, like Latin.
+SCRIPT_LANGUAGES = {
+    "GREEK": "el", "HANGUL": "ko", "HIRAGANA": "ja", "KATAKANA": "ja", "KATAKANA-HIRAGANA": "ja", "THAI": "th",
+    "HEBREW": "he", "GUJARATI": "gu", "BENGALI": "bn", "GURMUKHI": "pa", "TAMIL": "ta", "TELUGU": "te",
+    "KANNADA": "kn", "MALAYALAM": "ml",
+}
+
+# The characters above the Basic Multilingual Plane, e.g. the emojis
+ASTRAL_CHAR_PATTERN = re.compile("[\U00010000-\U0010FFFF]")
+
+# The tags of the scripts that decide nothing on their own
+_LATIN_TAG, _HAN_TAG, _OTHER_TAG = "L", "H", "O"
+
+
+def _script_tag(char: str, script_tags: Dict[str, str]) -> Optional[str]:
+    """
+    [Private function] Finds the tag of the script of a character.
+
+    Args:
+        char (str): a character
+        script_tags (Dict[str, str]): the first word of the Unicode name of a script -> its tag
+
+    Returns:
+        Optional[str]: the tag of the script of the character, None if it is not a letter of any script
+    """
+    import unicodedata
+
+    # The surrogates, the digits, the punctuation, the symbols and the emojis are not letters of any script
+    if unicodedata.category(char)[0] not in "LM":
+        return None
+
+    # e.g. "GREEK SMALL LETTER ALPHA", "HALFWIDTH KATAKANA LETTER A"; the generic combining marks are deleted
+    name_words = unicodedata.name(char, "").replace("HALFWIDTH ", "").replace("FULLWIDTH ", "").split(" ")
+    if name_words[0] in ("COMBINING", "MODIFIER", ""):
+        return None
+    return script_tags.get(name_words[0], _OTHER_TAG)
+
+
+@functools.lru_cache(maxsize=None)
+def _script_tags() -> Tuple[Dict[int, Optional[str]], Dict[str, str], Dict[str, str]]:
+    """
+    [Private function] Builds the str.translate table that replaces every letter of the Basic Multilingual Plane
+    by the tag of its script and deletes the other characters. The characters above it are added by
+    _script_language when it first sees them.
+
+    Returns:
+        Tuple[Dict[int, Optional[str]], Dict[str, str], Dict[str, str]]: (code point -> script tag or None,
+            tag -> language, first word of the Unicode name of a script -> tag)
+    """
+    # One tag per language, so the two Japanese kana share theirs
+    language_tags = {language: chr(ord("a") + index) for index, language in enumerate(dict.fromkeys(SCRIPT_LANGUAGES.values()))}
+    script_tags = {script: language_tags[language] for script, language in SCRIPT_LANGUAGES.items()}
+    script_tags.update({"LATIN": _LATIN_TAG, "CJK": _HAN_TAG})
+
+    # A plain dict: str.translate looks a dict subclass up much more slowly
+    table = {code_point: _script_tag(chr(code_point), script_tags) for code_point in range(0x10000)}
+    return table, {tag: language for language, tag in language_tags.items()}, script_tags
+
+
+def _script_language(text: str) -> Optional[str]:
+    """
+    [Private function] Finds the language of a text from the script of its letters alone.
+
+    Args:
+        text (str): a text
+
+    Returns:
+        Optional[str]: the language if the letters are written in a script of a single language, None otherwise
+    """
+    table, tag_languages, script_tags = _script_tags()
+
+    # The emojis and the other characters above the Basic Multilingual Plane get their tags on their first sight;
+    # str.translate keeps a character that is not in the table
+    for char in ASTRAL_CHAR_PATTERN.findall(text):
+        if ord(char) not in table:
+            table[ord(char)] = _script_tag(char, script_tags)
+
+    tags = text.translate(table)
+
+    # Like langdetect, the Latin letters (hashtags, user names, ...) are ignored if they are less than half of the
+    # other letters
+    n_latin = tags.count(_LATIN_TAG)
+    if n_latin * 2 >= len(tags) - n_latin:
+        return None
+
+    scripts = set(tags)
+    scripts.discard(_LATIN_TAG)
+    # The Han characters are part of Japanese and Korean texts
+    if len(scripts) == 2 and _HAN_TAG in scripts and (scripts - {_HAN_TAG}) & {tag for tag, language in tag_languages.items()
+                                                                                if language in ("ja", "ko")}:
+        scripts.discard(_HAN_TAG)
+
+    return tag_languages.get(scripts.pop()) if len(scripts) == 1 else None
+
+
+def script_language_detection(text: Optional[str]) -> Optional[str]:
+    """
+    Finds the language of the text from its Unicode scripts alone, e.g. Greek, Hangul, Kana or Thai letters. It
+    costs a str.translate instead of a language detection, so it can decide the unambiguous texts ahead of
+    language_detection (see script_routed_language_detection_batch).
+
+    Note:
+        The scripts shared by several languages, e.g. Latin, Cyrillic, Arabic or Devanagari, decide nothing (see
+        SCRIPT_LANGUAGES). The Latin letters are ignored if they are less than half of the other letters, as
+        langdetect does.
+
+    Args:
+        text (Optional[str]): a given text that can be in any language
+
+    Returns:
+        Optional[str]: the language abbreviation of langdetect if the script decides it, None otherwise
+    """
+    # Input checking
+    if pd.isnull(text) or not isinstance(text, str):
+        return None
+
+    return _script_language(text)
+
+
+def lang_conv_spacy(lang: Optional[str]) -> Optional[str]:
+    """
+    This function maps the name of the language into its corresponding abbreviation form. 
+    I have to mention that Spacy doesn't support ISO-639-1 (https://github.com/noumar/iso639).
+
+    Args:
+        lang (Optional[str]): the name of the language
+
+    Returns:
+        Optional[str]: the abbreviation form of a language
+    """
+    # Input checking
+    if pd.isnull(lang) or not isinstance(lang, str):
         return None
 
     dic_lang = {"Catalan": "ca", "Chinese": "zh", "Croatian": "hr", "Danish": "da", "Dutch": "nl", "English": "en", "Finnish": "fi", "French": "fr", "German": "de", "Greek": "el", "Italian": "it", "Japanese": "ja", "Korean": "ko",
@@ -1003,20 +1606,33 @@ def pipeline_size_str_conv_spacy(pipeline_size: Literal["small", "medium", "larg
         return None
 
 
-def pipeline_selector_spacy(pref_lang: Optional[str], pref_pipeline_size: Literal["small", "medium", "large", "transformer"]) -> Optional[Language]:
+def pipeline_selector_spacy(pref_lang: Optional[str], pref_pipeline_size: Literal["small", "medium", "large", "transformer"],
+                            components: Optional[Collection[str]] = None) -> Optional["Language"]:
     """
     Returns a Spacy language pipeline based on the input specifications.
 
+    Note:
+        The pipelines are loaded once per process and cached per (language, size, components), so calling this
+        function again is free. A pipeline that is not installed is downloaded first.
+
     See more: 
         https://spacy.io/usage/models#languages
 
     Args:
         pref_lang (Optional[str]): a preferable language
         pref_pipeline_size (Literal["small", "medium", "large", "transformer"]): a preferable size of the pipeline
+        components (Optional[Collection[str]], optional): the components to run, e.g. ["tok2vec", "tagger",
+            "attribute_ruler", "lemmatizer"] for the lemmas; an empty one only runs the tokenizer. Defaults to all
+            the components of the pipeline.
 
     Returns:
         Optional[Language]: a Spacy language pipeline
     """
+    # Input checking
+    if components is not None and (isinstance(components, str) or not isinstance(components, Collection) or
+                                   not all(isinstance(component, str) for component in components)):
+        return None
+
     pipeline_lang = lang_conv_spacy(pref_lang)
     if pipeline_lang is None:
         # Spacy doen't support this language
@@ -1034,14 +1650,62 @@ def pipeline_selector_spacy(pref_lang: Optional[str], pref_pipeline_size: Litera
 
     pipeline_name = str(pipeline_lang + "_core_" + pipeline_source + "_" + pipeline_size)
 
-    try:
-        nlp_pipeline = spacy.load(pipeline_name)
-    except:
-        spacy.cli.download(pipeline_name)
-    finally:
-        nlp_pipeline = spacy.load(pipeline_name)
+    return resources.get_spacy_pipeline(pipeline_name, components)
+
 
-    return nlp_pipeline
+def pipe_spacy(texts: Iterable[Any], nlp: "Language", batch_size: int = 1000, n_process: int = 1) -> Iterator[Optional["Doc"]]:
+    """
+    Runs a spaCy pipeline over the texts with nlp.pipe and yields their Doc one by one, in the order of the texts,
+    so a large corpus is never held in memory as a whole.
+
+    Example:
+        nlp = pipeline_selector_spacy("English", "small", components=["tok2vec", "tagger", "attribute_ruler", "lemmatizer"])
+        for doc in pipe_spacy(texts, nlp, batch_size=2000):
+            lemmas = [token.lemma_ for token in doc] if doc is not None else None
+
+    Args:
+        texts (Iterable[Any]): the texts, e.g. a list, a pd.Series or a generator
+        nlp (Language): a spaCy pipeline, e.g. from pipeline_selector_spacy
+        batch_size (int, optional): the number of texts spaCy processes at once. Defaults to 1000.
+        n_process (int, optional): the number of processes of nlp.pipe. Defaults to 1, the calling process.
+
+    Raises:
+        ValueError: if batch_size or n_process is not a positive integer
+
+    Yields:
+        Optional[Doc]: the Doc of every text, None for the values that are not strings
+    """
+    if not isinstance(batch_size, int) or batch_size < 1:
+        raise ValueError(f"batch_size must be a positive integer. Got {batch_size!r}")
+    if not isinstance(n_process, int) or n_process < 1:
+        raise ValueError(f"n_process must be a positive integer. Got {n_process!r}")
+
+    return _pipe_spacy(texts, nlp, batch_size, n_process)
+
+
+def _pipe_spacy(texts: Iterable[Any], nlp: "Language", batch_size: int, n_process: int) -> Iterator[Optional["Doc"]]:
+    # nlp.pipe reads the texts ahead of the Docs it yields, so whether each text was valid is queued until its turn
+    is_valid_queue: Deque[bool] = deque()
+
+    def valid_texts() -> Iterator[str]:
+        for text in texts:
+            is_valid = isinstance(text, str)
+            is_valid_queue.append(is_valid)
+            if is_valid:
+                yield text
+
+    for doc in nlp.pipe(valid_texts(), batch_size=batch_size, n_process=n_process):
+        while not is_valid_queue.popleft():
+            yield None
+        yield doc
+
+    # Every text is read by now, and the remaining ones are not strings
+    for _ in is_valid_queue:
+        yield None
+
+
+def _remove_emoticon(text: str) -> Tuple[str, int]:
+    return _emoticon_pattern().subn(r' ', text)
 
 
 def remove_emoticon(text: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
@@ -1058,13 +1722,22 @@ def remove_emoticon(text: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
     if pd.isnull(text) or not isinstance(text, str):
         return None, 0
 
-    return re.subn(EMOTICON_PATTERN, r' ', text)
+    return _remove_emoticon(text)
+
+
+def _abbreviation_converter(text: str) -> str:
+    abbreviation_dict = _abbreviation_dict()
+    return _abbreviation_pattern().sub(lambda x: abbreviation_dict[x.group()], text)
 
 
 def abbreviation_converter(text: Optional[str]) -> Optional[str]:
     """
     Converts abbreviation forms of the input text into the normal shape.
 
+    Note:
+        The typos/slang, acronym and abbreviation dictionaries are matched together in a single scan. Only whole
+        words are replaced, the longest abbreviation wins and a replacement is never scanned again.
+
     Args:
         text (Optional[str]): a text with abbreviation forms of words
 
@@ -1075,11 +1748,11 @@ def abbreviation_converter(text: Optional[str]) -> Optional[str]:
     if pd.isnull(text) or not isinstance(text, str):
         return None
 
-    text = re.sub(SAMPLE_TYPOS_SLANG_PATTERN, lambda x: SAMPLE_TYPOS_SLANG[x.group()], text)
-    text = re.sub(SAMPLE_ACRONYMS_PATTERN, lambda x: SAMPLE_ACRONYMS[x.group()], text)
-    text = re.sub(SAMPLE_ABBR_PATTERN, lambda x: SAMPLE_ABBR[x.group()], text)
+    return _abbreviation_converter(text)
 
-    return text
+
+def _remove_punctuation(text: str) -> str:
+    return PUNCTUATION_PATTERN.sub(" ", text)
 
 
 def remove_punctuation(text: Optional[str]) -> Optional[str]:
@@ -1096,7 +1769,83 @@ def remove_punctuation(text: Optional[str]) -> Optional[str]:
     if pd.isnull(text) or not isinstance(text, str):
         return None
 
-    return PUNCTUATION_PATTERN.sub(" ", text)
+    return _remove_punctuation(text)
+
+
+# The number of (word, WordNet POS) pairs whose lemma is kept. A WordNet lookup goes through the morphy rules
+# and the exception lists, and the same common words come back in every text.
+LEMMA_CACHE_SIZE = 2 ** 16
+
+
+@functools.lru_cache(maxsize=LEMMA_CACHE_SIZE)
+def _lemmatize_word(word: str, wordnet_pos: str) -> str:
+    return resources.get_lemmatizer().lemmatize(word, wordnet_pos)
+
+
+def lemma_cache_info() -> functools._CacheInfo:
+    """
+    Returns the statistics of the cache of lemmas used by to_lemmatize and to_lemmatize_batch.
+
+    Returns:
+        functools._CacheInfo: (hits, misses, maxsize, currsize)
+    """
+    return _lemmatize_word.cache_info()
+
+
+def clear_lemma_cache() -> None:
+    """
+    Empties the cache of lemmas and resets its statistics.
+    """
+    _lemmatize_word.cache_clear()
+
+
+def _lemmatize_tagged(pos_tagged_text: List[Tuple[str, str]]) -> str:
+    """
+    [Private function] Lemmatizes the words of a POS-tagged text.
+
+    Args:
+        pos_tagged_text (List[Tuple[str, str]]): (word, Penn Treebank tag) pairs
+
+    Returns:
+        str: the lemmatized text
+    """
+    return " ".join(_lemmatize_tagged_tokens(pos_tagged_text))
+
+
+def _lemmatize_tagged_tokens(pos_tagged_text: List[Tuple[str, str]]) -> List[str]:
+    # The first letter of the Penn Treebank tag gives the WordNet POS, a noun if it is none of them
+    wordnet_map = resources.get_wordnet_map()
+    noun = wordnet_map["N"]
+    return [_lemmatize_word(word, wordnet_map.get(pos[0], noun)) for word, pos in pos_tagged_text]
+
+
+def _lemmatize_tokens(tokens: List[str]) -> List[str]:
+    import nltk
+
+    return _lemmatize_tagged_tokens(nltk.pos_tag(tokens))
+
+
+def _to_lemmatize(text: str) -> str:
+    return " ".join(_lemmatize_tokens(text.split()))
+
+
+def _to_lemmatize_many(texts: Sequence[str]) -> List[str]:
+    """
+    [Private function] Lemmatizes many texts with a single call of the POS tagger.
+
+    Note:
+        nltk.pos_tag builds a new perceptron tagger, and reads its model, on every call. pos_tag_sents builds
+        it once for all the texts and tags each of them exactly like pos_tag does.
+
+    Args:
+        texts (Sequence[str]): texts that are strings
+
+    Returns:
+        List[str]: the lemmatized texts, in the same order
+    """
+    import nltk
+
+    return [_lemmatize_tagged(pos_tagged_text) for pos_tagged_text in nltk.pos_tag_sents([text.split() for text in texts])]
 
 
 def to_lemmatize(text: Optional[str]) -> Optional[str]:
@@ -1107,6 +1856,8 @@ def to_lemmatize(text: Optional[str]) -> Optional[str]:
         Lemmatization is the process of converting a word to its base form. The difference between stemming and lemmatization is, 
         lemmatization considers the context and converts the word to its meaningful base form, whereas stemming just removes 
         the last few characters, often leading to incorrect meanings and spelling errors.
+        The lemmas are cached per (word, POS) in a bounded LRU cache (see lemma_cache_info). To lemmatize many
+        texts, to_lemmatize_batch tags all of them with a single tagger instead of building one per text.
 
     More info:
         https://www.machinelearningplus.com/nlp/lemmatization-examples-python/
@@ -1124,8 +1875,7 @@ def to_lemmatize(text: Optional[str]) -> Optional[str]:
     if pd.isnull(text) or not isinstance(text, str):
         return None
 
-    pos_tagged_text = nltk.pos_tag(text.split())
-    return " ".join([lemmatizer.lemmatize(word, wordnet_map.get(pos[0], wordnet.NOUN)) for word, pos in pos_tagged_text])
+    return _to_lemmatize(text)
 
 
 def to_tokenize(text: Optional[str]) -> Optional[List[str]]:
@@ -1142,10 +1892,52 @@ def to_tokenize(text: Optional[str]) -> Optional[List[str]]:
     if pd.isnull(text) or not isinstance(text, str):
         return None
 
+    import nltk
+
     # alternative: return re.split('\W+', text)
     return nltk.word_tokenize(text)
 
 
+# The number of user patterns kept compiled. The internal cache of the re module is small and is cleared as
+# a whole when it is full, so it thrashes as soon as a few user patterns are used in turn.
+USER_REGEX_CACHE_SIZE = 512
+
+
+@functools.lru_cache(maxsize=USER_REGEX_CACHE_SIZE)
+def _compile_user_regex(regex: str) -> Optional[Pattern]:
+    """
+    [Private function] Compiles a user pattern once and keeps it in a bounded LRU cache.
+
+    Args:
+        regex (str): a regular expression
+
+    Returns:
+        Optional[Pattern]: the compiled pattern, or None if the regular expression is invalid
+    """
+    try:
+        return re.compile(regex)
+    except re.error:
+        return None
+
+
+def user_regex_cache_info() -> functools._CacheInfo:
+    """
+    Returns the statistics of the cache of compiled user patterns used by regex_validation_checker,
+    remove_regex_match and substitue_regex_match.
+
+    Returns:
+        functools._CacheInfo: (hits, misses, maxsize, currsize)
+    """
+    return _compile_user_regex.cache_info()
+
+
+def clear_user_regex_cache() -> None:
+    """
+    Empties the cache of compiled user patterns and resets its statistics.
+    """
+    _compile_user_regex.cache_clear()
+
+
 def regex_validation_checker(regex: Optional[str]) -> bool:
     """
     Checks if the given regular expression is valid.
@@ -1160,17 +1952,21 @@ def regex_validation_checker(regex: Optional[str]) -> bool:
     if pd.isnull(regex) or not isinstance(regex, str):
         return False
 
-    try:
-        re.compile(regex)
-        return True
-    except re.error:
-        return False
+    return _compile_user_regex(regex) is not None
+
+
+def _remove_regex_match(text: str, regex: Pattern) -> str:
+    return regex.sub(r'', text)
 
 
 def remove_regex_match(text: Optional[str], regex: Optional[str]) -> Optional[str]:
     """
     Removes the given regular expression from the given text.
 
+    Note:
+        The compiled pattern is kept in a bounded LRU cache (see user_regex_cache_info), so a pattern
+        applied to many texts is compiled once.
+
     Args:
         text (Optional[str]): a text that may contain the given regular expression
         regex (Optional[str]): a regular expression
@@ -1185,16 +1981,25 @@ def remove_regex_match(text: Optional[str], regex: Optional[str]) -> Optional[st
     if pd.isnull(regex) or not isinstance(regex, str):
         return None
 
-    if not regex_validation_checker(regex):
+    pattern = _compile_user_regex(regex)
+    if pattern is None:
         return None
 
-    return re.sub(regex, r'', text)
+    return _remove_regex_match(text, pattern)
+
+
+def _substitue_regex_match(text: str, regex: Pattern, sub_text: str) -> str:
+    return regex.sub(sub_text, text)
 
 
 def substitue_regex_match(text: Optional[str], regex: Optional[str], sub_text: Optional[str]) -> Optional[str]:
     """
     Substituts with a string w.r.t the given regular expression.
 
+    Note:
+        The compiled pattern is kept in a bounded LRU cache (see user_regex_cache_info), so a pattern
+        applied to many texts is compiled once.
+
     Args:
         text (Optional[str]): a text that may contain the given regular expression
         regex (Optional[str]): a regular expression
@@ -1213,80 +2018,105 @@ def substitue_regex_match(text: Optional[str], regex: Optional[str], sub_text: O
     if pd.isnull(regex) or not isinstance(regex, str):
         return None
 
-    if not regex_validation_checker(regex):
+    pattern = _compile_user_regex(regex)
+    if pattern is None:
         return None
 
-    return re.sub(regex, sub_text, text)
+    return _substitue_regex_match(text, pattern, sub_text)
+
 
+def _remove_words_series(text_series: pd.Series, words: AbstractSet[str]) -> pd.Series:
+    # Like the batch functions, the rows that are not strings become None
+    texts = [_remove_stopwords(text, words) if isinstance(text, str) else None for text in text_series.values]
+    return pd.Series(texts, index=text_series.index, name=text_series.name, dtype=object)
 
-def remove_common_words(text_series: Optional[pd.Series], common_words_num: Optional[int]) -> Optional[pd.Series]:
+
+def remove_common_words(text_series: Optional[pd.Series], common_words_num: Optional[int], n_workers: int = 1) -> Optional[pd.Series]:
     """
     Removes the common words from the given text set.
 
+    Note:
+        The words are counted chunk by chunk by a FrequencyTable, in a pool of processes if n_workers > 1, and the
+        common words are selected without sorting the vocabulary. To remove the common words of a corpus that does
+        not fit in memory, build its FrequencyTable from the chunks of the corpus and remove its
+        most_common_words(k) from every chunk with remove_stopwords_batch.
+
     Args:
         text_series (Optional[pd.Series]):  a text series that may contain the common words
-        common_words_num (Optional[int]): the number of the common words that will be removed
+        common_words_num (Optional[int]): the number of the common words that will be removed, the ties are broken
+            like Counter.most_common
+        n_workers (int, optional): the number of processes that count the words. Defaults to 1.
 
     Returns:
         Optional[pd.Series]: a purified text set that does not contain the common words
     """
     # Input checking
-    if pd.isnull(text_series) or not isinstance(text_series, pd.Series):
+    if not isinstance(text_series, pd.Series):
         return None
 
     if pd.isnull(common_words_num) or not isinstance(common_words_num, int):
         return None
 
-    cnt = Counter()
-    for text in text_series.values:
-        for word in text.split():
-            cnt[word] += 1
-
     # Find the frequent words
-    freq = set([w for (w, wc) in cnt.most_common(common_words_num)])
-
-    for text in text_series.values:
-        text = " ".join([word for word in str(text).split() if word not in freq])
+    freq = FrequencyTable.from_texts(text_series.values, n_workers=n_workers).most_common_words(common_words_num)
 
-    return text_series
+    return _remove_words_series(text_series, freq)
 
 
-def remove_rare_words(text_series: Optional[pd.Series], rare_words_num: Optional[int]) -> Optional[pd.Series]:
+def remove_rare_words(text_series: Optional[pd.Series], rare_words_num: Optional[int], n_workers: int = 1) -> Optional[pd.Series]:
     """
     Removes the rare words from the given text set.
 
+    Note:
+        The words are counted like in remove_common_words, and the rare words are selected without sorting the
+        vocabulary.
+
     Args:
         text_series (Optional[pd.Series]):  a text series that may contain the rare words
-        rare_words_num (Optional[int]): the number of the rare words that will be removed
+        rare_words_num (Optional[int]): the number of the rare words that will be removed, the ties are broken like
+            Counter.most_common()[:-rare_words_num - 1:-1]
+        n_workers (int, optional): the number of processes that count the words. Defaults to 1.
 
     Returns:
         Optional[pd.Series]: a purified text set that does not contain the rare words
     """
     # Input checking
-    if pd.isnull(text_series) or not isinstance(text_series, pd.Series):
+    if not isinstance(text_series, pd.Series):
         return None
 
     if pd.isnull(rare_words_num) or not isinstance(rare_words_num, int):
         return None
 
-    cnt = Counter()
-    for text in text_series.values:
-        for word in text.split():
-            cnt[word] += 1
-
     # Find the rare words
-    rare = set([w for (w, wc) in cnt.most_common()[:-rare_words_num-1:-1]])
+    rare = FrequencyTable.from_texts(text_series.values, n_workers=n_workers).least_common_words(rare_words_num)
+
+    return _remove_words_series(text_series, rare)
+
+
+def _emoticon_replacement(match) -> str:
+    literal_replacements, regex_replacements = _emoticon_replacements()
+    emoticon = match.group()
+    if emoticon in literal_replacements:
+        return literal_replacements[emoticon]
 
-    for text in text_series.values:
-        text = " ".join([word for word in str(text).split() if word not in rare])
+    for emot_pattern, emot_replacement in regex_replacements:
+        if emot_pattern.fullmatch(emoticon):
+            return emot_replacement
+    return emoticon
 
-    return text_series
+
+def _convert_emoticon_to_words(text: str) -> str:
+    return _emoticon_words_pattern().sub(_emoticon_replacement, text)
 
 
 def convert_emoticon_to_words(text: Optional[str]) -> Optional[str]:
     """
     Converts emoticons to words.
 
+    Note:
+        All emoticons are converted in a single scan of the text. When several emoticons start at the same
+        position the longest one wins (e.g. ":-))" is very happy rather than a smiley followed by ")").
+
     Args:
         text (Optional[str]): a text that may contain emoticons
 
@@ -1297,16 +2127,26 @@ def convert_emoticon_to_words(text: Optional[str]) -> Optional[str]:
     if pd.isnull(text) or not isinstance(text, str):
         return None
 
-    for emot in Emoticon_Dict:
-        text = re.sub(u'('+emot+')', "_".join(Emoticon_Dict[emot].replace(",", "").split()) + " ", text)
+    return _convert_emoticon_to_words(text)
 
-    return text
+
+def _convert_emoji_to_words(text: str) -> str:
+    # Every emoji has a non-ASCII codepoint, so plain ASCII texts are returned without scanning them
+    if text.isascii():
+        return text
+
+    emoji_replacements = _emoji_replacements()
+    return _emoji_words_pattern().sub(lambda x: emoji_replacements[x.group()], text)
 
 
 def convert_emoji_to_words(text: Optional[str]) -> Optional[str]:
     """
     Converts emojis to words.
 
+    Note:
+        All emojis are converted in a single scan of the text. Emoji sequences (skin tones, ZWJ sequences, flags)
+        are matched as a whole, the longest sequence winning.
+
     Args:
         text (Optional[str]): a text that may contain emojis
 
@@ -1317,25 +2157,26 @@ def convert_emoji_to_words(text: Optional[str]) -> Optional[str]:
     if pd.isnull(text) or not isinstance(text, str):
         return None
 
-    for emot in UNICODE_EMOJI:
-        text = text.replace(emot, "_".join(UNICODE_EMOJI[emot].replace(",", "").replace(":", "").split()) + " ")
-
-    return text
+    return _convert_emoji_to_words(text)
 
 
-def add_word_to_stopwords_set(stop_words: Optional[set], word: Union[list, set, str]) -> Optional[set]:
+def add_word_to_stopwords_set(stop_words: Optional[AbstractSet[str]], word: Union[list, set, str]) -> Optional[AbstractSet[str]]:
     """
     Adds a word to the stop words set.
 
+    Note:
+        The given set is never changed. The frozenset of stopwords_nltk gives a frozenset that is derived once per
+        (set, words) and shared, while a set gives a new set.
+
     Args:
-        stop_words (Optional[set]): a stop words set
-        word (Union[list, str]): a word or a list of words that will be added to the stop words set
+        stop_words (Optional[AbstractSet[str]]): a stop words set or frozenset
+        word (Union[list, set, str]): a word or a list of words that will be added to the stop words set
 
     Returns:
-        Optional[set]: a stop words set that does not contain the given word
+        Optional[AbstractSet[str]]: a stop words set that contains the given word
     """
     # Input checking
-    if pd.isnull(stop_words) or not isinstance(stop_words, set):
+    if pd.isnull(stop_words) or not isinstance(stop_words, (set, frozenset)):
         return None
 
     # Check the empty set
@@ -1356,23 +2197,75 @@ def add_word_to_stopwords_set(stop_words: Optional[set], word: Union[list, set,
     if len(word) == 0:
         return stop_words
 
-    # The add function, adds a single element to the existing set or
-    # original set so we create a new instance of that
-    stop_words = set(stop_words)
+    words = frozenset([word]) if isinstance(word, str) else frozenset(word)
+
+    if isinstance(stop_words, frozenset):
+        return _add_words_to_stopwords(stop_words, words)
+
+    # A set can be changed by its owner, so it is not cached
+    return stop_words | words
+
+
+# The number of words whose correction is kept. The same misspellings come back in tweet after tweet and a
+# correction is an edit distance search that costs milliseconds.
+SPELL_CORRECTION_CACHE_SIZE = 2 ** 16
+
+
+@functools.lru_cache(maxsize=SPELL_CORRECTION_CACHE_SIZE)
+def _correct_word(word: str) -> str:
+    """
+    [Private function] Corrects a single word with the spell checker version 1, once per word.
+
+    Note:
+        SpellChecker.unknown lowercases the words, so only a lowercase word can be found misspelled and a
+        word with capitals is kept as it is. A word without any candidate is kept as well.
+
+    Args:
+        word (str): a word
+
+    Returns:
+        str: the corrected word
+    """
+    spell = resources.get_spell_checker()
+    if word not in spell.unknown([word]):
+        return word
+
+    correction = spell.correction(word)
+    return word if correction is None else correction
+
+
+def spell_correction_cache_info() -> functools._CacheInfo:
+    """
+    Returns the statistics of the cache of corrected words used by spell_correction_v1.
+
+    Returns:
+        functools._CacheInfo: (hits, misses, maxsize, currsize)
+    """
+    return _correct_word.cache_info()
+
+
+def clear_spell_correction_cache() -> None:
+    """
+    Empties the caches of corrected words of both spell correction versions and of Spell_checker_v1, and resets
+    their statistics.
+    """
+    _correct_word.cache_clear()
+    _correct_word_v2.cache_clear()
+    _autocorrect_word.cache_clear()
 
-    if isinstance(word, str):
-        stop_words.add(word)
-    elif isinstance(word, (list, set)):
-        for w in word:
-            stop_words.add(w)
 
-    return stop_words
+def _spell_correction_v1(text: str) -> str:
+    return " ".join([_correct_word(word) for word in text.split()])
 
 
 def spell_correction_v1(text: Optional[str]) -> Optional[str]:
     """
     Corrects the spelling of the given text.
 
+    Note:
+        The corrections are cached per word in a bounded LRU cache (see spell_correction_cache_info), so a
+        misspelling is only searched once across all the calls.
+
     Args:
         text (Optional[str]): a text that may contain misspelled words
 
@@ -1383,14 +2276,57 @@ def spell_correction_v1(text: Optional[str]) -> Optional[str]:
     if pd.isnull(text) or not isinstance(text, str):
         return None
 
-    corrected_text = []
-    misspelled_words = spell.unknown(text.split())
-    for word in text.split():
-        if word in misspelled_words:
-            corrected_text.append(spell.correction(word))
-        else:
-            corrected_text.append(word)
-    return " ".join(corrected_text)
+    return _spell_correction_v1(text)
+
+
+@functools.lru_cache(maxsize=SPELL_CORRECTION_CACHE_SIZE)
+def _correct_word_v2(word: str) -> str:
+    """
+    [Private function] Corrects a single word with the spell checker version 2, once per word.
+
+    Note:
+        Like _correct_word, only a lowercase word can be found misspelled, and numbers, single punctuation
+        characters and words without any candidate are kept as they are.
+
+    Args:
+        word (str): a word
+
+    Returns:
+        str: the corrected word
+    """
+    symspell = resources.get_symspell()
+    if word != word.lower() or not symspell.is_checkable(word) or word in symspell:
+        return word
+
+    correction = symspell.lookup(word)
+    return word if correction is None else correction
+
+
+def _spell_correction_v2(text: str) -> str:
+    return " ".join([_correct_word_v2(word) for word in text.split()])
+
+
+def spell_correction_v2(text: Optional[str]) -> Optional[str]:
+    """
+    Corrects the spelling of the given text with a symmetric delete index (SymSpell) of the pyspellchecker word
+    frequency list. The corrections are comparable to spell_correction_v1, but a misspelling is found with a few
+    binary searches instead of checking every possible edit.
+
+    Note:
+        The index is built once into resources.CACHE_DIR and then memory-mapped, see resources.get_symspell.
+        The corrections are cached per word like spell_correction_v1.
+
+    Args:
+        text (Optional[str]): a text that may contain misspelled words
+
+    Returns:
+        Optional[str]: a text that does not contain misspelled words
+    """
+    # Input checking
+    if pd.isnull(text) or not isinstance(text, str):
+        return None
+
+    return _spell_correction_v2(text)
 
 # TODO: hel_lo convert to hello
 # TODO: camelcase
@@ -1400,11 +2336,66 @@ def spell_correction_v1(text: Optional[str]) -> Optional[str]:
 # TODO: I have to work on the below class as a the second version of the spell correction class. Aso: https://github.com/Deffro/text-preprocessing-techniques/blob/master/techniques.py
 
 
+# The languages of the autocorrect library: name -> code
+AUTOCORRECT_LANGUAGES = {
+    "english": "en",
+    "polish": "pl",
+    "russian": "ru",
+    "ukrainian": "uk",
+    "turkish": "tr",
+    "spanish": "es",
+    "portuguese": "pt",
+    "czech": "cs",
+    "greek": "el",
+    "italian": "it",
+    "french": "fr",
+    "vietnamese": "vi"
+}
+
+
+def _autocorrect_language(lang: Any) -> Optional[str]:
+    """
+    [Private function] Returns the autocorrect code of a language given by its code or its name.
+
+    Args:
+        lang (Any): a language code, e.g. "en", or name, e.g. "english"
+
+    Returns:
+        Optional[str]: the language code, or None if autocorrect does not support the language
+    """
+    if pd.isnull(lang) or not isinstance(lang, str):
+        return None
+    elif len(lang) < 3:
+        # We know that lang is in the abbriviation form
+        return lang if lang in AUTOCORRECT_LANGUAGES.values() else None
+    else:
+        return AUTOCORRECT_LANGUAGES.get(lang)
+
+
+@functools.lru_cache(maxsize=SPELL_CORRECTION_CACHE_SIZE)
+def _autocorrect_word(lang: str, fast: bool, word: str) -> str:
+    """
+    [Private function] Corrects a single word with the shared Speller of a language, once per word.
+
+    Args:
+        lang (str): a language code of autocorrect
+        fast (bool): only corrects single typos
+        word (str): a word
+
+    Returns:
+        str: the corrected word
+    """
+    return resources.get_speller(lang, fast).autocorrect_word(word)
+
+
 class Spell_checker_v1():
     """
     This is spell correction class and supports 12 languages including: English, Polish, Turkish, Russian, Ukrainian, Czech, Portuguese, Greek,
     # Italian, Vietnamese, French and Spanish. However, we can easily add new languages.
 
+    The Spellers are shared by all the instances (see resources.get_speller) and the corrected words are cached per
+    language, so creating a checker per request does not load the language again.
+
     Reference: https://github.com/filyp/autocorrect
     """
 
@@ -1419,50 +2410,69 @@ class Spell_checker_v1():
             lang (str, optional): _description_. Defaults to "en".
             speed (bool, optional): _description_. Defaults to False.
         """
-        # The below languages are supported by the Autocorrect library.
-        self.lang_dic = {
-            "english": "en",
-            "polish": "pl",
-            "russian": "ru",
-            "ukrainian": "uk",
-            "turkish": "tr",
-            "spanish": "es",
-            "portuguese": "pt",
-            "czech": "cs",
-            "greek": "el",
-            "italian": "it",
-            "french": "fr",
-            "vietnamese": "vi"
-        }
-
-        if pd.isnull(lang) or not isinstance(lang, str):
-            self.lang = None
-        elif len(lang) < 3:
-            # We know that lang is in the abbriviation form
-            self.lang = self._lang_checker(lang)
-        else:
-            self.lang = self._lang_conversion(lang)
-
+        # The languages supported by the Autocorrect library are listed in AUTOCORRECT_LANGUAGES
+        self.lang = _autocorrect_language(lang)
         self.speed = speed
-        self.speller = Speller(lang=self.lang, fast=self.speed)
-
-    def _lang_checker(self, lang: str):
-        if lang in self.lang_dic.values():
-            return lang
-        else:
-            return None
-
-    def _lang_conversion(self, lang: str) -> Optional[str]:
-        if lang not in self.lang_dic:
-            return None
-        else:
-            return self.lang_dic[lang]
+        self.speller = resources.get_speller(self.lang, self.speed)
 
     def autocorrect_sentence(self, text: Optional[str]) -> Optional[str]:
         # Input checking
         if pd.isnull(text) or not isinstance(text, str):
             return None
 
-        return self.speller(text)
+        return re.sub(word_regexes[self.lang], lambda match: _autocorrect_word(self.lang, self.speed, match.group(0)), text)
 
     __call__ = autocorrect_sentence
+
+    def autocorrect_series(self, text_series: Optional[pd.Series],
+                           langs: Optional[Union[str, Sequence[Optional[str]], pd.Series]] = None) -> Optional[pd.Series]:
+        """
+        Corrects the spelling of every text of a series. The texts are grouped by language, the unique words of
+        each group are corrected once with the Speller of the language, then the corrections are mapped back.
+
+        Example:
+            Spell_checker_v1("en").autocorrect_series(df["text"], langs=df["language"])
+
+        Args:
+            text_series (Optional[pd.Series]): a text series that may contain misspelled words
+            langs (Optional[Union[str, Sequence[Optional[str]], pd.Series]], optional): the language code or name of
+                every text, or one language for all of them. A text of a language that autocorrect does not support
+                is kept as it is. Defaults to the language of the checker.
+
+        Raises:
+            ValueError: if there is not one language per text
+
+        Returns:
+            Optional[pd.Series]: the corrected texts, None for the texts that are not strings
+        """
+        # Input checking
+        if not isinstance(text_series, pd.Series):
+            return None
+
+        if langs is None or isinstance(langs, str):
+            text_langs = [_autocorrect_language(self.lang if langs is None else langs)] * len(text_series)
+        else:
+            text_langs = [_autocorrect_language(lang) for lang in langs]
+            if len(text_langs) != len(text_series):
+                raise ValueError(f"langs must have one language per text. Got {len(text_langs)} for {len(text_series)} texts")
+
+        texts = text_series.values
+        corrected_texts = np.full(len(texts), None, dtype=object)
+
+        rows_by_lang: Dict[Optional[str], List[int]] = {}
+        for row, (text, lang) in enumerate(zip(texts, text_langs)):
+            if isinstance(text, str):
+                rows_by_lang.setdefault(lang, []).append(row)
+
+        for lang, rows in rows_by_lang.items():
+            if lang is None:
+                corrected_texts[rows] = texts[rows]
+                continue
+
+            word_regex = re.compile(word_regexes[lang])
+            words = {match.group(0) for row in rows for match in word_regex.finditer(texts[row])}
+            corrections = {word: _autocorrect_word(lang, self.speed, word) for word in words}
+            for row in rows:
+                corrected_texts[row] = word_regex.sub(lambda match: corrections[match.group(0)], texts[row])
+
+        return pd.Series(corrected_texts, index=text_series.index, name=text_series.name, dtype=object)
@@ -0,0 +1,275 @@
+"""Module providing an interned token vocabulary and a corpus stored as arrays of token ids."""
+# ───────────────────────────────── Imports ────────────────────────────────── #
+# Standard Library
+from collections import defaultdict
+from itertools import chain
+from typing import AbstractSet, Any, DefaultDict, Iterable, List, Optional
+import numpy as np
+
+# 3rd Party
+
+# Private
+from nlp_utils.preprocessing.frequency import _select_positions
+
+# ───────────────────────────────── Code ────────────────────────────────── #
+# A tokenized corpus as lists of Python strings costs a list per text and a pointer (and often a str object) per
+# token. A TokenCorpus keeps a single int32 array of the ids of all the tokens and an int64 array of the offsets
+# where every text starts, so the token-level steps become NumPy operations on the ids (a lookup table of the ids
+# to drop, np.bincount for the frequencies) and the texts are only joined back into strings once, at the end.
+
+# The id of a token that is not in the vocabulary
+UNKNOWN_ID = -1
+
+
+class Vocabulary():
+    """
+    Interns the tokens: every distinct token gets an int32 id, in the order the tokens were first seen.
+
+    Example:
+        vocabulary = Vocabulary()
+        vocabulary.encode(["the", "cat", "the"])  # array([0, 1, 0], dtype=int32)
+        vocabulary.decode([1, 0])  # ["cat", "the"]
+    """
+
+    def __init__(self, tokens: Iterable[str] = ()) -> None:
+        """
+        Constructs a vocabulary.
+
+        Args:
+            tokens (Iterable[str], optional): the first tokens. Defaults to an empty vocabulary.
+        """
+        # A missing token gets the next id: the factory runs before the token is inserted
+        self._ids: DefaultDict[str, int] = defaultdict(lambda: len(self._ids))
+        self._tokens: List[str] = []
+        self._token_array: Optional[np.ndarray] = None
+        self.encode(tokens)
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def __contains__(self, token: str) -> bool:
+        return token in self._ids
+
+    def __getitem__(self, token: str) -> int:
+        return self._ids.get(token, UNKNOWN_ID)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(tokens={len(self._tokens)})"
+
+    def _sync_tokens(self) -> None:
+        # The new tokens are at the end of the dict, which keeps the insertion order
+        if len(self._tokens) < len(self._ids):
+            self._tokens.extend(list(self._ids)[len(self._tokens):])
+            self._token_array = None
+
+    def encode(self, tokens: Iterable[str], add: bool = True) -> np.ndarray:
+        """
+        Finds the ids of the tokens.
+
+        Args:
+            tokens (Iterable[str]): tokens
+            add (bool, optional): gives the new tokens an id, otherwise they get UNKNOWN_ID. Defaults to True.
+
+        Returns:
+            np.ndarray: the int32 ids of the tokens
+        """
+        if add:
+            ids = np.fromiter(map(self._ids.__getitem__, tokens), dtype=np.int32)
+            self._sync_tokens()
+            return ids
+        return np.fromiter((self._ids.get(token, UNKNOWN_ID) for token in tokens), dtype=np.int32)
+
+    def decode(self, ids: Iterable[int]) -> List[str]:
+        """
+        Finds the tokens of the ids.
+
+        Args:
+            ids (Iterable[int]): ids of the vocabulary
+
+        Returns:
+            List[str]: the tokens
+        """
+        return self.token_array()[np.asarray(ids, dtype=np.int64)].tolist()
+
+    def token_array(self) -> np.ndarray:
+        """
+        Returns the tokens as an object array indexed by their ids, built once per size of the vocabulary.
+
+        Returns:
+            np.ndarray: id -> token
+        """
+        if self._token_array is None or len(self._token_array) != len(self._tokens):
+            self._token_array = np.array(self._tokens, dtype=object)
+        return self._token_array
+
+    def lookup_table(self, tokens: Iterable[str]) -> np.ndarray:
+        """
+        Builds a boolean table of the ids of the given tokens, e.g. of the stopwords. Indexing it with the ids of
+        a corpus tells which tokens of the corpus are in the given ones.
+
+        Args:
+            tokens (Iterable[str]): tokens; the ones that are not in the vocabulary are ignored
+
+        Returns:
+            np.ndarray: id -> whether the token is one of the given ones
+        """
+        table = np.zeros(len(self._tokens), dtype=bool)
+        ids = np.fromiter((self._ids.get(token, UNKNOWN_ID) for token in tokens), dtype=np.int64)
+        table[ids[ids != UNKNOWN_ID]] = True
+        return table
+
+
+class TokenCorpus():
+    """
+    A tokenized corpus stored as one flat array of token ids and the offsets of the texts in it. The texts are
+    split on whitespace, like the steps of text_preprocessing, and the rows that are not strings are kept as None.
+
+    Note:
+        The operations return a new corpus over the same vocabulary. A corpus takes 4 bytes per token and 9 bytes
+        per text, plus its vocabulary, which the corpora of the same language can share.
+
+    Example:
+        corpus = TokenCorpus.from_texts(df["text"])
+        corpus = corpus.remove_tokens(stopwords_nltk(["english"])).remove_rare_tokens(1000)
+        df["clean_text"] = corpus.decode()
+    """
+
+    def __init__(self, vocabulary: Vocabulary, ids: np.ndarray, offsets: np.ndarray, valid: np.ndarray) -> None:
+        """
+        Constructs a corpus from its arrays. Use from_texts instead.
+
+        Args:
+            vocabulary (Vocabulary): the vocabulary of the ids
+            ids (np.ndarray): the int32 ids of all the tokens, text after text
+            offsets (np.ndarray): the int64 start of every text in the ids, and the end of the last one
+            valid (np.ndarray): whether every text was a string
+        """
+        self.vocabulary = vocabulary
+        self.ids = ids
+        self.offsets = offsets
+        self.valid = valid
+
+    @classmethod
+    def from_texts(cls, texts: Iterable[Any], vocabulary: Optional[Vocabulary] = None) -> "TokenCorpus":
+        """
+        Tokenizes the texts on whitespace and interns their tokens.
+
+        Args:
+            texts (Iterable[Any]): texts, e.g. a Series; the ones that are not strings become None
+            vocabulary (Optional[Vocabulary], optional): the vocabulary to extend, e.g. the one of another corpus.
+                Defaults to a new vocabulary.
+
+        Returns:
+            TokenCorpus: the corpus of the texts
+        """
+        vocabulary = Vocabulary() if vocabulary is None else vocabulary
+
+        text_list = list(texts)
+        valid = np.fromiter((isinstance(text, str) for text in text_list), dtype=bool, count=len(text_list))
+        split_texts = [text.split() if isinstance(text, str) else [] for text in text_list]
+
+        offsets = np.zeros(len(split_texts) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, split_texts), dtype=np.int64, count=len(split_texts)), out=offsets[1:])
+
+        ids = vocabulary.encode(chain.from_iterable(split_texts))
+        return cls(vocabulary, ids, offsets, valid)
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(texts={len(self)}, tokens={self.n_tokens}, vocabulary={len(self.vocabulary)})"
+
+    @property
+    def n_tokens(self) -> int:
+        return len(self.ids)
+
+    @property
+    def nbytes(self) -> int:
+        return self.ids.nbytes + self.offsets.nbytes + self.valid.nbytes
+
+    def lengths(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    def text_ids(self, position: int) -> np.ndarray:
+        return self.ids[self.offsets[position]:self.offsets[position + 1]]
+
+    def counts(self) -> np.ndarray:
+        """
+        Counts the occurrences of every token of the vocabulary in the corpus.
+
+        Returns:
+            np.ndarray: id -> number of occurrences
+        """
+        return np.bincount(self.ids, minlength=len(self.vocabulary))
+
+    def filter(self, keep: np.ndarray) -> "TokenCorpus":
+        """
+        Keeps the tokens of a mask.
+
+        Args:
+            keep (np.ndarray): whether every token of the corpus is kept, in the order of the ids
+
+        Returns:
+            TokenCorpus: the corpus of the kept tokens
+        """
+        # The number of kept tokens before every offset gives the new offsets
+        kept_before = np.zeros(len(keep) + 1, dtype=np.int64)
+        np.cumsum(keep, out=kept_before[1:])
+        return TokenCorpus(self.vocabulary, self.ids[keep], kept_before[self.offsets], self.valid)
+
+    def remove_tokens(self, tokens: AbstractSet[str]) -> "TokenCorpus":
+        """
+        Removes the given tokens, e.g. the stopwords, like remove_stopwords.
+
+        Args:
+            tokens (AbstractSet[str]): the tokens to remove
+
+        Returns:
+            TokenCorpus: the corpus without the tokens
+        """
+        return self.filter(~self.vocabulary.lookup_table(tokens)[self.ids])
+
+    def _remove_by_count(self, k: int, most_common: bool) -> "TokenCorpus":
+        counts = self.counts()
+        # Only the tokens of the corpus compete; their ids are in the order the vocabulary first saw them
+        present_ids = np.flatnonzero(counts)
+        drop_table = np.zeros(len(counts), dtype=bool)
+        drop_table[present_ids[_select_positions(counts[present_ids], k, most_common)]] = True
+        return self.filter(~drop_table[self.ids])
+
+    def remove_common_tokens(self, k: int) -> "TokenCorpus":
+        """
+        Removes the k most common tokens of the corpus, like remove_common_words.
+
+        Args:
+            k (int): the number of tokens to remove
+
+        Returns:
+            TokenCorpus: the corpus without the tokens
+        """
+        return self._remove_by_count(k, most_common=True)
+
+    def remove_rare_tokens(self, k: int) -> "TokenCorpus":
+        """
+        Removes the k least common tokens of the corpus, like remove_rare_words.
+
+        Args:
+            k (int): the number of tokens to remove
+
+        Returns:
+            TokenCorpus: the corpus without the tokens
+        """
+        return self._remove_by_count(k, most_common=False)
+
+    def decode(self) -> List[Optional[str]]:
+        """
+        Joins the tokens of every text back into a string.
+
+        Returns:
+            List[Optional[str]]: the texts, None for the rows that were not strings
+        """
+        tokens = self.vocabulary.token_array()[self.ids].tolist()
+        offsets = self.offsets.tolist()
+        return [" ".join(tokens[offsets[position]:offsets[position + 1]]) if is_valid else None
+                for position, is_valid in enumerate(self.valid.tolist())]
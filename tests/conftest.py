@@ -0,0 +1,25 @@
+"""Module providing the fixtures shared by all the tests."""
+# ───────────────────────────────── Imports ────────────────────────────────── #
+# Standard library
+from pathlib import Path
+from typing import Iterator
+
+# 3rd Party
+import pytest
+
+# Private
+from nlp_utils.preprocessing import resources
+
+# ───────────────────────────────── Fixtures ────────────────────────────────── #
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cache_dir(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """Builds the cached resources, e.g. the SymSpell index, in a temporary directory instead of ~/.cache/nlp_utils."""
+    path = tmp_path_factory.mktemp("nlp_utils_cache")
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(resources, "CACHE_DIR", path)
+        # The worker processes of a pool that do not fork read the directory from the environment
+        monkeypatch.setenv("NLP_UTILS_CACHE_DIR", str(path))
+        yield path
@@ -1,7 +1,7 @@
 """Module providing utility dbs for developers to test the performance of the preprocessing moduls. """
 # ───────────────────────────────── Imports ────────────────────────────────── #
 # Standard library
-from typing import List, Union
+from typing import List, Optional, Union
 import pandas as pd
 import warnings
 
@@ -116,3 +116,32 @@ class Synthetic_tweet_multi_language:
 
     def get_row_info(self, text: str) -> pd.DataFrame:
         return self.selected_tweet_df.loc[self.selected_tweet_df['tweet_full_text'] == text]
+
+
+class Detected_tweet_languages:
+    """
+        Tweets with the languages detected by spaCy and langdetect, for testing the language detection.
+    """
+
+    def __init__(self, n_samples: Optional[int] = None, seed: int = 100):
+        self.n_samples = n_samples
+        self.seed = seed
+
+        tweet_df = pd.read_csv("./Datasets/Twitter_Detected_Languages.csv")
+
+        if n_samples is None or n_samples > len(tweet_df):
+            n_samples = len(tweet_df)
+
+        self.selected_tweet_df = tweet_df.sample(n=n_samples, random_state=seed)
+
+    def __repr__(self) -> str:
+        return f"Detected_tweet_languages_db(n_samples={self.n_samples}, seed={self.seed})"
+
+    def get_text_list(self) -> List:
+        return self.selected_tweet_df.tweets.values.tolist()
+
+    def get_df(self) -> pd.DataFrame:
+        return self.selected_tweet_df
+
+    def get_label(self, detector: str = "langdetect") -> List:
+        return self.selected_tweet_df[f"languages_{detector}"].values.tolist()
@@ -0,0 +1,180 @@
+"""Module providing tests for the batch preprocessing functions."""
+# ───────────────────────────────── Imports ────────────────────────────────── #
+# Standard library
+from typing import List, Optional
+import numpy as np
+import pandas as pd
+
+# 3rd Party
+import pytest
+
+# Private
+import test_unit.nlp_utils.test_preprocessing._synthetic_dbs as dbs
+from nlp_utils.preprocessing import text_preprocessing as tp
+from nlp_utils.preprocessing import batch_preprocessing as bp
+
+# ───────────────────────────────── Tests ────────────────────────────────── #
+
+# (scalar function, batch function, extra arguments)
+BATCH_FUNCTIONS = [
+    (tp.remove_xml, bp.remove_xml_batch, {}),
+    (tp.to_lower, bp.to_lower_batch, {}),
+    (tp.remove_number, bp.remove_number_batch, {}),
+    (tp.to_strip, bp.to_strip_batch, {}),
+    (tp.remove_any_char, bp.remove_any_char_batch, {}),
+    (tp.remove_all_duplication, bp.remove_all_duplication_batch, {}),
+    (tp.remove_consecutive_duplication, bp.remove_consecutive_duplication_batch, {}),
+    (tp.remove_many_spaces, bp.remove_many_spaces_batch, {}),
+    (tp.remove_emoji, bp.remove_emoji_batch, {}),
+    (tp.remove_url, bp.remove_url_batch, {}),
+    (tp.remove_twitter_username, bp.remove_twitter_username_batch, {}),
+    (tp.remove_username, bp.remove_username_batch, {}),
+    (tp.remove_hashtag, bp.remove_hashtag_batch, {}),
+    (tp.remove_email_address, bp.remove_email_address_batch, {}),
+    (tp.remove_special_char, bp.remove_special_char_batch, {"special_char": ["&amp;", "#"]}),
+    (tp.remove_special_char, bp.remove_special_char_batch, {"special_char": "#"}),
+    (tp.expand_contractions, bp.expand_contractions_batch, {}),
+    (tp.remove_stopwords, bp.remove_stopwords_batch, {"stopwords": {"i", "a", "the", "and"}}),
+    (tp.remove_stopwords, bp.remove_stopwords_batch, {"stopwords": None}),
+    (tp.remove_emoticon, bp.remove_emoticon_batch, {}),
+    (tp.abbreviation_converter, bp.abbreviation_converter_batch, {}),
+    (tp.remove_punctuation, bp.remove_punctuation_batch, {}),
+    (tp.to_lemmatize, bp.to_lemmatize_batch, {}),
+    (tp.convert_emoticon_to_words, bp.convert_emoticon_to_words_batch, {}),
+    (tp.convert_emoji_to_words, bp.convert_emoji_to_words_batch, {}),
+    (tp.remove_regex_match, bp.remove_regex_match_batch, {"regex": r"\d+"}),
+    (tp.substitue_regex_match, bp.substitue_regex_match_batch, {"regex": r"(\w+)@(\w+)", "sub_text": r"\2 at \1"}),
+]
+
+
+def _text_series(n_samples: int) -> pd.Series:
+    """Synthetic tweets plus the values the scalar functions reject, on a shuffled non-default index."""
+    texts = dbs.Synthetic_tweet_emotion_en(n_samples=n_samples).get_text_list()
+    texts += [None, np.nan, 123, "", "   ", "Hello 👩‍💻 :) <b>@user</b> #tag www.google.com a@b.com"]
+    return pd.Series(texts, index=np.arange(len(texts))[::-1] * 2, name="text")
+
+
+class TestBatch:
+    @pytest.mark.parametrize(
+        "scalar_func, batch_func, kwargs",
+        BATCH_FUNCTIONS,
+        ids=[f"{batch_func.__name__}-{i}" for i, (_, batch_func, _) in enumerate(BATCH_FUNCTIONS)],
+    )
+    def test_batch_matches_scalar(self, scalar_func, batch_func, kwargs):
+
+        text_series = _text_series(n_samples=200)
+        ex_results = [scalar_func(text, **kwargs) for text in text_series.values]
+
+        result = batch_func(text_series, **kwargs)
+
+        if isinstance(result, tuple):
+            result_series, result_counts = result
+            ex_texts, ex_counts = [text for text, _ in ex_results], [count for _, count in ex_results]
+            assert isinstance(result_counts, np.ndarray) and result_counts.dtype == np.int64, "The counts should be an int array."
+            assert result_counts.tolist() == ex_counts, "Expectation mismatch."
+        else:
+            result_series, ex_texts = result, ex_results
+
+        assert isinstance(result_series, pd.Series), "The output should be a pandas Series."
+        assert result_series.index.equals(text_series.index) and result_series.name == text_series.name, "The index was not kept."
+        assert result_series.tolist() == ex_texts, "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "entities",
+        [
+            (("email", "url", "twitter_username", "hashtag", "xml")),
+            (("url",)),
+        ],
+    )
+    def test_remove_entities_batch(self, entities):
+
+        text_series = _text_series(n_samples=200)
+        ex_results = [tp.remove_entities(text, entities) for text in text_series.values]
+
+        result_series, result_counts = bp.remove_entities_batch(text_series, entities)
+
+        assert result_series.tolist() == [text for text, _ in ex_results], "Expectation mismatch."
+        assert list(result_counts) == list(entities), "Expectation mismatch."
+        for entity in entities:
+            assert result_counts[entity].tolist() == [counts[entity] for _, counts in ex_results], "Expectation mismatch."
+
+        with pytest.raises(ValueError):
+            bp.remove_entities_batch(text_series, ("url", "phone"))
+
+    @pytest.mark.parametrize(
+        "text_series, ex_output",
+        [
+            (pd.Series([], dtype=object), []),
+            (pd.Series([None, np.nan]), [None, None]),
+            (pd.Series(["A", pd.NA, "B"], dtype="string"), ["a", None, "b"]),
+        ],
+    )
+    def test_batch_edge_series(self, text_series: pd.Series, ex_output: List[Optional[str]]):
+
+        result_series = bp.to_lower_batch(text_series)
+        result_texts, result_counts = bp.remove_url_batch(text_series)
+
+        assert result_series.tolist() == ex_output, "Expectation mismatch."
+        assert result_counts.tolist() == [0] * len(text_series), "Expectation mismatch."
+
+    def test_spell_correction_v1_batch(self):
+
+        text_series = pd.Series(["i havv a bok", None, "Helo wrld @klm: 123", "a bok", 7, "speling speling"], name="text")
+
+        result_series = bp.spell_correction_v1_batch(text_series)
+
+        assert result_series.tolist() == [tp.spell_correction_v1(text) for text in text_series.values], "Expectation mismatch."
+        assert result_series.tolist()[:3] == ["i have a boy", None, "Helo world @klm: 123"], "Expectation mismatch."
+
+    def test_spell_correction_v2_batch(self):
+
+        text_series = pd.Series(["i havv a bok", None, "Helo wrld @klm: 123", "a bok", 7, "speling speling"], name="text")
+
+        result_series = bp.spell_correction_v2_batch(text_series)
+
+        assert result_series.tolist() == [tp.spell_correction_v2(text) for text in text_series.values], "Expectation mismatch."
+        assert result_series.tolist()[:3] == ["i have a boy", None, "Helo world @klm: 123"], "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "batch_func, kwargs",
+        [
+            (bp.remove_regex_match_batch, {"regex": r"(\d+"}),
+            (bp.remove_regex_match_batch, {"regex": None}),
+            (bp.substitue_regex_match_batch, {"regex": r"[a-", "sub_text": ""}),
+            (bp.substitue_regex_match_batch, {"regex": r"\d+", "sub_text": None}),
+        ],
+    )
+    def test_regex_batch_invalid_pattern(self, batch_func, kwargs):
+
+        with pytest.raises(ValueError):
+            batch_func(_text_series(n_samples=10), **kwargs)
+
+    @pytest.mark.parametrize(
+        "input_value",
+        [
+            (None),
+            ("a text"),
+            (["a", "list"]),
+        ],
+    )
+    def test_batch_invalid_input(self, input_value):
+
+        assert bp.to_lower_batch(input_value) is None, "Expectation mismatch."
+        assert bp.remove_url_batch(input_value) == (None, None), "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "n_samples",
+        [
+            (1000),
+            (2000),
+        ],
+    )
+    def test_perf_batch(self, n_samples: int):
+
+        text_series = pd.Series(dbs.Synthetic_tweet_emotion_en(n_samples=n_samples).get_text_list())
+
+        text_series, _ = bp.remove_url_batch(text_series)
+        text_series, _ = bp.remove_twitter_username_batch(text_series)
+        text_series = bp.to_lower_batch(text_series)
+        text_series = bp.remove_punctuation_batch(text_series)
+        text_series = bp.remove_many_spaces_batch(text_series)
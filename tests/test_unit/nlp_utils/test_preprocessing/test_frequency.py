@@ -0,0 +1,124 @@
+"""Module providing tests for the word frequency table."""
+# ───────────────────────────────── Imports ────────────────────────────────── #
+# Standard library
+from collections import Counter
+import pandas as pd
+
+# 3rd Party
+import pytest
+
+# Private
+import test_unit.nlp_utils.test_preprocessing._synthetic_dbs as dbs
+from nlp_utils.preprocessing.frequency import FrequencyTable
+from nlp_utils.preprocessing.text_preprocessing import remove_common_words
+from nlp_utils.preprocessing.text_preprocessing import remove_rare_words
+
+# ───────────────────────────────── Tests ────────────────────────────────── #
+
+
+def _counter(texts: list) -> Counter:
+    return Counter(word for text in texts if isinstance(text, str) for word in text.split())
+
+
+class TestFrequencyTable:
+    @pytest.mark.parametrize(
+        "k",
+        [0, 1, 3, 10, 50, 100000],
+    )
+    def test_selection_matches_counter(self, k: int):
+
+        # Tweets have many words of the same count, so the ties decide most of the selection
+        texts = dbs.Synthetic_tweet_emotion_en(n_samples=300).get_text_list()
+        counter = _counter(texts)
+        frequencies = FrequencyTable.from_texts(texts)
+
+        assert frequencies.most_common(k) == counter.most_common(k), "Expectation mismatch."
+        assert frequencies.least_common(k) == counter.most_common()[:-k - 1:-1], "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "n_workers, chunk_size",
+        [
+            (1, 7),
+            (2, 50),
+            (3, 1000),
+        ],
+    )
+    def test_from_texts_in_chunks(self, n_workers: int, chunk_size: int):
+
+        texts = dbs.Synthetic_tweet_emotion_en(n_samples=300).get_text_list() + [None, 12, ""]
+
+        frequencies = FrequencyTable.from_texts(texts, chunk_size=chunk_size, n_workers=n_workers)
+
+        # The words keep the order they were first seen, which decides the ties
+        assert list(frequencies.to_dict().items()) == list(_counter(texts).items()), "Expectation mismatch."
+
+    def test_merge(self):
+
+        first = FrequencyTable.from_texts(["a b a", "c"])
+        second = FrequencyTable.from_texts(["b d", None])
+
+        merged = first + second
+
+        assert merged.to_dict() == {"a": 2, "b": 2, "c": 1, "d": 1}, "Expectation mismatch."
+        assert first.to_dict() == {"a": 2, "b": 1, "c": 1}, "The operands should not change."
+        assert first.merge(second) == merged and first.update(["e"])["e"] == 1, "Expectation mismatch."
+        assert len(merged) == 4 and merged.total() == 6 and "d" in merged and merged["z"] == 0, "Expectation mismatch."
+
+    def test_invalid_arguments(self):
+
+        with pytest.raises(ValueError):
+            FrequencyTable.from_texts(["a"], chunk_size=0)
+        with pytest.raises(ValueError):
+            FrequencyTable.from_texts(["a"], n_workers=0)
+
+
+class TestFrequentWords:
+    def test_remove_common_words(self):
+
+        text_series = pd.Series(["the cat and the dog", None, "the end and", "a cat"], index=[3, 2, 1, 0], name="text")
+
+        result_series = remove_common_words(text_series, 2)
+
+        # cat and "and" are both seen twice; cat is seen first, like Counter.most_common
+        assert result_series.tolist() == ["and dog", None, "end and", "a"], "Expectation mismatch."
+        assert result_series.index.tolist() == [3, 2, 1, 0] and result_series.name == "text", "Expectation mismatch."
+
+    def test_remove_rare_words(self):
+
+        text_series = pd.Series(["the cat and the dog", 5, "the end and", "a cat"])
+
+        result_series = remove_rare_words(text_series, 2)
+
+        # dog, end and a are seen once; the last seen ones are the rarest, like Counter.most_common()[::-1]
+        assert result_series.tolist() == ["the cat and the dog", None, "the and", "cat"], "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "text_series, words_num",
+        [
+            ("the cat", 1),
+            (None, 1),
+            (pd.Series(["the cat"]), None),
+            (pd.Series(["the cat"]), "1"),
+        ],
+    )
+    def test_invalid_input(self, text_series, words_num):
+
+        assert remove_common_words(text_series, words_num) is None, "Expectation mismatch."
+        assert remove_rare_words(text_series, words_num) is None, "Expectation mismatch."
+
+    @pytest.mark.benchmark(group="remove_common_words")
+    @pytest.mark.parametrize(
+        "n_samples",
+        [
+            (1000),
+            (2000),
+        ],
+    )
+    def test_perf_remove_common_words(self, benchmark, n_samples: int):
+
+        text_series = pd.Series(dbs.Synthetic_tweet_emotion_en(n_samples=n_samples).get_text_list())
+        common_words = {word for word, _ in _counter(text_series.tolist()).most_common(50)}
+
+        result_series = benchmark.pedantic(remove_common_words, args=(text_series, 50), rounds=1, iterations=1)
+
+        assert not any(set(text.split()) & common_words for text in result_series), "Expectation mismatch."
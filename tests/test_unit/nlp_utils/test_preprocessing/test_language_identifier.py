@@ -0,0 +1,106 @@
+"""Module providing tests for the vectorized n-gram language identifier."""
+# ───────────────────────────────── Imports ────────────────────────────────── #
+# Standard library
+from typing import Optional
+import numpy as np
+import pandas as pd
+
+# 3rd Party
+import pytest
+
+# Private
+import test_unit.nlp_utils.test_preprocessing._synthetic_dbs as dbs
+from nlp_utils.preprocessing import resources
+from nlp_utils.preprocessing import batch_preprocessing as bp
+from nlp_utils.preprocessing import text_preprocessing as tp
+
+# ───────────────────────────────── Tests ────────────────────────────────── #
+
+# The share of the tweets on which the identifier has to agree with the languages langdetect gave them
+# (about 97.5% on Twitter_Detected_Languages.csv)
+MIN_LANGDETECT_AGREEMENT = 0.95
+
+
+class TestNgramLanguageIdentifier:
+    @pytest.mark.parametrize(
+        "input_text, ex_output",
+        [
+            ("Hello, how are you doing today my friend?", "en"),
+            ("Bonjour, comment allez-vous aujourd'hui mon ami ?", "fr"),
+            ("Hola, ¿cómo estás hoy, amigo mío?", "es"),
+            ("Hallo, wie geht es dir heute, mein Freund?", "de"),
+            ("Привет, как у тебя сегодня дела, мой друг?", "ru"),
+            ("こんにちは、今日は元気ですか", "ja"),
+            ("123 456 !!!", None),  # no letter, so no known n-gram
+            ("", None),
+        ],
+    )
+    def test_predict(self, input_text: str, ex_output: Optional[str]):
+
+        identifier = resources.get_ngram_language_identifier()
+
+        assert identifier.predict([input_text]) == [ex_output], "Expectation mismatch."
+
+    def test_predict_proba(self):
+
+        identifier = resources.get_ngram_language_identifier()
+        texts = ["Hello, how are you doing today my friend?", "123", "ok"]
+
+        result = identifier.predict_proba(texts, top_k=2)
+
+        assert result[0][0][0] == "en" and result[1] == [], "Expectation mismatch."
+        assert all(len(languages) <= 2 for languages in result), "Expectation mismatch."
+        assert all(probability > 0.1 for languages in result for _, probability in languages), "Expectation mismatch."
+        assert [languages[0][0] for languages in result if languages] == \
+            [language for language in identifier.predict(texts) if language], "Expectation mismatch."
+        assert identifier.predict_proba([]) == [] and identifier.predict([]) == [], "Expectation mismatch."
+
+        with pytest.raises(ValueError):
+            identifier.predict_proba(texts, top_k=0)
+
+    def test_batch(self):
+
+        text_series = pd.Series(["Hello, how are you doing today my friend?", None, "Bonjour mon ami", np.nan, "123"],
+                                index=[8, 6, 4, 2, 0], name="text")
+
+        result_series = bp.ngram_language_detection_batch(text_series)
+        prob_series = bp.ngram_language_prob_detection_batch(text_series, top_k=1)
+
+        assert result_series.tolist() == ["en", None, "fr", None, None], "Expectation mismatch."
+        assert result_series.index.tolist() == text_series.index.tolist(), "Expectation mismatch."
+        assert [languages if languages is None else [language for language, _ in languages] for languages in prob_series] == \
+            [["en"], None, ["fr"], None, []], "Expectation mismatch."
+        assert bp.ngram_language_detection_batch("a text") is None, "Expectation mismatch."
+
+    def test_agreement_with_langdetect(self):
+
+        data = dbs.Detected_tweet_languages()
+
+        languages = resources.get_ngram_language_identifier().predict(data.get_text_list())
+        agreement = np.mean([language == label for language, label in zip(languages, data.get_label("langdetect"))])
+
+        assert agreement >= MIN_LANGDETECT_AGREEMENT, f"The identifier agrees on {agreement:.1%} of the tweets."
+
+    @pytest.mark.benchmark(group="language_detection")
+    @pytest.mark.parametrize(
+        "implementation",
+        [
+            ("langdetect"),
+            ("ngram"),
+        ],
+    )
+    def test_perf_language_detection(self, benchmark, implementation: str):
+
+        text_series = pd.Series(dbs.Detected_tweet_languages(n_samples=1000).get_text_list())
+        resources.get_ngram_language_identifier()
+
+        def detect():
+            # The cache of language_detection would make every round after the first one free
+            tp.clear_language_detection_cache()
+            if implementation == "langdetect":
+                return bp.language_detection_batch(text_series)
+            return bp.ngram_language_detection_batch(text_series)
+
+        result_series = benchmark.pedantic(detect, rounds=1, iterations=1)
+
+        assert len(result_series) == len(text_series), "Expectation mismatch."
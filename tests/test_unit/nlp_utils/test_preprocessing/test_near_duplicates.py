@@ -0,0 +1,150 @@
+"""Module providing tests for the MinHash near-duplicate detector."""
+# ───────────────────────────────── Imports ────────────────────────────────── #
+# Standard library
+import numpy as np
+import pandas as pd
+
+# 3rd Party
+import pytest
+
+# Private
+import test_unit.nlp_utils.test_preprocessing._synthetic_dbs as dbs
+from nlp_utils.preprocessing.batch_preprocessing import near_duplicate_clusters_batch
+from nlp_utils.preprocessing.batch_preprocessing import remove_url_batch
+from nlp_utils.preprocessing.batch_preprocessing import representative_apply_batch
+from nlp_utils.preprocessing.batch_preprocessing import to_lower_batch
+from nlp_utils.preprocessing.near_duplicates import lsh_clusters
+from nlp_utils.preprocessing.near_duplicates import minhash_signatures
+from nlp_utils.preprocessing.near_duplicates import near_duplicate_clusters
+
+# ───────────────────────────────── Tests ────────────────────────────────── #
+
+
+def _shingles(text: str, size: int = 5) -> set:
+    text = " ".join(text.lower().split())
+    return {text[start:start + size] for start in range(len(text) - size + 1)}
+
+
+class TestMinHash:
+    def test_signature_agreement_estimates_jaccard(self):
+
+        texts = dbs.Synthetic_tweet_emotion_en(n_samples=200).get_text_list()
+        pairs = [(texts[position], texts[position] + " " + texts[position + 1][:20]) for position in range(0, 100, 2)]
+
+        signatures = minhash_signatures([text for pair in pairs for text in pair], num_perm=256)
+
+        for position, (first, second) in enumerate(pairs):
+            jaccard = len(_shingles(first) & _shingles(second)) / len(_shingles(first) | _shingles(second))
+            agreement = (signatures[2 * position] == signatures[2 * position + 1]).mean()
+            assert abs(agreement - jaccard) < 0.2, f"Signature agreement {agreement} for a Jaccard similarity of {jaccard}."
+
+    def test_same_seed_same_signatures(self):
+
+        texts = ["the same text", "another one"]
+
+        assert (minhash_signatures(texts, seed=3) == minhash_signatures(texts[::-1], seed=3)[::-1]).all(), "Expectation mismatch."
+        assert minhash_signatures([]).shape == (0, 128), "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "num_perm, shingle_size, bands, threshold",
+        [
+            (0, 5, 16, 0.7),
+            (128, 0, 16, 0.7),
+            (128, 5, 15, 0.7),
+            (128, 5, 16, 1.5),
+        ],
+    )
+    def test_invalid_arguments(self, num_perm, shingle_size, bands, threshold):
+
+        with pytest.raises(ValueError):
+            near_duplicate_clusters(["a text"], num_perm=num_perm, shingle_size=shingle_size, bands=bands, threshold=threshold)
+
+
+class TestNearDuplicateClusters:
+    def test_retweets(self):
+
+        texts = [
+            "I can't believe how good this new album is, listening on repeat all day",
+            "The weather in the city is absolutely terrible today",
+            "RT @music_fan: I can't believe how good this new album is, listening on repeat all day",
+            "i can't believe how good this new album is!! listening on repeat all day",
+            "Completely unrelated text about cooking pasta at home",
+        ]
+
+        clusters = near_duplicate_clusters(texts)
+
+        assert clusters.tolist() == [0, 1, 0, 0, 4], "Expectation mismatch."
+
+    def test_short_texts(self):
+
+        clusters = near_duplicate_clusters(["ok", "ok", "", "  ", "no", "yes"])
+
+        assert clusters.tolist() == [0, 0, 2, 2, 4, 5], "Expectation mismatch."
+        assert lsh_clusters(minhash_signatures([])).tolist() == [], "Expectation mismatch."
+
+    def test_batch(self):
+
+        text_series = pd.Series(["hello world, how are you", None, "RT @a: hello world, how are you", 3, "bye"], index=[9, 8, 7, 6, 5])
+
+        clusters = near_duplicate_clusters_batch(text_series)
+
+        assert clusters.tolist() == [0, None, 0, None, 4] and clusters.index.tolist() == [9, 8, 7, 6, 5], "Expectation mismatch."
+        assert near_duplicate_clusters_batch("hello") is None, "Expectation mismatch."
+
+    def test_representative_apply(self):
+
+        text_series = pd.Series(["Hello World, How Are You http://a.co", None, "RT @a: Hello World, How Are You http://a.co", "Bye",
+                                 "Hello World, How Are You http://a.co"])
+        calls = []
+
+        def lower_batch(series):
+            calls.append(len(series))
+            return to_lower_batch(series)
+
+        lowered = representative_apply_batch(text_series, lower_batch)
+        texts, counts = representative_apply_batch(text_series, remove_url_batch)
+
+        assert calls == [3], "The batch function should only see the distinct texts."
+        assert lowered.tolist() == to_lower_batch(text_series).tolist(), "A near duplicate should keep its own text."
+        assert texts.tolist() == remove_url_batch(text_series)[0].tolist(), "Expectation mismatch."
+        assert counts.tolist() == [1, 0, 1, 0, 1], "Expectation mismatch."
+        with pytest.raises(ValueError):
+            representative_apply_batch(text_series, to_lower_batch, clusters=pd.Series([0, None, 0, 3, 0]))
+
+    def test_representative_apply_near_duplicates(self):
+
+        text_series = pd.Series(["Hello World, How Are You http://a.co", None, "RT @a: Hello World, How Are You http://a.co", "Bye"])
+        calls = []
+
+        def length_batch(series):
+            calls.append(len(series))
+            return series.str.len()
+
+        lengths = representative_apply_batch(text_series, length_batch, near_duplicates=True)
+        _, counts = representative_apply_batch(text_series, remove_url_batch, near_duplicates=True)
+
+        assert calls == [2], "The batch function should only see the representatives."
+        assert lengths.tolist() == [36, None, 36, 3], "A near duplicate should get the label of its representative."
+        assert counts.tolist() == [1, 0, 1, 0], "Expectation mismatch."
+        with pytest.raises(ValueError):
+            representative_apply_batch(text_series, length_batch, clusters=pd.Series([0]), near_duplicates=True)
+
+    @pytest.mark.benchmark(group="near_duplicate_clusters")
+    @pytest.mark.parametrize(
+        "n_samples",
+        [
+            (1000),
+            (2000),
+        ],
+    )
+    def test_perf_near_duplicate_clusters(self, benchmark, n_samples: int):
+
+        texts = dbs.Synthetic_tweet_emotion_en(n_samples=n_samples).get_text_list()
+        # Every text is followed by its retweet
+        texts = [text for original in texts for text in (original, "RT @user: " + original)]
+
+        clusters = benchmark.pedantic(near_duplicate_clusters, args=(texts,), rounds=1, iterations=1)
+
+        # The prefix weighs too much in the shortest tweets
+        joined = clusters[1::2] <= np.arange(0, len(texts), 2)
+        assert joined.mean() > 0.9, f"Only {joined.mean():.0%} of the retweets joined their original."
@@ -0,0 +1,127 @@
+"""Module providing tests for the parallel preprocessing executor."""
+# ───────────────────────────────── Imports ────────────────────────────────── #
+# Standard library
+import os
+import pandas as pd
+
+# 3rd Party
+import pytest
+
+# Private
+import test_unit.nlp_utils.test_preprocessing._synthetic_dbs as dbs
+from nlp_utils.preprocessing import resources
+from nlp_utils.preprocessing import text_preprocessing as tp
+from nlp_utils.preprocessing.parallel import parallel_apply
+from nlp_utils.preprocessing.parallel import _pipeline_resources
+from nlp_utils.preprocessing.pipeline import Pipeline
+from nlp_utils.preprocessing.text_preprocessing import to_lower
+from nlp_utils.preprocessing.text_preprocessing import to_strip
+from nlp_utils.preprocessing.text_preprocessing import remove_url
+from nlp_utils.preprocessing.text_preprocessing import remove_twitter_username
+from nlp_utils.preprocessing.text_preprocessing import remove_hashtag
+from nlp_utils.preprocessing.text_preprocessing import remove_punctuation
+from nlp_utils.preprocessing.text_preprocessing import abbreviation_converter
+from nlp_utils.preprocessing.text_preprocessing import convert_emoticon_to_words
+from nlp_utils.preprocessing.text_preprocessing import spell_correction_v1
+from nlp_utils.preprocessing.text_preprocessing import spell_correction_v2
+
+# ───────────────────────────────── Tests ────────────────────────────────── #
+
+PARALLEL_STEPS = [remove_url, remove_twitter_username, remove_hashtag, convert_emoticon_to_words, to_lower,
+                  abbreviation_converter, remove_punctuation, to_strip]
+
+
+def _loaded_spell_checkers(text: str) -> str:
+    # Which spell checkers the worker has loaded when it runs the step
+    return f"{resources.get_spell_checker.cache_info().currsize},{resources.get_symspell.cache_info().currsize}"
+
+
+class TestParallel:
+    @pytest.mark.parametrize(
+        "n_workers, chunk_size",
+        [
+            (1, None),
+            (2, None),
+            (3, 7),
+            (2, 5000),
+        ],
+    )
+    def test_parallel_apply_keeps_order(self, n_workers: int, chunk_size: int):
+
+        texts = dbs.Synthetic_tweet_emotion_en(n_samples=500).get_text_list() + [None, 123, ""]
+        pipeline = Pipeline(PARALLEL_STEPS)
+
+        result = parallel_apply(pipeline, texts, n_workers=n_workers, chunk_size=chunk_size)
+
+        assert result == [pipeline(text) for text in texts], "Expectation mismatch."
+
+    def test_parallel_apply_series_and_callables(self):
+
+        text_series = pd.Series(["Hello WORLD", None, "Bye"], index=[10, 5, 7], name="text")
+
+        result_series = parallel_apply(to_lower, text_series, n_workers=2, chunk_size=1)
+
+        assert isinstance(result_series, pd.Series), "The output should be a pandas Series."
+        assert result_series.index.equals(text_series.index) and result_series.name == "text", "The index was not kept."
+        assert result_series.tolist() == ["hello world", None, "bye"], "Expectation mismatch."
+        assert parallel_apply(to_lower, [], n_workers=2) == [], "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "pipeline, ex_resources",
+        [
+            (Pipeline([to_lower, to_strip]), ()),
+            (Pipeline(PARALLEL_STEPS), (tp._emoticon_words_pattern, tp._abbreviation_pattern)),
+            (Pipeline([spell_correction_v2, to_lower, spell_correction_v2]), (resources.get_symspell,)),
+            (spell_correction_v1, (resources.get_spell_checker,)),
+            (_loaded_spell_checkers, ()),
+        ],
+    )
+    def test_pipeline_resources(self, pipeline, ex_resources: tuple):
+
+        assert _pipeline_resources(pipeline) == ex_resources, "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "steps, ex_output",
+        [
+            ([_loaded_spell_checkers, to_lower], "0,0"),
+            ([_loaded_spell_checkers, spell_correction_v2], "0,1"),
+        ],
+    )
+    def test_workers_load_only_the_resources_of_the_steps(self, steps: list, ex_output: str):
+
+        # Forked workers start with the caches of this process
+        resources.get_spell_checker.cache_clear()
+        resources.get_symspell.cache_clear()
+
+        result = parallel_apply(Pipeline(steps), ["a text"] * 4, n_workers=2, chunk_size=1)
+
+        assert result == [ex_output] * 4, "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "pipeline, n_workers, chunk_size, ex_error",
+        [
+            ("to_lower", 2, None, TypeError),
+            (to_lower, 0, None, ValueError),
+            (to_lower, 2.0, None, ValueError),
+            (to_lower, 2, 0, ValueError),
+        ],
+    )
+    def test_parallel_apply_invalid_arguments(self, pipeline, n_workers, chunk_size, ex_error):
+
+        with pytest.raises(ex_error):
+            parallel_apply(pipeline, ["a text"], n_workers=n_workers, chunk_size=chunk_size)
+
+    @pytest.mark.benchmark(group="parallel_apply")
+    @pytest.mark.parametrize(
+        "n_workers",
+        list(range(1, min(os.cpu_count() or 1, 8) + 1)),
+    )
+    def test_perf_parallel_apply_scaling(self, benchmark, n_workers: int):
+
+        texts = dbs.Synthetic_tweet_emotion_en(n_samples=2000).get_text_list() * 10
+        pipeline = Pipeline(PARALLEL_STEPS)
+
+        # One round per worker count: a round starts and stops a whole pool
+        result = benchmark.pedantic(parallel_apply, args=(pipeline, texts), kwargs={"n_workers": n_workers}, rounds=1, iterations=1)
+
+        assert result == [pipeline(text) for text in texts], "Expectation mismatch."
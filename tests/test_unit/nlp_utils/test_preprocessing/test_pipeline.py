@@ -0,0 +1,171 @@
+"""Module providing tests for the preprocessing pipeline."""
+# ───────────────────────────────── Imports ────────────────────────────────── #
+# Standard library
+from typing import List, Optional
+import numpy as np
+
+# 3rd Party
+import pytest
+
+# Private
+import test_unit.nlp_utils.test_preprocessing._synthetic_dbs as dbs
+from nlp_utils.preprocessing.pipeline import Pipeline
+from nlp_utils.preprocessing.pipeline import _fuse_token_steps
+from nlp_utils.preprocessing.text_preprocessing import to_lower
+from nlp_utils.preprocessing.text_preprocessing import to_strip
+from nlp_utils.preprocessing.text_preprocessing import remove_url
+from nlp_utils.preprocessing.text_preprocessing import remove_emoji
+from nlp_utils.preprocessing.text_preprocessing import remove_twitter_username
+from nlp_utils.preprocessing.text_preprocessing import remove_hashtag
+from nlp_utils.preprocessing.text_preprocessing import remove_email_address
+from nlp_utils.preprocessing.text_preprocessing import remove_emoticon
+from nlp_utils.preprocessing.text_preprocessing import remove_punctuation
+from nlp_utils.preprocessing.text_preprocessing import remove_number
+from nlp_utils.preprocessing.text_preprocessing import remove_many_spaces
+from nlp_utils.preprocessing.text_preprocessing import remove_special_char
+from nlp_utils.preprocessing.text_preprocessing import remove_stopwords
+from nlp_utils.preprocessing.text_preprocessing import remove_regex_match
+from nlp_utils.preprocessing.text_preprocessing import substitue_regex_match
+from nlp_utils.preprocessing.text_preprocessing import remove_all_duplication
+from nlp_utils.preprocessing.text_preprocessing import remove_consecutive_duplication
+
+# ───────────────────────────────── Tests ────────────────────────────────── #
+
+TWEET_STEPS = [remove_url, remove_email_address, remove_twitter_username, remove_hashtag, remove_emoji, remove_emoticon,
+               to_lower, remove_number, (remove_special_char, {"special_char": ["&amp;"]}), remove_punctuation,
+               remove_many_spaces, to_strip]
+
+WORD_STEPS = [to_lower, remove_many_spaces, remove_consecutive_duplication, (remove_stopwords, {"stopwords": {"a", "the", "i"}}),
+              remove_all_duplication, to_strip]
+
+
+def _chain_by_hand(text: Optional[str], steps: list = TWEET_STEPS):
+    """Applies the steps one by one through the public functions, as the callers did before the Pipeline."""
+    counts = []
+    for step in steps:
+        func, kwargs = step if isinstance(step, tuple) else (step, {})
+        result = func(text, **kwargs)
+        if isinstance(result, tuple):
+            text, count = result
+        else:
+            text, count = result, 0
+        counts.append(count)
+    return text, counts
+
+
+class TestPipeline:
+    @pytest.mark.parametrize(
+        "input_text, ex_output_text, ex_counts",
+        [
+            ("Visit https://www.google.com #NOW @Stephan007 :)", "visit", [1, 0, 1, 1, 0, 1, 0, 0, 0, 0, 0, 0]),
+            ("Hello   WORLD 123 &amp; you!!", "hello world you", [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0]),
+            ("", "", [0] * 12),
+            (None, None, [0] * 12),
+        ],
+    )
+    def test_run(self, input_text: Optional[str], ex_output_text: Optional[str], ex_counts: List[int]):
+
+        pipeline = Pipeline(TWEET_STEPS)
+        result_text, result_counts = pipeline.run(input_text, return_counts=True)
+
+        assert isinstance(result_text, (str, type(None))), "The output text is not string."
+        assert isinstance(result_counts, np.ndarray), "The counts should be a numpy array."
+        assert result_text == ex_output_text and result_counts.tolist() == ex_counts, "Expectation mismatch."
+        assert pipeline(input_text) == ex_output_text, "Expectation mismatch."
+
+    def test_run_matches_chained_functions(self):
+
+        data = dbs.Synthetic_tweet_emotion_en(n_samples=1000)
+        pipeline = Pipeline(TWEET_STEPS)
+
+        for text in data.get_text_list():
+            ex_text, ex_counts = _chain_by_hand(text)
+            result_text, result_counts = pipeline.run(text, return_counts=True)
+
+            assert result_text == ex_text and result_counts.tolist() == ex_counts, "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "input_text",
+        [
+            "  Hello hello,   HELLO world  the the cat",
+            "the cat\tcat   sat sat! sat a cat",
+            "ab ab-ab ab  Straße STRASSE",
+            "",
+            "   ",
+        ],
+    )
+    def test_token_steps_match_chained_functions(self, input_text: str):
+
+        pipeline = Pipeline(WORD_STEPS)
+
+        # to_lower runs on the string, the word-level steps after it on the tokens of the text
+        assert len(pipeline._stages) == 2, "The word-level steps should share one tokenization."
+        assert pipeline(input_text) == _chain_by_hand(input_text, WORD_STEPS)[0], "Expectation mismatch."
+
+    def test_token_steps_match_chained_functions_on_tweets(self):
+
+        pipeline = Pipeline(WORD_STEPS)
+
+        for text in dbs.Synthetic_tweet_emotion_en(n_samples=1000).get_text_list():
+            assert pipeline(text) == _chain_by_hand(text, WORD_STEPS)[0], "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "kinds, ex_runs",
+        [
+            (["split", "split", None, "split"], [(0, 2)]),
+            (["spaced", "split", "spaced"], [(1, 3)]),  # the first spaced step may see several spaces
+            (["whitespace", "spaced", None, "whitespace", "split"], [(3, 5)]),  # no step splits the first run
+            (["split"], []),
+            ([None, "whitespace", "spaced", "split", "spaced"], [(1, 5)]),
+        ],
+    )
+    def test_fuse_token_steps(self, kinds: List[Optional[str]], ex_runs: List[tuple]):
+
+        assert _fuse_token_steps(kinds) == ex_runs, "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "step, input_text, ex_output_text",
+        [
+            ((remove_stopwords, {"stopwords": {"a", "the"}}), "the cat and a dog", "cat and dog"),
+            ((remove_regex_match, {"regex": r"\d+"}), "id 123 and 000", "id  and "),
+            ((substitue_regex_match, {"regex": r"\d+", "sub_text": "[NUM]"}), "id 123", "id [NUM]"),
+            ((lambda text: text[::-1]), "abc", "cba"),
+            ((lambda text: (text.upper(), 3)), "abc", "ABC"),
+        ],
+    )
+    def test_step_arguments(self, step, input_text: str, ex_output_text: str):
+
+        result_text = Pipeline([step])(input_text)
+
+        assert result_text == ex_output_text, "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "steps, ex_error",
+        [
+            ("to_lower", TypeError),
+            ([to_lower, "to_strip"], TypeError),
+            ([(remove_stopwords, {"stopwords": ["a", "the"]})], ValueError),
+            ([(remove_special_char, {"special_char": "#"})], ValueError),
+            ([(remove_regex_match, {"regex": r"(\d+"})], ValueError),
+            ([(substitue_regex_match, {"regex": r"\d+", "sub_text": None})], ValueError),
+        ],
+    )
+    def test_invalid_steps(self, steps, ex_error):
+
+        with pytest.raises(ex_error):
+            Pipeline(steps)
+
+    @pytest.mark.parametrize(
+        "n_samples",
+        [
+            (1000),
+            (2000),
+        ],
+    )
+    def test_perf_pipeline(self, n_samples: int):
+
+        data = dbs.Synthetic_tweet_emotion_en(n_samples=n_samples)
+        pipeline = Pipeline(TWEET_STEPS)
+
+        for text in data.get_text_list():
+            result_text, _ = pipeline.run(text, return_counts=True)
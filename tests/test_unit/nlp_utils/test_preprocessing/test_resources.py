@@ -0,0 +1,95 @@
+"""Module providing tests for the lazy resources and the import time of the preprocessing package."""
+# ───────────────────────────────── Imports ────────────────────────────────── #
+# Standard library
+from pathlib import Path
+import os
+import subprocess
+import sys
+
+# 3rd Party
+import pytest
+
+# Private
+import nlp_utils
+from nlp_utils.preprocessing import resources
+from nlp_utils.preprocessing import text_preprocessing as tp
+
+# ───────────────────────────────── Tests ────────────────────────────────── #
+
+# CPU seconds that `import nlp_utils.preprocessing` may take in a fresh interpreter, most of which is pandas.
+# CPU time rather than wall time, so other processes running on the machine do not count.
+IMPORT_TIME_BUDGET = 1.5
+
+# Modules that take seconds to import and must only be imported by the functions that use them
+HEAVY_MODULES = ["nltk", "spacy", "gensim", "langdetect", "emot", "spellchecker", "sklearn", "scipy"]
+
+
+def _run_python(code: str, cwd: Path) -> str:
+    """Runs the given code in a fresh interpreter that only knows the package location, and returns its output."""
+    env = dict(os.environ, PYTHONPATH=str(Path(nlp_utils.__file__).resolve().parents[1]))
+    completed = subprocess.run([sys.executable, "-c", code], cwd=cwd, env=env, capture_output=True, text=True, check=True)
+    return completed.stdout.strip()
+
+
+class TestResources:
+    def test_import_time_budget(self, tmp_path: Path):
+
+        code = ("import time\n"
+                "start = time.process_time()\n"
+                "import nlp_utils.preprocessing\n"
+                "print(time.process_time() - start)")
+
+        # The best of a few runs, so a busy machine does not fail the budget
+        import_time = min(float(_run_python(code, tmp_path)) for _ in range(3))
+
+        assert import_time < IMPORT_TIME_BUDGET, f"The import took {import_time:.3f}s, the budget is {IMPORT_TIME_BUDGET}s."
+
+    def test_heavy_modules_are_not_imported(self, tmp_path: Path):
+
+        code = ("import sys\n"
+                "import nlp_utils.preprocessing\n"
+                f"print(','.join(module for module in {HEAVY_MODULES!r} if module in sys.modules))")
+
+        assert _run_python(code, tmp_path) == "", "A heavy module is imported with the package."
+
+    def test_assets_from_any_directory(self, tmp_path: Path):
+
+        code = ("from nlp_utils.preprocessing import convert_emoticon_to_words, abbreviation_converter\n"
+                "print(convert_emoticon_to_words('hi :)') + '|' + abbreviation_converter('brb asap'))")
+
+        assert _run_python(code, tmp_path) == "hi Happy_face_or_smiley |be right back as soon as possible", "Expectation mismatch."
+
+    def test_assets_are_package_data(self):
+
+        assert resources.asset_path("slang_words.txt").is_file(), "The assets should be in the package."
+        assert resources.asset_path("Emoticon_Dict.p").is_file(), "The assets should be in the package."
+
+    def test_assets_without_importlib_files(self, monkeypatch):
+
+        # Python 3.8 has no importlib.resources.files
+        monkeypatch.setattr(resources.sys, "version_info", (3, 8, 18))
+
+        with resources.asset_path("slang_words.txt").open("r", encoding="utf-8") as slang_file:
+            assert "2nite\ttonight" in slang_file.read(), "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "attribute_name, loader",
+        [
+            ("Emoticon_Dict", resources.load_emoticon_dict),
+            ("SAMPLE_TYPOS_SLANG", resources.load_slang_words),
+            ("UNICODE_EMOJI", resources.load_unicode_emoji),
+            ("spell", resources.get_spell_checker),
+            ("lemmatizer", resources.get_lemmatizer),
+            ("ABBREVIATION_PATTERN", tp._abbreviation_pattern),
+            ("EMOJI_WORDS_PATTERN", tp._emoji_words_pattern),
+        ],
+    )
+    def test_lazy_attributes(self, attribute_name: str, loader):
+
+        assert getattr(tp, attribute_name) is loader(), "The module attribute should be the cached resource."
+        assert getattr(tp, attribute_name) is getattr(tp, attribute_name), "The resource should be loaded once."
+
+    def test_unknown_attribute(self):
+
+        with pytest.raises(AttributeError):
+            tp.NOT_A_RESOURCE
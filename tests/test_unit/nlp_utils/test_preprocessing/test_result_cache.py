@@ -0,0 +1,193 @@
+"""Module providing tests for the content-addressed pipeline result cache."""
+# ───────────────────────────────── Imports ────────────────────────────────── #
+# Standard library
+from concurrent.futures import ThreadPoolExecutor
+import pickle
+import numpy as np
+
+# 3rd Party
+import pytest
+
+# Private
+import test_unit.nlp_utils.test_preprocessing._synthetic_dbs as dbs
+from nlp_utils.preprocessing.parallel import parallel_apply
+from nlp_utils.preprocessing.pipeline import Pipeline
+from nlp_utils.preprocessing.result_cache import ResultCache
+from nlp_utils.preprocessing.text_preprocessing import to_lower
+from nlp_utils.preprocessing.text_preprocessing import to_strip
+from nlp_utils.preprocessing.text_preprocessing import remove_url
+from nlp_utils.preprocessing.text_preprocessing import remove_hashtag
+from nlp_utils.preprocessing.text_preprocessing import remove_punctuation
+from nlp_utils.preprocessing.text_preprocessing import remove_stopwords
+from nlp_utils.preprocessing.text_preprocessing import remove_twitter_username
+
+# ───────────────────────────────── Tests ────────────────────────────────── #
+
+CACHED_STEPS = [remove_url, remove_twitter_username, remove_hashtag, to_lower, remove_punctuation, to_strip]
+
+
+def _retweeted_texts(n_samples: int) -> list:
+    # Every text comes back three times, like the retweets of a feed
+    texts = dbs.Synthetic_tweet_emotion_en(n_samples=n_samples).get_text_list()
+    return [texts[position % len(texts)] for position in np.random.RandomState(0).permutation(3 * len(texts))]
+
+
+class TestResultCache:
+    def test_lru_eviction(self):
+
+        cache = ResultCache(max_size=2, policy="lru")
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert "a" in cache and "b" not in cache and "c" in cache, "The least recently used entry should be evicted."
+        assert cache.get("b") is None and cache.get("c") == 3, "Expectation mismatch."
+        assert cache.info() == (2, 1, 1, 2, 2), "Expectation mismatch."
+
+    def test_lfu_eviction(self):
+
+        cache = ResultCache(max_size=2, policy="lfu")
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+        cache.put("c", 3)
+        cache.put("d", 4)
+
+        # b (used twice) makes room for c, then c (used once) for d; a was used first but most often, so it stays
+        assert "a" in cache and "b" not in cache and "c" not in cache and "d" in cache, "The least frequently used entry should be evicted."
+        assert len(cache) == 2 and cache.info().evictions == 2, "Expectation mismatch."
+
+    def test_info_and_clear(self):
+
+        cache = ResultCache(max_size=10)
+        cache.put("a", 1)
+        for key in ["a", "a", "a", "b"]:
+            cache.get(key)
+
+        assert cache.info().hit_rate == 0.75, "Expectation mismatch."
+
+        cache.clear()
+
+        assert len(cache) == 0 and cache.info() == (0, 0, 0, 10, 0) and cache.info().hit_rate == 0.0, "Expectation mismatch."
+
+    def test_pickle_is_empty(self):
+
+        cache = ResultCache(max_size=5, policy="lfu")
+        cache.put("a", 1)
+
+        copy = pickle.loads(pickle.dumps(cache))
+
+        assert len(copy) == 0 and copy.max_size == 5 and copy.policy == "lfu", "Expectation mismatch."
+
+    @pytest.mark.parametrize("policy", ["lru", "lfu"])
+    def test_threads(self, policy: str):
+
+        cache = ResultCache(max_size=50, policy=policy)
+
+        def worker(seed: int) -> None:
+            for key in np.random.RandomState(seed).randint(0, 100, size=2000).tolist():
+                if cache.get(key) is None:
+                    cache.put(key, -key)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(worker, range(8)))
+
+        info = cache.info()
+        assert info.hits + info.misses == 8 * 2000 and info.size == len(cache) <= 50, "Expectation mismatch."
+        assert all(cache.get(key) in (None, -key) for key in range(100)), "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "max_size, policy",
+        [
+            (0, "lru"),
+            ("10", "lru"),
+            (10, "fifo"),
+        ],
+    )
+    def test_invalid_arguments(self, max_size, policy):
+
+        with pytest.raises(ValueError):
+            ResultCache(max_size=max_size, policy=policy)
+
+
+class TestCachedPipeline:
+    def test_same_results(self):
+
+        texts = _retweeted_texts(300) + [None, 5, ""]
+        cache = ResultCache()
+        pipeline = Pipeline(CACHED_STEPS, cache=cache)
+        uncached_pipeline = Pipeline(CACHED_STEPS)
+
+        for text in texts:
+            result_text, counts = pipeline.run(text, return_counts=True)
+            ex_text, ex_counts = uncached_pipeline.run(text, return_counts=True)
+            assert result_text == ex_text and counts.tolist() == ex_counts.tolist(), "Expectation mismatch."
+            assert pipeline(text) == ex_text, "Expectation mismatch."
+
+        counts[:] = 7
+        assert pipeline.run(texts[-4], return_counts=True)[1].tolist() != [7] * len(CACHED_STEPS), "The cached counts should not change."
+        assert len(cache) == len(set(text for text in texts if isinstance(text, str))), "Expectation mismatch."
+
+    def test_fingerprint(self):
+
+        first = Pipeline([(remove_stopwords, {"stopwords": {"a", "the", "i", "to"}}), to_strip])
+        same = Pipeline([(remove_stopwords, {"stopwords": frozenset(["to", "i", "the", "a"])}), to_strip])
+        other = Pipeline([(remove_stopwords, {"stopwords": {"a", "the"}}), to_strip])
+
+        assert first.fingerprint == same.fingerprint != other.fingerprint, "Expectation mismatch."
+        assert Pipeline([lambda text: text]).fingerprint != Pipeline([lambda text: text.lower()]).fingerprint, "Expectation mismatch."
+
+    def test_shared_cache(self):
+
+        cache = ResultCache()
+        lower_pipeline = Pipeline([to_lower], cache=cache)
+        strip_pipeline = Pipeline([to_strip], cache=cache)
+
+        assert lower_pipeline(" A ") == " a " and strip_pipeline(" A ") == "A", "Pipelines should not share results."
+        assert cache.info().misses == 2, "Expectation mismatch."
+
+    def test_invalid_cache(self):
+
+        with pytest.raises(TypeError):
+            Pipeline([to_lower], cache={})
+
+    @pytest.mark.parametrize(
+        "n_workers, chunk_size",
+        [
+            (1, None),
+            (2, None),
+            (3, 7),
+        ],
+    )
+    def test_parallel_apply(self, n_workers: int, chunk_size: int):
+
+        texts = _retweeted_texts(200) + [None, 123, ""]
+        cache = ResultCache(max_size=1000)
+        pipeline = Pipeline(CACHED_STEPS, cache=cache)
+
+        result = parallel_apply(pipeline, texts, n_workers=n_workers, chunk_size=chunk_size)
+
+        valid_texts = [text for text in texts if isinstance(text, str)]
+        assert result == [Pipeline(CACHED_STEPS)(text) for text in texts], "Expectation mismatch."
+        assert cache.info() == (len(valid_texts) - len(set(valid_texts)), len(set(valid_texts)), 0, 1000, len(set(valid_texts))), "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "n_samples",
+        [
+            (1000),
+            (2000),
+        ],
+    )
+    def test_perf_cached_pipeline(self, n_samples: int):
+
+        texts = _retweeted_texts(n_samples)
+        cache = ResultCache(max_size=n_samples, policy="lfu")
+        pipeline = Pipeline(CACHED_STEPS, cache=cache)
+
+        for text in texts:
+            pipeline(text)
+
+        assert cache.info().hit_rate >= 0.6, f"Hit rate {cache.info().hit_rate}."
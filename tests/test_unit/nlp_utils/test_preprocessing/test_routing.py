@@ -0,0 +1,99 @@
+"""Module providing tests for the language router."""
+# ───────────────────────────────── Imports ────────────────────────────────── #
+# Standard library
+from collections import Counter
+from typing import FrozenSet, Optional
+import numpy as np
+import pandas as pd
+
+# 3rd Party
+import pytest
+
+# Private
+from nlp_utils.preprocessing import text_preprocessing as tp
+from nlp_utils.preprocessing.routing import LanguageRouter
+
+# ───────────────────────────────── Tests ────────────────────────────────── #
+
+# Per-language stopwords that do not need the NLTK corpus
+STOPWORDS = {"en": frozenset({"is", "a", "the"}), "fr": frozenset({"mon", "le"})}
+
+
+class CountingRouter(LanguageRouter):
+    """A router with fixed stopwords that counts how often it asks for the resources of every language."""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.calls = Counter()
+
+    def stopwords(self, language: str) -> Optional[FrozenSet[str]]:
+        self.calls["stopwords", language] += 1
+        return STOPWORDS.get(language)
+
+    def spell_checker(self, language: str) -> Optional[tp.Spell_checker_v1]:
+        self.calls["spell_checker", language] += 1
+        return super().spell_checker(language)
+
+
+def _text_series() -> pd.Series:
+    texts = ["the weather is a bit cold today so i stay home", None, "Bonjour mon ami, comment allez-vous aujourd'hui ?", "Καλημέρα, τι κάνεις σήμερα φίλε μου;",
+             7, "the weather is a bit cold today", np.nan, "le chat de mon voisin dort sur le canapé"]
+    return pd.Series(texts, index=np.arange(len(texts))[::-1] * 3, name="text")
+
+
+class TestLanguageRouter:
+    def test_run(self):
+
+        router = CountingRouter(spell_correction=False, lemmatize=False)
+
+        result_series, languages = router(_text_series())
+
+        assert languages.tolist() == ["en", None, "fr", "el", None, "en", None, "fr"], "Expectation mismatch."
+        assert result_series.tolist() == ["weather bit cold today so i stay home", None, "Bonjour ami, comment allez-vous aujourd'hui ?",
+                                          "Καλημέρα, τι κάνεις σήμερα φίλε μου;", None, "weather bit cold today", None,
+                                          "chat de voisin dort sur canapé"], "Expectation mismatch."
+        assert result_series.index.tolist() == _text_series().index.tolist(), "Expectation mismatch."
+
+    def test_resources_are_asked_once_per_language(self):
+
+        # Only the English data of autocorrect ships with it, so the other languages are not spell-corrected here
+        router = CountingRouter(lemmatize=False)
+        text_series = pd.concat([_text_series()] * 3, ignore_index=True)
+
+        router(text_series, languages=["en", None, "xx", "zz", None, "en", None, "xx"] * 3)
+
+        assert router.calls == Counter({("stopwords", "en"): 1, ("stopwords", "xx"): 1, ("stopwords", "zz"): 1,
+                                        ("spell_checker", "en"): 1, ("spell_checker", "xx"): 1,
+                                        ("spell_checker", "zz"): 1}), "Expectation mismatch."
+
+    def test_run_with_languages(self):
+
+        # The languages are given, so nothing is detected; an unknown language keeps its texts as they are
+        router = CountingRouter(lemmatize=False, remove_stopwords=False)
+        text_series = pd.Series(["i havv a dreem", "speling is hard", "i havv a dreem", None])
+
+        result_series, languages = router(text_series, languages=["xx", "en", "en", "en"])
+
+        assert result_series.tolist() == ["i havv a dreem", "spelling is hard", "i have a dream", None], "Expectation mismatch."
+        assert languages.tolist() == ["xx", "en", "en", None], "Expectation mismatch."
+
+    def test_steps_can_be_disabled(self):
+
+        router = LanguageRouter(spell_correction=False, lemmatize=False, remove_stopwords=False, detector="ngram")
+
+        result_series, languages = router(_text_series())
+
+        assert result_series.tolist() == [text if isinstance(text, str) else None for text in _text_series()], "Expectation mismatch."
+        assert languages.tolist() == ["en", None, "fr", "el", None, "en", None, "fr"], "Expectation mismatch."
+
+    def test_invalid_input(self):
+
+        router = LanguageRouter()
+
+        assert router("a text") == (None, None), "Expectation mismatch."
+        with pytest.raises(ValueError):
+            router(pd.Series(["a text", "another text"]), languages=["en"])
+        with pytest.raises(ValueError):
+            LanguageRouter(detector="spacy")
+        with pytest.raises(ValueError):
+            LanguageRouter(pipeline_size="tiny")
@@ -0,0 +1,137 @@
+"""Module providing tests for the streaming file-to-file preprocessing."""
+# ───────────────────────────────── Imports ────────────────────────────────── #
+# Standard library
+from pathlib import Path
+import tracemalloc
+import pandas as pd
+
+# 3rd Party
+import pytest
+
+# Private
+from nlp_utils.preprocessing.pipeline import Pipeline
+from nlp_utils.preprocessing.streaming import read_text_chunks
+from nlp_utils.preprocessing.streaming import iter_preprocessed_chunks
+from nlp_utils.preprocessing.streaming import stream_preprocess
+from nlp_utils.preprocessing.text_preprocessing import to_lower
+from nlp_utils.preprocessing.text_preprocessing import to_strip
+from nlp_utils.preprocessing.text_preprocessing import remove_url
+from nlp_utils.preprocessing.text_preprocessing import remove_twitter_username
+from nlp_utils.preprocessing.text_preprocessing import remove_punctuation
+
+# ───────────────────────────────── Tests ────────────────────────────────── #
+
+EMOTION_PATH = "./Datasets/Twitter_DS_emotion.txt"
+EMOTION_KWARGS = {"sep": "\t", "header": None, "names": ["Index", "Text", "Feeling"], "index_col": None}
+LANGUAGES_PATH = "./Datasets/Twitter_Detected_Languages.csv"
+
+STREAM_STEPS = [remove_url, remove_twitter_username, to_lower, remove_punctuation, to_strip]
+
+
+def _repeat_file(input_path: str, output_path: Path, n_times: int) -> Path:
+    """Writes the lines of the input file n_times into the output file, to build a larger input."""
+    lines = Path(input_path).read_text(encoding="utf-8").rstrip("\n") + "\n"
+    with open(output_path, "w", encoding="utf-8") as output_file:
+        for _ in range(n_times):
+            output_file.write(lines)
+    return output_path
+
+
+class TestStreaming:
+    @pytest.mark.parametrize(
+        "chunk_size",
+        [
+            (1),
+            (300),
+            (100_000),
+        ],
+    )
+    def test_read_text_chunks(self, chunk_size: int):
+
+        full_df = pd.read_csv(LANGUAGES_PATH)
+        chunks = list(read_text_chunks(LANGUAGES_PATH, chunk_size=chunk_size))
+
+        assert all(len(chunk) <= chunk_size for chunk in chunks), "A chunk is larger than chunk_size."
+        assert pd.concat(chunks).equals(full_df), "The chunks should be the file in order."
+
+    def test_stream_preprocess_tsv(self, tmp_path: Path):
+
+        pipeline = Pipeline(STREAM_STEPS)
+        output_path = tmp_path / "emotion_clean.tsv"
+
+        n_records = stream_preprocess(pipeline, EMOTION_PATH, output_path, text_column="Text", output_column="Clean",
+                                      chunk_size=128, **EMOTION_KWARGS)
+
+        ex_df = pd.read_csv(EMOTION_PATH, **EMOTION_KWARGS)
+        result_df = pd.read_csv(output_path, sep="\t", keep_default_na=False)
+
+        assert n_records == len(ex_df) == len(result_df), "Expectation mismatch."
+        assert result_df.columns.tolist() == ["Index", "Text", "Feeling", "Clean"], "Expectation mismatch."
+        assert result_df.Clean.tolist() == [pipeline(text) for text in ex_df.Text], "Expectation mismatch."
+        assert result_df.Feeling.tolist() == ex_df.Feeling.tolist(), "Expectation mismatch."
+
+    def test_stream_preprocess_multi_line_csv(self, tmp_path: Path):
+
+        output_path = tmp_path / "languages_clean.csv"
+
+        n_records = stream_preprocess(to_lower, LANGUAGES_PATH, output_path, text_column="tweets", chunk_size=500)
+
+        ex_df = pd.read_csv(LANGUAGES_PATH)
+        result_df = pd.read_csv(output_path)
+
+        assert n_records == len(ex_df) == len(result_df), "Expectation mismatch."
+        assert result_df.tweets.tolist() == [to_lower(text) for text in ex_df.tweets], "Expectation mismatch."
+
+    def test_iter_preprocessed_chunks(self):
+
+        chunks = iter_preprocessed_chunks(to_lower, LANGUAGES_PATH, text_column="tweets", output_column="lower", chunk_size=1000)
+        first_chunk = next(chunks)
+
+        assert len(first_chunk) == 1000, "Expectation mismatch."
+        assert first_chunk.lower.tolist() == first_chunk.tweets.str.lower().tolist(), "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "pipeline, text_column, chunk_size, ex_error",
+        [
+            ("to_lower", "tweets", 10, TypeError),
+            (to_lower, "text", 10, ValueError),
+            (to_lower, "tweets", 0, ValueError),
+        ],
+    )
+    def test_stream_preprocess_invalid_arguments(self, tmp_path: Path, pipeline, text_column: str, chunk_size: int, ex_error):
+
+        with pytest.raises(ex_error):
+            stream_preprocess(pipeline, LANGUAGES_PATH, tmp_path / "out.csv", text_column=text_column, chunk_size=chunk_size)
+
+    def test_stream_preprocess_flat_memory(self, tmp_path: Path):
+
+        pipeline = Pipeline(STREAM_STEPS)
+        peak_memory = []
+
+        for n_times in (2, 20):
+            input_path = _repeat_file(EMOTION_PATH, tmp_path / f"emotion_{n_times}.tsv", n_times)
+
+            tracemalloc.start()
+            stream_preprocess(pipeline, input_path, tmp_path / "out.tsv", text_column="Text", chunk_size=500, **EMOTION_KWARGS)
+            peak_memory.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+        assert peak_memory[1] < 2 * peak_memory[0], "The memory should not grow with the size of the file."
+
+    @pytest.mark.benchmark(group="stream_preprocess")
+    @pytest.mark.parametrize(
+        "n_times",
+        [
+            (1),
+            (5),
+        ],
+    )
+    def test_perf_stream_preprocess(self, benchmark, tmp_path: Path, n_times: int):
+
+        input_path = _repeat_file(EMOTION_PATH, tmp_path / "emotion.tsv", n_times)
+        n_records = len(pd.read_csv(input_path, **EMOTION_KWARGS))
+
+        result = benchmark.pedantic(stream_preprocess, args=(Pipeline(STREAM_STEPS), input_path, tmp_path / "out.tsv"),
+                                    kwargs=dict(text_column="Text", **EMOTION_KWARGS), rounds=1, iterations=1)
+
+        assert result == n_records, "Expectation mismatch."
@@ -0,0 +1,147 @@
+"""Module providing tests for the SymSpell spell checker."""
+# ───────────────────────────────── Imports ────────────────────────────────── #
+# Standard library
+from pathlib import Path
+from typing import Optional
+import time
+
+# 3rd Party
+import pytest
+
+# Private
+import test_unit.nlp_utils.test_preprocessing._synthetic_dbs as dbs
+from nlp_utils.preprocessing import resources
+from nlp_utils.preprocessing.symspell import SymSpell
+from nlp_utils.preprocessing.symspell import _deletes
+from nlp_utils.preprocessing.symspell import _osa_distance
+
+# ───────────────────────────────── Tests ────────────────────────────────── #
+
+# The mean CPU time of the lookup of an unknown word, in seconds (about 0.4ms on the synthetic tweets)
+LOOKUP_TIME_BUDGET = 0.002
+
+WORD_COUNTS = {"hello": 50, "help": 80, "world": 40, "word": 60, "spelling": 10, "the": 1000, "café": 5}
+
+
+@pytest.fixture(scope="module")
+def index_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("symspell") / "index.bin"
+    SymSpell.build(WORD_COUNTS).save(path)
+    return path
+
+
+class TestSymSpell:
+    @pytest.mark.parametrize(
+        "source, target, max_distance, ex_distance",
+        [
+            ("word", "word", 2, 0),
+            ("wrd", "word", 2, 1),
+            ("teh", "the", 2, 1),  # a transposition is a single edit
+            ("speling", "spelling", 2, 1),
+            ("wrold", "world", 1, 1),
+            ("helo", "world", 2, 3),  # farther than max_distance
+            ("", "abc", 2, 3),
+        ],
+    )
+    def test_osa_distance(self, source: str, target: str, max_distance: int, ex_distance: int):
+
+        assert _osa_distance(source, target, max_distance) == ex_distance, "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "word, max_distance, ex_deletes",
+        [
+            ("abc", 0, {"abc": 0}),
+            ("abc", 1, {"abc": 0, "bc": 1, "ac": 1, "ab": 1}),
+            ("aab", 2, {"aab": 0, "ab": 1, "aa": 1, "a": 2, "b": 2}),
+        ],
+    )
+    def test_deletes(self, word: str, max_distance: int, ex_deletes: dict):
+
+        assert _deletes(word, max_distance) == ex_deletes, "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "word, max_distance, ex_correction",
+        [
+            ("hello", None, "hello"),
+            ("helo", None, "help"),  # "hello" and "help" are both one edit away, "help" is more frequent
+            ("wrld", None, "world"),
+            ("wrd", None, "word"),
+            ("speeling", None, "spelling"),
+            ("spellllng", None, "spelling"),
+            ("spellllng", 1, None),
+            ("teh", None, "the"),
+            ("cafe", None, "café"),
+            ("xyzxyz", None, None),
+        ],
+    )
+    def test_lookup(self, index_path: Path, word: str, max_distance: Optional[int], ex_correction: Optional[str]):
+
+        built = SymSpell.build(WORD_COUNTS)
+        loaded = SymSpell.load(index_path)
+
+        assert built.lookup(word, max_distance) == ex_correction, "Expectation mismatch."
+        assert loaded.lookup(word, max_distance) == ex_correction, "Expectation mismatch."
+
+    def test_load(self, index_path: Path):
+
+        symspell = SymSpell.load(index_path)
+
+        assert len(symspell) == len(WORD_COUNTS), "Expectation mismatch."
+        assert "café" in symspell and "cafe" not in symspell, "Expectation mismatch."
+        assert symspell.word_count("help") == 80 and symspell.word_count("cafe") == 0, "Expectation mismatch."
+        assert symspell.candidates("helo")[:2] == [("help", 1, 80), ("hello", 1, 50)], "Expectation mismatch."
+        assert not symspell._postings.flags.writeable, "The index should be mapped read-only."
+
+    def test_load_invalid_file(self, tmp_path: Path):
+
+        path = tmp_path / "not_an_index.bin"
+        path.write_bytes(b"word\t1\n" * 20)
+
+        with pytest.raises(ValueError):
+            SymSpell.load(path)
+
+    def test_build_invalid_arguments(self):
+
+        with pytest.raises(ValueError):
+            SymSpell.build(WORD_COUNTS, max_distance=-1)
+        with pytest.raises(ValueError):
+            SymSpell.build(WORD_COUNTS, max_distance=2, prefix_length=2)
+
+    def test_index_path(self, cache_dir: Path):
+
+        import spellchecker
+
+        index_path = resources.build_symspell_index()
+
+        # The suite builds the index in a temporary directory, under a name that changes with pyspellchecker
+        assert index_path.parent == cache_dir and index_path.is_file(), "Expectation mismatch."
+        assert f"pyspellchecker{spellchecker.__version__}" in index_path.name, "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "word",
+        ["havv", "bok", "speling", "pleeease", "wrld", "teh", "recieve", "definately"],
+    )
+    def test_lookup_matches_pyspellchecker(self, word: str):
+
+        assert resources.get_symspell().lookup(word) == resources.get_spell_checker().correction(word), "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "n_samples",
+        [
+            (1000),
+            (2000),
+        ],
+    )
+    def test_perf_lookup(self, n_samples: int):
+
+        symspell = resources.get_symspell()
+        data = dbs.Synthetic_tweet_emotion_en(n_samples=n_samples)
+        unknown_words = sorted({word for text in data.get_text_list() for word in text.lower().split()} - {""})
+        unknown_words = [word for word in unknown_words if word not in symspell]
+
+        # CPU time, so a busy machine does not fail the budget
+        start = time.process_time()
+        result_words = [symspell.lookup(word) for word in unknown_words]
+        lookup_time = (time.process_time() - start) / len(unknown_words)
+
+        assert lookup_time < LOOKUP_TIME_BUDGET, f"A lookup took {lookup_time * 1e3:.3f}ms, the budget is {LOOKUP_TIME_BUDGET * 1e3}ms."
@@ -26,6 +26,7 @@ from nlp_utils.preprocessing.text_preprocessing import remove_twitter_username
 from nlp_utils.preprocessing.text_preprocessing import remove_username
 from nlp_utils.preprocessing.text_preprocessing import remove_hashtag
 from nlp_utils.preprocessing.text_preprocessing import remove_email_address
+from nlp_utils.preprocessing.text_preprocessing import remove_entities
 from nlp_utils.preprocessing.text_preprocessing import remove_special_char
 from nlp_utils.preprocessing.text_preprocessing import blank_checker
 from nlp_utils.preprocessing.text_preprocessing import remove_punctuation
@@ -34,15 +35,40 @@ from nlp_utils.preprocessing.text_preprocessing import abbreviation_converter
 from nlp_utils.preprocessing.text_preprocessing import convert_to_unicode
 from nlp_utils.preprocessing.text_preprocessing import expand_contractions
 from nlp_utils.preprocessing.text_preprocessing import spell_correction_v1
+from nlp_utils.preprocessing.text_preprocessing import spell_correction_v2
+from nlp_utils.preprocessing.text_preprocessing import spell_correction_cache_info
+from nlp_utils.preprocessing.text_preprocessing import clear_spell_correction_cache
 from nlp_utils.preprocessing.text_preprocessing import add_word_to_stopwords_set
 from nlp_utils.preprocessing.text_preprocessing import stopwords_nltk
+from nlp_utils.preprocessing.text_preprocessing import stopwords_cache_info
+from nlp_utils.preprocessing.text_preprocessing import remove_stopwords
 from nlp_utils.preprocessing.text_preprocessing import convert_emoji_to_words
 from nlp_utils.preprocessing.text_preprocessing import convert_emoticon_to_words
+from nlp_utils.preprocessing.text_preprocessing import Emoticon_Dict
+from nlp_utils.preprocessing.text_preprocessing import UNICODE_EMOJI
 from nlp_utils.preprocessing.text_preprocessing import remove_regex_match
 from nlp_utils.preprocessing.text_preprocessing import substitue_regex_match
+from nlp_utils.preprocessing.text_preprocessing import user_regex_cache_info
+from nlp_utils.preprocessing.text_preprocessing import clear_user_regex_cache
 from nlp_utils.preprocessing.text_preprocessing import to_lemmatize
+from nlp_utils.preprocessing.text_preprocessing import lemma_cache_info
+from nlp_utils.preprocessing.text_preprocessing import clear_lemma_cache
 from nlp_utils.preprocessing.text_preprocessing import to_tokenize
-from nlp_utils.preprocessing.cleaner_helper import custom_extended_stopwords, custom_shortforms, custom_direct_replacement_dict
+from nlp_utils.preprocessing.text_preprocessing import language_detection
+from nlp_utils.preprocessing.text_preprocessing import language_prob_detection
+from nlp_utils.preprocessing.text_preprocessing import script_language_detection
+from nlp_utils.preprocessing.text_preprocessing import pipeline_selector_spacy
+from nlp_utils.preprocessing.text_preprocessing import pipe_spacy
+from nlp_utils.preprocessing.text_preprocessing import language_detection_cache_info
+from nlp_utils.preprocessing.parallel import parallel_apply
+from nlp_utils.preprocessing.text_preprocessing import clear_language_detection_cache
+from nlp_utils.preprocessing.text_preprocessing import Spell_checker_v1
+from nlp_utils.preprocessing.batch_preprocessing import to_lemmatize_batch
+from nlp_utils.preprocessing.batch_preprocessing import language_detection_batch
+from nlp_utils.preprocessing.batch_preprocessing import language_prob_detection_batch
+from nlp_utils.preprocessing.batch_preprocessing import script_routed_language_detection_batch
+from nlp_utils.preprocessing import resources
+from nlp_utils.preprocessing.cleaner_helper import custom_extended_stopwords, custom_shortforms, custom_direct_replacement_dict, rainbow_stopwords
 
 # ───────────────────────────────── Tests ────────────────────────────────── #
 
@@ -290,6 +316,7 @@ class TestCharacter:
         assert isinstance(result_text, (str, type(None))), "The output text is not string."
         assert result_text == ex_output_text, "Expectation mismatch."
 
+    @pytest.mark.slow
     @pytest.mark.parametrize(
         "n_samples",
         [
@@ -299,11 +326,85 @@ class TestCharacter:
     )
     def test_perf_spell_correction_v1(self, n_samples: int):
 
+        # A correction is an edit distance search of up to seconds for a long unknown word (about 1.3s per unique
+        # tweet), so this throughput test is slow
+        clear_spell_correction_cache()
         data = dbs.Synthetic_tweet_emotion_en(n_samples=n_samples)
 
         for text in data.get_text_list():
-            # result_text = spell_correction_v1(text)
-            ...
+            result_text = spell_correction_v1(text)
+
+    @pytest.mark.benchmark(group="spell_correction_v1_repeated_texts")
+    @pytest.mark.parametrize(
+        "n_samples",
+        [
+            (1000),
+            (2000),
+        ],
+    )
+    def test_perf_spell_correction_v1_repeated_texts(self, benchmark, n_samples: int):
+
+        # A few tweets seen many times, as a misspelling is in a real corpus: only the first sight of a word pays
+        # for its correction, the others are hits of the cache
+        clear_spell_correction_cache()
+        texts = dbs.Synthetic_tweet_emotion_en(n_samples=n_samples // 200).get_text_list() * 200
+
+        result_texts = benchmark.pedantic(lambda: [spell_correction_v1(text) for text in texts], rounds=1, iterations=1)
+
+        assert result_texts[:len(texts) // 200] * 200 == result_texts, "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "input_text, ex_output_text",
+        [
+            ("i havv a bok", "i have a boy"),
+            ("speling speling speling", "spelling spelling spelling"),
+            ("pleeease", "please"),
+            ("Helo wrld @klm: 123", "Helo world @klm: 123"),  # only lowercase words are checked, "@klm:" has no candidate
+        ],
+    )
+    def test_spell_correction_v1_cache(self, input_text: str, ex_output_text: str):
+
+        clear_spell_correction_cache()
+
+        assert spell_correction_v1(input_text) == ex_output_text, "Expectation mismatch."
+        assert spell_correction_v1(input_text) == ex_output_text, "Expectation mismatch."
+
+        cache_info = spell_correction_cache_info()
+        assert cache_info.misses == len(set(input_text.split())), "Every word should be corrected once."
+        assert cache_info.hits == 2 * len(input_text.split()) - cache_info.misses, "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "input_text, ex_output_text",
+        [
+            (None, None),
+            ("", ""),
+            ("i havv a bok", "i have a boy"),
+            ("speling speling speling", "spelling spelling spelling"),
+            ("pleeease", "please"),
+            ("Helo wrld @klm: 123", "Helo world @klm: 123"),
+        ],
+    )
+    def test_spell_correction_v2(self, input_text: Optional[str], ex_output_text: Optional[str]):
+
+        result_text = spell_correction_v2(input_text)
+
+        assert isinstance(result_text, (str, type(None))), "The output text is not string."
+        assert result_text == ex_output_text, "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "n_samples",
+        [
+            (1000),
+            (2000),
+        ],
+    )
+    def test_perf_spell_correction_v2(self, n_samples: int):
+
+        clear_spell_correction_cache()
+        data = dbs.Synthetic_tweet_emotion_en(n_samples=n_samples)
+
+        for text in data.get_text_list():
+            result_text = spell_correction_v2(text)
 
 
 class TestDuplication:
@@ -342,6 +443,15 @@ class TestDuplication:
         for text in data.get_text_list():
             result_text = remove_all_duplication(text)
 
+    def test_remove_all_duplication_long_text(self):
+
+        # A forum post of 100k words, with every word seen many times
+        words = [f"word{index % 5000}" for index in range(100000)]
+
+        result_text = remove_all_duplication(" ".join(words))
+
+        assert result_text == " ".join(words[:5000]), "Expectation mismatch."
+
     @pytest.mark.skip
     @pytest.mark.parametrize(
         "input_text, ex_output",
@@ -505,6 +615,47 @@ class TestEmojiEmoticons:
         for text in data.get_text_list():
             result_text = convert_emoji_to_words(text)
 
+    # @pytest.mark.skip
+    @pytest.mark.parametrize(
+        "input_text, ex_output",
+        [
+            ("Hello 👩‍💻", "Hello woman_technologist "),  # a ZWJ sequence is a single emoji
+            ("🕵️‍♀️ spy", "woman_detective  spy"),
+            ("Vive la 🇫🇷!", "Vive la France !"),
+            ("✍🏻 ok", "writing_hand_light_skin_tone  ok"),
+            ("naïve café", "naïve café"),
+        ],
+    )
+    def test_convert_emoji_to_words_sequences(self, input_text: Optional[str], ex_output: Optional[str]):
+
+        result_text = convert_emoji_to_words(input_text)
+
+        assert isinstance(result_text, (str, type(None))), "The output text is not string."
+        assert result_text == ex_output, "Expectation mismatch."
+
+    @pytest.mark.benchmark(group="convert_emoji_to_words")
+    @pytest.mark.parametrize(
+        "implementation",
+        [
+            ("per_emoji"),
+            ("single_scan"),
+        ],
+    )
+    def test_perf_convert_emoji_to_words_speedup(self, benchmark, implementation: str):
+
+        def convert_emoji_to_words_per_emoji(text):
+            # The previous implementation: one str.replace per key of UNICODE_EMOJI
+            for emot in UNICODE_EMOJI:
+                text = text.replace(emot, "_".join(UNICODE_EMOJI[emot].replace(",", "").replace(":", "").split()) + " ")
+            return text
+
+        convert = {"per_emoji": convert_emoji_to_words_per_emoji, "single_scan": convert_emoji_to_words}[implementation]
+        texts = dbs.Synthetic_tweet_emotion_en(n_samples=1000).get_text_list()
+
+        result_texts = benchmark(lambda: [convert(text) for text in texts])
+
+        assert len(result_texts) == len(texts), "Expectation mismatch."
+
     # @pytest.mark.skip
     @pytest.mark.parametrize(
         "input_text, ex_output",
@@ -539,6 +690,47 @@ class TestEmojiEmoticons:
         for text in data.get_text_list():
             result_text = convert_emoticon_to_words(text)
 
+    # @pytest.mark.skip
+    @pytest.mark.parametrize(
+        "input_text, ex_output",
+        [
+            ("Hello :-))", "Hello Very_happy "),  # the longest emoticon wins
+            ("Hello D:<", "Hello Disgust "),
+            ("Hello >:(", "Hello Frown_sad_andry_or_pouting "),
+            ("Hello :\\", "Hello Skeptical_annoyed_undecided_uneasy_or_hesitant "),  # a regex key of Emoticon_Dict
+            ("Hello :D and :P", "Hello Laughing_big_grin_or_laugh_with_glasses  and Tongue_sticking_out_cheeky_playful_or_blowing_a_raspberry "),
+        ],
+    )
+    def test_convert_emoticon_to_words_single_scan(self, input_text: Optional[str], ex_output: Optional[str]):
+
+        result_text = convert_emoticon_to_words(input_text)
+
+        assert isinstance(result_text, (str, type(None))), "The output text is not string."
+        assert result_text == ex_output, "Expectation mismatch."
+
+    @pytest.mark.benchmark(group="convert_emoticon_to_words")
+    @pytest.mark.parametrize(
+        "implementation",
+        [
+            ("per_emoticon"),
+            ("single_scan"),
+        ],
+    )
+    def test_perf_convert_emoticon_to_words_speedup(self, benchmark, implementation: str):
+
+        def convert_emoticon_to_words_per_emoticon(text):
+            # The previous implementation: one re.sub per key of Emoticon_Dict
+            for emot in Emoticon_Dict:
+                text = re.sub(u'('+emot+')', "_".join(Emoticon_Dict[emot].replace(",", "").split()) + " ", text)
+            return text
+
+        convert = {"per_emoticon": convert_emoticon_to_words_per_emoticon, "single_scan": convert_emoticon_to_words}[implementation]
+        texts = dbs.Synthetic_tweet_emotion_en(n_samples=1000).get_text_list()
+
+        result_texts = benchmark(lambda: [convert(text) for text in texts])
+
+        assert len(result_texts) == len(texts), "Expectation mismatch."
+
 
 class TestURL:
     # @pytest.mark.skip
@@ -721,6 +913,67 @@ class TestEmailAddress:
             result_text, _ = remove_email_address(text)
 
 
+class TestEntities:
+    # @pytest.mark.skip
+    @pytest.mark.parametrize(
+        "input_text, input_entities, ex_output_text, ex_counts",
+        [
+            ("RT @Stephan007: see https://t.co/MlJb2gPDaq #stockmarket <b>now</b> or mail am_ghad@gmail.com", ("email", "url", "twitter_username", "hashtag", "xml"),
+             "RT  : see    now or mail ", {"email": 1, "url": 1, "twitter_username": 1, "hashtag": 1, "xml": 2}),
+            ("#lahore #LahoreBlasts : #punjabgovt", ("hashtag",), "  : ", {"hashtag": 3}),
+            ("@probablyfaketwitterusername @RayFranco", ("twitter_username", "username"), "  ", {"twitter_username": 1, "username": 1}),
+            ("Hello world!", ("url", "email"), "Hello world!", {"url": 0, "email": 0}),
+            (None, ("url", "email"), None, {"url": 0, "email": 0}),
+            # Overlapping entities are removed in the order of the entities, like chaining the single functions
+            ("hi @john.doe ok", ("url", "twitter_username"), "hi @  ok", {"url": 1, "twitter_username": 0}),
+            ("hi @john.doe ok", ("twitter_username", "url"), "hi  .doe ok", {"twitter_username": 1, "url": 0}),
+            ("#covid.org now", ("url", "hashtag"), "#  now", {"url": 1, "hashtag": 0}),
+            ("<a href='x.com'>hi</a>", ("url", "xml"), "hi", {"url": 1, "xml": 2}),
+        ],
+    )
+    def test_remove_entities(self, input_text: Optional[str], input_entities: tuple, ex_output_text: Optional[str], ex_counts: dict):
+
+        result_text, result_counts = remove_entities(input_text, input_entities)
+
+        assert isinstance(result_text, (str, type(None))), "The output text is not string."
+        assert result_text == ex_output_text and result_counts == ex_counts, "Expectation mismatch."
+
+    def test_remove_entities_matches_single_functions(self):
+
+        data = dbs.Synthetic_tweet_emotion_en(n_samples=2000)
+        overlapping_texts = ["hi @john.doe ok", "#covid.org now", "<a href='x.com'>hi</a>", "mail @me@x.org #tag<b>"]
+        single_functions = {"url": remove_url, "email": remove_email_address, "twitter_username": remove_twitter_username,
+                            "username": remove_username, "hashtag": remove_hashtag, "xml": remove_xml}
+
+        for text in data.get_text_list() + overlapping_texts:
+            ex_text, ex_counts = text, {}
+            for entity, function in single_functions.items():
+                ex_text, ex_counts[entity] = function(ex_text)
+
+            result_text, result_counts = remove_entities(text, tuple(single_functions))
+
+            assert result_text == ex_text and result_counts == ex_counts, "Expectation mismatch."
+
+    def test_remove_entities_unknown_entity(self):
+
+        with pytest.raises(ValueError):
+            remove_entities("Hello world!", ("url", "phone"))
+
+    @pytest.mark.parametrize(
+        "n_samples",
+        [
+            (1000),
+            (2000),
+        ],
+    )
+    def test_perf_remove_entities(self, n_samples: int):
+
+        data = dbs.Synthetic_tweet_emotion_en(n_samples=n_samples)
+
+        for text in data.get_text_list():
+            result_text, _ = remove_entities(text)
+
+
 class TestChecker:
     @pytest.mark.skip
     @pytest.mark.parametrize(
@@ -835,6 +1088,20 @@ class TestChecker:
         for text in data.get_text_list():
             result_text = substitue_regex_match(text, r"\d+", "hello")
 
+    def test_user_regex_cache(self):
+
+        texts = dbs.Synthetic_tweet_emotion_en(n_samples=100).get_text_list()
+        clear_user_regex_cache()
+
+        for text in texts:
+            remove_regex_match(text, r"\d+")
+            substitue_regex_match(text, r"[aeiou]", "_")
+        cache_info = user_regex_cache_info()
+
+        assert cache_info.misses == 2 and cache_info.hits == 2 * len(texts) - 2, "Every pattern should be compiled once."
+        assert remove_regex_match("abc", r"(b") is None and remove_regex_match("abc", r"(b") is None, "Expectation mismatch."
+        assert user_regex_cache_info().misses == 3, "An invalid pattern should be checked once."
+
 
 class TestConversion:
     @pytest.mark.skip
@@ -868,6 +1135,26 @@ class TestConversion:
         for text in data.get_text_list():
             result_text = abbreviation_converter(text)
 
+    # @pytest.mark.skip
+    @pytest.mark.parametrize(
+        "input_text, ex_output",
+        [
+            ("c u 2day, b4n!", "c you today, bye for now!"),  # typos/slang and abbreviations in one pass
+            ("lol", "laugh out loud"),  # the typos/slang dictionary wins over the abbreviations
+            ("mh370 news", "malaysia airlines flight 370 news"),
+            ("b4nx ft. ft", "b4nx feet featuring"),  # whole words only and the longest abbreviation wins
+            ("w/o sugar w/ milk", "without sugar with milk"),
+            ("price $5 or $ 5", "price $5 or  dollar  5"),
+            ("", ""),
+        ],
+    )
+    def test_abbreviation_converter_dictionaries(self, input_text: Optional[str], ex_output: Optional[str]):
+
+        result_text = abbreviation_converter(input_text)
+
+        assert isinstance(result_text, (str, type(None))), "The output text is not string."
+        assert result_text == ex_output, "Expectation mismatch."
+
 
 class TestAdder:
     @pytest.mark.skip
@@ -920,6 +1207,37 @@ class TestAdder:
             assert added_flag == ex_output_bool, "Expectation mismatch."
 
 
+    def test_add_word_to_frozen_stopwords_set(self):
+
+        stop_words = frozenset({"a", "the"})
+
+        result_stop_words = add_word_to_stopwords_set(stop_words, ["book", "star"])
+
+        assert result_stop_words == {"a", "the", "book", "star"} and stop_words == {"a", "the"}, "Expectation mismatch."
+        assert isinstance(result_stop_words, frozenset), "A frozenset should give a frozenset."
+        assert add_word_to_stopwords_set(stop_words, {"star", "book"}) is result_stop_words, "The derived set should be shared."
+        assert remove_stopwords("the book is a star", result_stop_words) == "is", "Expectation mismatch."
+
+        # A set may be changed by its owner, so it gives a new set
+        mutable_stop_words = {"a", "the"}
+        result_stop_words = add_word_to_stopwords_set(mutable_stop_words, "book")
+
+        assert result_stop_words == {"a", "the", "book"} and mutable_stop_words == {"a", "the"}, "Expectation mismatch."
+        assert isinstance(result_stop_words, set), "A set should give a set."
+
+    def test_stopwords_registry(self):
+
+        english_stop_words = stopwords_nltk(["English"])
+        misses = stopwords_cache_info().misses
+
+        assert isinstance(english_stop_words, frozenset), "The stopwords should be a frozenset."
+        assert stopwords_nltk("english ") is english_stop_words, "The stopwords should be built once per language."
+        assert stopwords_nltk(["english", "klingon"]) is english_stop_words, "The unknown languages should be ignored."
+        assert stopwords_cache_info().misses == misses, "Expectation mismatch."
+        assert set(custom_extended_stopwords) <= english_stop_words, "Expectation mismatch."
+        assert stopwords_nltk(["english"], rainbow=True) >= english_stop_words | set(rainbow_stopwords), "Expectation mismatch."
+        assert stopwords_nltk(["klingon"]) is None, "Expectation mismatch."
+
 class TestExpantion:
     @pytest.mark.skip
     @pytest.mark.parametrize(
@@ -983,6 +1301,34 @@ class TestLemmatization:
         for text in data.get_text_list():
             result_text = to_lemmatize(text)
 
+    def test_lemma_cache(self):
+
+        input_text = "The striped bats are hanging on their feet for best"
+
+        clear_lemma_cache()
+        first_text = to_lemmatize(input_text)
+        misses = lemma_cache_info().misses
+        second_text = to_lemmatize(input_text)
+
+        assert first_text == second_text, "Expectation mismatch."
+        assert lemma_cache_info().misses == misses, "The lemmas of a repeated text should come from the cache."
+        assert lemma_cache_info().hits >= len(input_text.split()), "The lemmas of a repeated text should come from the cache."
+
+    @pytest.mark.parametrize(
+        "n_samples",
+        [
+            (1000),
+            (2000),
+        ],
+    )
+    def test_perf_to_lemmatize_batch(self, n_samples: int):
+
+        text_series = pd.Series(dbs.Synthetic_tweet_emotion_en(n_samples=n_samples).get_text_list())
+
+        result_series = to_lemmatize_batch(text_series)
+
+        assert result_series.tolist() == [to_lemmatize(text) for text in text_series.values], "Expectation mismatch."
+
 
 class TestTokenization:
     @pytest.mark.skip
@@ -1014,3 +1360,335 @@ class TestTokenization:
 
         for text in data.get_text_list():
             result_text = to_tokenize(text)
+
+
+class TestLanguageDetection:
+    @pytest.mark.parametrize(
+        "input_text, ex_output",
+        [
+            (None, None),
+            (123, None),
+            ("Hello, how are you doing today my friend?", "en"),
+            ("Bonjour, comment allez-vous aujourd'hui mon ami ?", "fr"),
+            ("Hola, ¿cómo estás hoy, amigo mío?", "es"),
+        ],
+    )
+    def test_language_detection(self, input_text: Optional[str], ex_output: Optional[str]):
+
+        assert language_detection(input_text) == ex_output, "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "input_text",
+        [
+            ("ok"),
+            ("lol"),
+            ("ciao bella"),
+        ],
+    )
+    def test_language_detection_is_deterministic(self, input_text: str):
+
+        # A short text is ambiguous, so it is only stable because of the fixed seed
+        clear_language_detection_cache()
+        first_probabilities = [(language.lang, language.prob) for language in language_prob_detection(input_text)]
+        clear_language_detection_cache()
+        second_probabilities = [(language.lang, language.prob) for language in language_prob_detection(input_text)]
+
+        assert first_probabilities == second_probabilities, "Expectation mismatch."
+
+    def test_language_detection_cache(self):
+
+        clear_language_detection_cache()
+        language_detection("Hello, how are you doing today my friend?")
+        language_prob_detection("Hello, how are you doing today my friend?")
+
+        assert language_detection_cache_info().misses == 1, "A text should be detected once."
+        assert language_detection_cache_info().hits == 1, "A repeated text should come from the cache."
+
+    @pytest.mark.parametrize(
+        "n_workers",
+        [
+            (1),
+            (2),
+        ],
+    )
+    def test_language_detection_batch(self, n_workers: int):
+
+        texts = ["Hello, how are you doing today my friend?", None, "Bonjour, comment allez-vous aujourd'hui mon ami ?",
+                 "123", "Hello, how are you doing today my friend?", "ok"]
+        text_series = pd.Series(texts, index=[5, 4, 3, 2, 1, 0], name="text")
+
+        result_series = language_detection_batch(text_series, n_workers=n_workers)
+        prob_series = language_prob_detection_batch(text_series, n_workers=n_workers)
+
+        assert result_series.index.tolist() == text_series.index.tolist(), "Expectation mismatch."
+        assert result_series.tolist() == ["en", None, "fr", None, "en", language_detection("ok")], "Expectation mismatch."
+        assert prob_series.iloc[1] is None and prob_series.iloc[3] is None, "Expectation mismatch."
+        assert [(language.lang, language.prob) for language in prob_series.iloc[5]] == \
+            [(language.lang, language.prob) for language in language_prob_detection("ok")], "Expectation mismatch."
+
+    def test_language_detection_batch_cache(self, monkeypatch):
+
+        from langdetect.lang_detect_exception import LangDetectException
+        from nlp_utils.preprocessing import batch_preprocessing
+
+        sent_texts = []
+
+        def recording_parallel_apply(kernel, texts, n_workers=None):
+            sent_texts.append(list(texts))
+            return parallel_apply(kernel, texts, n_workers=n_workers)
+
+        monkeypatch.setattr(batch_preprocessing, "parallel_apply", recording_parallel_apply)
+        text_series = pd.Series(["Hello, how are you doing today my friend?", "Bonjour, comment allez-vous aujourd'hui mon ami ?",
+                                 "Hello, how are you doing today my friend?", "123"])
+
+        clear_language_detection_cache()
+        language_detection("Hello, how are you doing today my friend?")
+        first_series = language_detection_batch(text_series, n_workers=2)
+        second_series = language_detection_batch(text_series, n_workers=2)
+
+        # The first batch only detects the texts the cache does not have, and the second one detects nothing
+        assert sent_texts == [["Bonjour, comment allez-vous aujourd'hui mon ami ?", "123"], []], "Expectation mismatch."
+        assert first_series.tolist() == second_series.tolist() == ["en", "fr", "en", None], "Expectation mismatch."
+        assert language_detection_cache_info().size == 3, "The detections of the workers should be cached."
+        with pytest.raises(LangDetectException):
+            language_detection("123")
+
+    def test_language_detection_batch_invalid_input(self):
+
+        assert language_detection_batch("a text") is None, "Expectation mismatch."
+        with pytest.raises(ValueError):
+            language_detection_batch(pd.Series(["a text"]), n_workers=0)
+
+    @pytest.mark.parametrize(
+        "input_text, ex_output",
+        [
+            (None, None),
+            ("", None),
+            ("123 😀 !!", None),
+            ("Hello, how are you doing today my friend?", None),
+            ("Привет, как у тебя сегодня дела?", None),  # Cyrillic is written in several languages
+            ("今天天气很好", None),  # Han alone is Chinese or Japanese
+            ("Καλημέρα, τι κάνεις σήμερα φίλε μου;", "el"),
+            ("Καλημέρα φίλε μου @bob", "el"),  # the Latin letters are less than half of the Greek ones
+            ("Καλημέρα @someone_with_a_long_name", None),
+            ("こんにちは、今日は元気ですか", "ja"),
+            ("ｺﾝﾆﾁﾊ", "ja"),
+            ("안녕하세요 오늘 날씨가 좋네요 韓國", "ko"),
+            ("สวัสดีครับ วันนี้อากาศดี", "th"),
+            ("שלום, מה שלומך היום?", "he"),
+            ("Καλημέρα สวัสดีครับ", None),
+            # The emojis and the other characters above the Basic Multilingual Plane are not letters
+            ("Καλημέρα σε όλους 😂", "el"),
+            ("안녕하세요 친구 🎉🎉", "ko"),
+            ("สวัสดีครับ 👍", "th"),
+            ("Καλημέρα 𝄞 🇬🇷", "el"),
+            ("😂👍🎉", None),
+            ("こんにちは 𠮷野家 😀", "ja"),  # an ideograph of a CJK extension is Han
+            ("שלום 𝐇𝐞𝐥𝐥𝐨", None),  # mathematical letters are another script
+        ],
+    )
+    def test_script_language_detection(self, input_text: Optional[str], ex_output: Optional[str]):
+
+        assert script_language_detection(input_text) == ex_output, "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "detector",
+        [
+            ("langdetect"),
+            ("ngram"),
+        ],
+    )
+    def test_script_routed_language_detection_batch(self, detector: str):
+
+        texts = ["Καλημέρα, τι κάνεις σήμερα φίλε μου;", None, "Hello, how are you doing today my friend?",
+                 "こんにちは、今日は元気ですか", "123", "Bonjour, comment allez-vous aujourd'hui mon ami ?"]
+        text_series = pd.Series(texts, index=[10, 8, 6, 4, 2, 0], name="text")
+
+        result_series, paths = script_routed_language_detection_batch(text_series, detector=detector)
+
+        assert result_series.tolist() == ["el", None, "en", "ja", None, "fr"], "Expectation mismatch."
+        assert result_series.index.tolist() == text_series.index.tolist(), "Expectation mismatch."
+        assert paths.tolist() == ["script", None, detector, "script", detector, detector], "Expectation mismatch."
+
+    def test_script_routed_language_detection_batch_invalid_input(self):
+
+        assert script_routed_language_detection_batch("a text") == (None, None), "Expectation mismatch."
+        with pytest.raises(ValueError):
+            script_routed_language_detection_batch(pd.Series(["a text"]), detector="spacy")
+
+    @pytest.mark.benchmark(group="script_routed_language_detection")
+    @pytest.mark.parametrize(
+        "implementation",
+        [
+            ("langdetect"),
+            ("script_routed"),
+        ],
+    )
+    def test_perf_script_routed_language_detection(self, benchmark, implementation: str):
+
+        # A multilingual feed: the tweets of Twitter_Detected_Languages, mostly French and English, and as many
+        # distinct tweets in Greek, Japanese, Korean and Thai
+        latin_texts = dbs.Detected_tweet_languages(n_samples=500).get_text_list()
+        script_texts = [f"{text} {index}" for index in range(125) for text in
+                        ["Καλημέρα, τι κάνεις σήμερα;", "今日は元気ですか", "오늘 날씨가 좋네요", "วันนี้อากาศดี"]]
+        text_series = pd.Series(latin_texts + script_texts)
+
+        def detect():
+            # The cache of language_detection would make every round after the first one free
+            clear_language_detection_cache()
+            if implementation == "langdetect":
+                return language_detection_batch(text_series)
+            return script_routed_language_detection_batch(text_series)[0]
+
+        result_series = benchmark.pedantic(detect, rounds=1, iterations=1)
+
+        assert result_series.iloc[len(latin_texts):].tolist() == ["el", "ja", "ko", "th"] * 125, "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "n_samples",
+        [
+            (1000),
+            (2000),
+        ],
+    )
+    def test_perf_language_detection_batch(self, n_samples: int):
+
+        text_series = pd.Series(dbs.Synthetic_tweet_emotion_en(n_samples=n_samples).get_text_list())
+
+        result_series = language_detection_batch(text_series)
+
+        assert result_series.notna().sum() > 0, "Expectation mismatch."
+
+
+class TestSpacy:
+    def test_spacy_pipeline_cache(self):
+
+        nlp = resources.get_spacy_pipeline("blank:en")
+
+        assert resources.get_spacy_pipeline("blank:en") is nlp, "A pipeline should be loaded once."
+        assert resources.get_spacy_pipeline("blank:en", ["tagger", "tok2vec"]) is \
+            resources.get_spacy_pipeline("blank:en", ("tok2vec", "tagger", "tagger")), "The order of the components should not matter."
+        assert resources.get_spacy_pipeline("blank:en", []) is not nlp, "Other components should be another pipeline."
+
+    @pytest.mark.parametrize(
+        "pref_lang, pref_pipeline_size, components",
+        [
+            (None, "small", None),
+            ("Klingon", "small", None),
+            ("English", "tiny", None),
+            ("English", "small", "tagger"),
+            ("English", "small", [1, 2]),
+        ],
+    )
+    def test_pipeline_selector_spacy_invalid_input(self, pref_lang: Optional[str], pref_pipeline_size: str, components):
+
+        assert pipeline_selector_spacy(pref_lang, pref_pipeline_size, components) is None, "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "batch_size, n_process",
+        [
+            (1, 1),
+            (2, 1),
+            (1000, 1),
+            (2, 2),
+        ],
+    )
+    def test_pipe_spacy(self, batch_size: int, n_process: int):
+
+        texts = [None, "Hello my name is Amin", 7, np.nan, "", "Bonjour", "How are you?", None]
+
+        # A generator, so the texts are only read as the Docs are consumed
+        docs = list(pipe_spacy((text for text in texts), resources.get_spacy_pipeline("blank:en"), batch_size=batch_size,
+                               n_process=n_process))
+
+        assert [doc if doc is None else doc.text for doc in docs] == [text if isinstance(text, str) else None for text in texts], \
+            "Expectation mismatch."
+        assert [token.text for token in docs[1]] == ["Hello", "my", "name", "is", "Amin"], "Expectation mismatch."
+
+    @pytest.mark.parametrize(
+        "batch_size, n_process",
+        [
+            (0, 1),
+            (100, 0),
+            (1.5, 1),
+        ],
+    )
+    def test_pipe_spacy_invalid_arguments(self, batch_size, n_process):
+
+        with pytest.raises(ValueError):
+            pipe_spacy(["a text"], resources.get_spacy_pipeline("blank:en"), batch_size=batch_size, n_process=n_process)
+
+
+class TestAutocorrect:
+    @pytest.mark.parametrize(
+        "input_text, ex_output_text",
+        [
+            (None, None),
+            ("", ""),
+            ("helo wrold", "held world"),
+            ("Speling 123, ok?", "Spelling 123, ok?"),
+        ],
+    )
+    def test_autocorrect_sentence(self, input_text: Optional[str], ex_output_text: Optional[str]):
+
+        result_text = Spell_checker_v1("en")(input_text)
+
+        assert isinstance(result_text, (str, type(None))), "The output text is not string."
+        assert result_text == ex_output_text, "Expectation mismatch."
+
+    def test_speller_pool(self):
+
+        assert Spell_checker_v1("en").speller is Spell_checker_v1("english").speller, "The Speller should be shared."
+        assert Spell_checker_v1("en", speed=True).speller is not Spell_checker_v1("en").speller, "Expectation mismatch."
+        assert Spell_checker_v1("en", speed=True).speller.nlp_data is Spell_checker_v1("en").speller.nlp_data, \
+            "The word frequency list should be shared."
+
+    def test_autocorrect_series(self):
+
+        checker = Spell_checker_v1("en")
+        text_series = pd.Series(["helo wrold", None, "helo", "Speling", "helo wrold", 7], index=[5, 4, 3, 2, 1, 0], name="text")
+
+        result_series = checker.autocorrect_series(text_series)
+        mixed_result_series = checker.autocorrect_series(text_series, langs=["en", "en", "german", "english", None, "en"])
+
+        assert result_series.tolist() == [checker(text) for text in text_series.values], "Expectation mismatch."
+        assert result_series.index.tolist() == text_series.index.tolist(), "Expectation mismatch."
+        # A text of an unsupported or missing language is kept as it is
+        assert mixed_result_series.tolist() == ["held world", None, "helo", "Spelling", "helo wrold", None], "Expectation mismatch."
+        assert checker.autocorrect_series(["helo"]) is None, "Expectation mismatch."
+
+        with pytest.raises(ValueError):
+            checker.autocorrect_series(text_series, langs=["en"])
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize(
+        "n_samples",
+        [
+            (1000),
+            (2000),
+        ],
+    )
+    def test_perf_autocorrect_series(self, n_samples: int):
+
+        # Like spell_correction_v1, a double typo search takes up to a second for a long word (about 0.2s per
+        # unique tweet), so this throughput test is slow
+        data = dbs.Synthetic_tweet_emotion_en(n_samples=n_samples)
+
+        result_series = Spell_checker_v1("en").autocorrect_series(pd.Series(data.get_text_list()))
+
+    @pytest.mark.benchmark(group="autocorrect_series_repeated_texts")
+    @pytest.mark.parametrize(
+        "n_samples",
+        [
+            (1000),
+            (2000),
+        ],
+    )
+    def test_perf_autocorrect_series_repeated_texts(self, benchmark, n_samples: int):
+
+        # A few tweets seen many times: each unique word of the series is only corrected once
+        text_series = pd.Series(dbs.Synthetic_tweet_emotion_en(n_samples=n_samples // 200).get_text_list() * 200)
+
+        result_series = benchmark.pedantic(Spell_checker_v1("en").autocorrect_series, args=(text_series,), rounds=1, iterations=1)
+
+        assert result_series.iloc[:len(text_series) // 200].tolist() * 200 == result_series.tolist(), "Expectation mismatch."
@@ -0,0 +1,88 @@
+"""Module providing tests for the token vocabulary and the token-id corpus."""
+# ───────────────────────────────── Imports ────────────────────────────────── #
+# Standard library
+import sys
+import numpy as np
+import pandas as pd
+
+# 3rd Party
+import pytest
+
+# Private
+import test_unit.nlp_utils.test_preprocessing._synthetic_dbs as dbs
+from nlp_utils.preprocessing.text_preprocessing import remove_common_words
+from nlp_utils.preprocessing.text_preprocessing import remove_rare_words
+from nlp_utils.preprocessing.text_preprocessing import remove_stopwords
+from nlp_utils.preprocessing.token_corpus import UNKNOWN_ID
+from nlp_utils.preprocessing.token_corpus import TokenCorpus
+from nlp_utils.preprocessing.token_corpus import Vocabulary
+
+# ───────────────────────────────── Tests ────────────────────────────────── #
+
+STOPWORDS = frozenset({"i", "a", "the", "and", "to", "my", "is"})
+
+
+class TestVocabulary:
+    def test_encode_decode(self):
+
+        vocabulary = Vocabulary(["the"])
+
+        ids = vocabulary.encode(["the", "cat", "the", "dog"])
+
+        assert ids.dtype == np.int32 and ids.tolist() == [0, 1, 0, 2], "Expectation mismatch."
+        assert vocabulary.decode(ids) == ["the", "cat", "the", "dog"], "Expectation mismatch."
+        assert vocabulary.encode(["cat", "bird"], add=False).tolist() == [1, UNKNOWN_ID], "Expectation mismatch."
+        assert len(vocabulary) == 3 and "bird" not in vocabulary and vocabulary["dog"] == 2, "Expectation mismatch."
+
+    def test_lookup_table(self):
+
+        vocabulary = Vocabulary(["the", "cat", "a"])
+
+        assert vocabulary.lookup_table({"a", "the", "bird"}).tolist() == [True, False, True], "Expectation mismatch."
+
+
+class TestTokenCorpus:
+    def test_from_texts(self):
+
+        corpus = TokenCorpus.from_texts(["the cat", None, "", "  the   dog "])
+
+        assert corpus.ids.tolist() == [0, 1, 0, 2] and corpus.offsets.tolist() == [0, 2, 2, 2, 4], "Expectation mismatch."
+        assert corpus.lengths().tolist() == [2, 0, 0, 2] and corpus.text_ids(3).tolist() == [0, 2], "Expectation mismatch."
+        assert corpus.decode() == ["the cat", None, "", "the dog"], "Expectation mismatch."
+        assert corpus.counts().tolist() == [2, 1, 1], "Expectation mismatch."
+
+    def test_shared_vocabulary(self):
+
+        first = TokenCorpus.from_texts(["the cat"])
+        second = TokenCorpus.from_texts(["the dog"], vocabulary=first.vocabulary)
+
+        assert second.ids.tolist() == [0, 2] and second.decode() == ["the dog"], "Expectation mismatch."
+        assert first.decode() == ["the cat"], "Expectation mismatch."
+
+    def test_operations_match_text_preprocessing(self):
+
+        texts = dbs.Synthetic_tweet_emotion_en(n_samples=500).get_text_list() + [None, 7, ""]
+        text_series = pd.Series(texts)
+        corpus = TokenCorpus.from_texts(texts)
+
+        assert corpus.remove_tokens(STOPWORDS).decode() == [remove_stopwords(text, STOPWORDS) for text in texts], "Expectation mismatch."
+        assert corpus.remove_common_tokens(20).decode() == remove_common_words(text_series, 20).tolist(), "Expectation mismatch."
+        assert corpus.remove_rare_tokens(300).decode() == remove_rare_words(text_series, 300).tolist(), "Expectation mismatch."
+        assert corpus.decode() == [" ".join(text.split()) if isinstance(text, str) else None for text in texts], "The operations should not change the corpus."
+
+    @pytest.mark.parametrize(
+        "n_samples",
+        [
+            (1000),
+            (2000),
+        ],
+    )
+    def test_perf_memory(self, n_samples: int):
+
+        texts = dbs.Synthetic_tweet_emotion_en(n_samples=n_samples).get_text_list()
+        token_lists = [text.split() for text in texts]
+        list_bytes = sys.getsizeof(token_lists) + sum(sys.getsizeof(tokens) + sum(map(sys.getsizeof, tokens)) for tokens in token_lists)
+
+        corpus = TokenCorpus.from_texts(texts)
+
+        assert corpus.nbytes * 10 < list_bytes, f"The corpus takes {corpus.nbytes} bytes, the token lists {list_bytes}."